@@ -1,8 +1,8 @@
 import bpy
+import os
 from compas_blender.geometry import BlenderMesh
 from compas_blender.utilities import create_layer
 from compas_blender.utilities import clear_layer
-from compas_blender.utilities import draw_cylinder
 from compas_blender.utilities import draw_plane
 from compas_blender.utilities import draw_line
 from compas_blender.utilities import get_meshes
@@ -23,11 +23,13 @@ from compas.geometry import subtract_vectors
 from compas_fea.structure import Structure
 
 from compas_fea.utilities import colorbar
+from compas_fea.utilities import colormap
 from compas_fea.utilities import extrude_mesh
 from compas_fea.utilities import discretise_faces
-from compas_fea.utilities import postprocess
+from compas_fea.utilities import plot_geometry
+from compas_fea.utilities import plot_inputs
 from compas_fea.utilities import tets_from_vertices_faces
-from compas_fea.utilities import plotvoxels
+from compas_fea.utilities import write_voxels
 
 from numpy import array
 from numpy import hstack
@@ -284,7 +286,7 @@ def add_nset_from_meshes(structure, layer):
     structure.add_set(name=layer, type='node', selection=nodes)
 
 
-def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, thermal=False):
+def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, thermal=False, cache=None):
     """
     Adds tetrahedron elements from a mesh to the Structure object.
 
@@ -302,6 +304,8 @@ def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, ther
         Maximum volume for tets.
     thermal : bool
         Thermal properties on or off.
+    cache : bool, str, obj
+        True, a folder or a MeshCache to reuse the tets of identical input.
 
     Returns
     -------
@@ -315,7 +319,7 @@ def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, ther
 
     try:
 
-        tets_points, tets_elements = tets_from_vertices_faces(vertices=vertices, faces=faces, volume=volume)
+        tets_points, tets_elements = tets_from_vertices_faces(vertices=vertices, faces=faces, volume=volume, cache=cache)
 
         for point in tets_points:
             structure.add_node(point)
@@ -346,7 +350,7 @@ def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, ther
         print('***** Error using MeshPy (TetGen) or drawing Tets *****')
 
 
-def discretise_mesh(structure, mesh, layer, target, min_angle=15, factor=1):
+def discretise_mesh(structure, mesh, layer, target, min_angle=15, factor=1, workers=1, cache=None):
     """
     Discretise a mesh from an input triangulated coarse mesh into small denser meshes.
 
@@ -364,6 +368,10 @@ def discretise_mesh(structure, mesh, layer, target, min_angle=15, factor=1):
         Minimum internal angle of triangles.
     factor : float
         Factor on the maximum area of each triangle.
+    workers : int
+        Number of processes triangulating faces in parallel.
+    cache : bool, str, obj
+        True, a folder or a MeshCache to reuse the triangles of identical input.
 
     Returns
     -------
@@ -378,7 +386,7 @@ def discretise_mesh(structure, mesh, layer, target, min_angle=15, factor=1):
     try:
 
         points, tris = discretise_faces(vertices=vertices, faces=faces, target=target, min_angle=min_angle,
-                                        factor=factor)
+                                        factor=factor, workers=workers, cache=cache)
 
         for pts, tri in zip(points, tris):
             bmesh = draw_mesh(name='face', vertices=pts, faces=tri, layer=layer)
@@ -489,7 +497,7 @@ def plot_concentrated_forces(structure, step, layer=None, scale=1.0):
 
 
 def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, cbar=[None, None], iptype='mean',
-              nodal='mean', mode='', cbar_size=1):
+              nodal='mean', mode='', cbar_size=1, cmap='default'):
     """
     Plots analysis results on the deformed shape of the Structure.
 
@@ -517,6 +525,8 @@ def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, c
         Mode or frequency number to plot, for modal, harmonic or buckling analysis.
     cbar_size : float
         Scale on the size of the colorbar.
+    cmap : str
+        Colormap of the plot, see utilities.colormaps.
 
     Returns
     -------
@@ -546,89 +556,20 @@ def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, c
     except Exception:
         create_layer(layer)
 
-    # Node and element data
+    # Plot geometry
 
-    nodes = structure.nodes_xyz()
-    elements = [structure.elements[i].nodes for i in sorted(structure.elements, key=int)]
-    nodal_data = structure.results[step]['nodal']
-    nkeys = sorted(structure.nodes, key=int)
+    inputs = plot_inputs(structure, step, field, mode)
+    result = plot_geometry(scale=scale, cbar=cbar, ctype=1, iptype=iptype, nodal=nodal, radius=radius, sides=8,
+                           incidence=structure.element_incidence(), cmap=cmap, **inputs)
 
-    ux = [nodal_data['ux{0}'.format(mode)][i] for i in nkeys]
-    uy = [nodal_data['uy{0}'.format(mode)][i] for i in nkeys]
-    uz = [nodal_data['uz{0}'.format(mode)][i] for i in nkeys]
+    fabs, eabs = result['fabs'], result['eabs']
+    print('\n***** Data processed : {0} s *****'.format(result['toc']))
 
-    try:
-        data = [nodal_data['{0}{1}'.format(field, mode)][i] for i in nkeys]
-        dtype = 'nodal'
-
-    except(Exception):
-        data = structure.results[step]['element'][field]
-        dtype = 'element'
-
-    # Postprocess
-
-    result = postprocess(nodes, elements, ux, uy, uz, data, dtype, scale, cbar, 1, iptype, nodal)
-
-    try:
-        toc, U, cnodes, fabs, fscaled, celements, eabs = result
-        U = array(U)
-        print('\n***** Data processed : {0} s *****'.format(toc))
-
-    except Exception:
-        print('\n***** Error encountered during data processing or plotting *****')
-
-    # Plot meshes
-
-    npts = 8
-    mesh_faces = []
-    block_faces = [[0, 1, 2, 3], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
-    tet_faces = [[0, 2, 1], [1, 2, 3], [1, 3, 0], [0, 3, 2]]
-    pipes = []
-    mesh_add = []
-
-    for element, nodes in enumerate(elements):
-
-        n = len(nodes)
-
-        if n == 2:
-
-            u, v = nodes
-            pipe = draw_cylinder(start=U[u], end=U[v], radius=radius, div=npts, layer=layer)
-            pipes.append(pipe)
-
-            if dtype == 'element':
-                col1 = col2 = celements[element]
-
-            elif dtype == 'nodal':
-                col1 = cnodes[u]
-                col2 = cnodes[v]
-
-            try:
-                blendermesh = BlenderMesh(object=pipe)
-                blendermesh.set_vertices_colors({i: col1 for i in range(0, 2 * npts, 2)})
-                blendermesh.set_vertices_colors({i: col2 for i in range(1, 2 * npts, 2)})
-            except Exception:
-                pass
-
-        elif n in [3, 4]:
-
-            if structure.elements[element].__name__ in ['ShellElement', 'MembraneElement']:
-                mesh_faces.append(nodes)
-            else:
-                for face in tet_faces:
-                    mesh_faces.append([nodes[i] for i in face])
-
-        elif n == 8:
-
-            for block in block_faces:
-                mesh_faces.append([nodes[i] for i in block])
-
-    if mesh_faces:
-
-        bmesh = draw_mesh(name='bmesh', vertices=U, faces=mesh_faces, layer=layer)
-        blendermesh = BlenderMesh(bmesh)
-        blendermesh.set_vertices_colors({i: col for i, col in enumerate(cnodes)})
-        mesh_add = [bmesh]
+    faces = [face[:3] if face[2] == face[3] else face for face in result['faces'].tolist()]
+    bmesh = draw_mesh(name='bmesh', vertices=result['vertices'].tolist(), faces=faces, layer=layer)
+    blendermesh = BlenderMesh(bmesh)
+    blendermesh.set_vertices_colors({i: col for i, col in enumerate(result['colors'].tolist())})
+    mesh_add = [bmesh]
 
     # Plot colourbar
 
@@ -645,11 +586,11 @@ def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, c
 
     y = array(list(vertices))[:, 1]
     yn = yran * cbar_size
-    colors = colorbar(((y - ymin - 0.5 * yn) * 2 / yn)[:, newaxis], input='array', type=1)
+    colors = colormap((y - ymin - 0.5 * yn) * 2 / yn, cmap=cmap, type=1).tolist()
     blendermesh.set_vertices_colors({i: j for i, j in zip(range(len(vertices)), colors)})
 
     set_deselect()
-    set_select(objects=pipes + mesh_add + [cmesh])
+    set_select(objects=mesh_add + [cmesh])
     bpy.context.view_layer.objects.active = cmesh
     bpy.ops.object.join()
 
@@ -720,9 +661,10 @@ def plot_reaction_forces(structure, step, layer=None, scale=1.0):
         set_object_property(object=line, property='rfm', value=rfm[i])
 
 
-def plot_voxels(structure, step, field='smises', cbar=[None, None], iptype='mean', nodal='mean', vdx=None, mode=''):
+def plot_voxels(structure, step, field='smises', cbar=[None, None], iptype='mean', nodal='mean', vdx=None, mode='',
+                method='idw', workers=1):
     """
-    Voxel 4D visualisation.
+    Voxel 4D visualisation, written as a .vti volume for rendering in ParaView.
 
     Parameters
     ----------
@@ -742,50 +684,33 @@ def plot_voxels(structure, step, field='smises', cbar=[None, None], iptype='mean
         Voxel spacing.
     mode : int
         mode or frequency number to plot, in case of modal, harmonic or buckling analysis.
+    method : str
+        'nearest', 'idw' or 'elements' resampling, see utilities.voxelise.
+    workers : int
+        Number of voxel chunks processed in parallel.
 
     Returns
     -------
-    None
+    str
+        Path of the .vti file.
 
     """
 
-    # Node and element data
+    inputs = plot_inputs(structure, step, field, mode)
+    del inputs['etypes']
 
-    xyz = structure.nodes_xyz()
-    elements = [structure.elements[i].nodes for i in sorted(structure.elements, key=int)]
-    nodal_data = structure.results[step]['nodal']
-    nkeys = sorted(structure.nodes, key=int)
-
-    ux = [nodal_data['ux{0}'.format(mode)][i] for i in nkeys]
-    uy = [nodal_data['uy{0}'.format(mode)][i] for i in nkeys]
-    uz = [nodal_data['uz{0}'.format(mode)][i] for i in nkeys]
+    filename = os.path.join(structure.path, '{0}-{1}-{2}{3}.vti'.format(structure.name, step, field, mode))
 
     try:
-        data = [nodal_data[field + str(mode)][key] for key in nkeys]
-        dtype = 'nodal'
-
-    except(Exception):
-        data = structure.results[step]['element'][field]
-        dtype = 'element'
-
-    # Postprocess
-
-    result = postprocess(xyz, elements, ux, uy, uz, data, dtype, 1, cbar, 1, iptype, nodal)
-
-    try:
-        toc, U, cnodes, fabs, fscaled, celements, eabs = result
-        U = array(U)
-        print('\n***** Data processed : {0:.3f} s *****'.format(toc))
-
-    except Exception:
-        print('\n***** Error post-processing *****')
-
-    try:
-        plotvoxels(values=fscaled, U=U, vdx=vdx)
+        shape = write_voxels(filename, vdx=vdx, field=field, cbar=cbar, iptype=iptype, nodal=nodal, method=method,
+                             workers=workers, **inputs)
+        print('\n***** Voxels {0} saved to: {1} *****'.format(shape, filename))
 
     except Exception:
         print('\n***** Error plotting voxels *****')
 
+    return filename
+
 
 def weld_meshes_from_layer(layer_input, layer_output):
     """
@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import os
 
 import compas
 if compas.RHINO:
@@ -22,14 +23,19 @@ from compas_fea.structure import Structure
 from compas_fea.utilities import colorbar
 from compas_fea.utilities import extrude_mesh
 from compas_fea.utilities import network_order
+from compas_fea.utilities import plot_inputs
 
 if not compas.IPY:
     from compas_fea.utilities import meshing
     from compas_fea.utilities import functions
+    from compas_fea.utilities import plotting
+    from compas_fea.utilities import voxels
 else:
     from compas.rpc import Proxy
     functions = Proxy('compas_fea.utilities.functions')
     meshing = Proxy('compas_fea.utilities.meshing')
+    plotting = Proxy('compas_fea.utilities.plotting')
+    voxels = Proxy('compas_fea.utilities.voxels')
 
 if compas.RHINO:
     import rhinoscriptsyntax as rs
@@ -344,7 +350,7 @@ def add_sets_from_layers(structure, layers):
                 print('***** Layer {0} contained a mixture of points and elements, set not created *****'.format(name))
 
 
-def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, thermal=False):
+def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, thermal=False, cache=None):
     """
     Adds tetrahedron elements from a mesh in Rhino to the Structure object.
 
@@ -362,6 +368,8 @@ def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, ther
         Maximum volume for each tet.
     thermal : bool
         Thermal properties on or off.
+    cache : bool, str, obj
+        True, a folder or a MeshCache to reuse the tets of identical input.
 
     Returns
     -------
@@ -374,7 +382,7 @@ def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, ther
     faces = [face[:3] for face in rhinomesh.faces]
 
     try:
-        tets_points, tets_elements = meshing.tets_from_vertices_faces(vertices=vertices, faces=faces, volume=volume)
+        tets_points, tets_elements = meshing.tets_from_vertices_faces(vertices=vertices, faces=faces, volume=volume, cache=cache)
 
         for point in tets_points:
             structure.add_node(point)
@@ -411,7 +419,7 @@ def add_tets_from_mesh(structure, name, mesh, draw_tets=False, volume=None, ther
         print('***** Error using MeshPy (TetGen) or drawing Tets *****')
 
 
-def discretise_mesh(mesh, layer, target, min_angle=15, factor=1):
+def discretise_mesh(mesh, layer, target, min_angle=15, factor=1, workers=1, cache=None):
     """
     Discretise a mesh from an input triangulated coarse mesh into small denser meshes.
 
@@ -427,6 +435,10 @@ def discretise_mesh(mesh, layer, target, min_angle=15, factor=1):
         Minimum internal angle of triangles.
     factor : float
         Factor on the maximum area of each triangle.
+    workers : int
+        Number of processes triangulating faces in parallel.
+    cache : bool, str, obj
+        True, a folder or a MeshCache to reuse the triangles of identical input.
 
     Returns
     -------
@@ -440,8 +452,8 @@ def discretise_mesh(mesh, layer, target, min_angle=15, factor=1):
 
     try:
 
-        points, tris = meshing.discretise_faces(vertices=vertices, faces=faces,
-                                                target=target, min_angle=min_angle, factor=factor)
+        points, tris = meshing.discretise_faces(vertices=vertices, faces=faces, target=target, min_angle=min_angle,
+                                                factor=factor, workers=workers, cache=cache)
 
         rs.CurrentLayer(rs.AddLayer(layer))
         rs.DeleteObjects(rs.ObjectsByLayer(layer))
@@ -846,7 +858,7 @@ def plot_axes(xyz, e11, e22, e33, layer, sc=1):
 
 
 def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, cbar=[None, None], iptype='mean',
-              nodal='mean', mode='', cbar_size=1):
+              nodal='mean', mode='', cbar_size=1, cmap='default'):
     """
     Plots analysis results on the deformed shape of the Structure.
 
@@ -874,6 +886,8 @@ def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, c
         Mode or frequency number to plot, for modal, harmonic or buckling analysis.
     cbar_size : float
         Scale on the size of the colorbar.
+    cmap : str
+        Colormap of the plot, see utilities.colormaps.
 
     Returns
     -------
@@ -902,91 +916,20 @@ def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, c
     rs.DeleteObjects(rs.ObjectsByLayer(layer))
     rs.EnableRedraw(False)
 
-    # Node and element data
+    # Plot geometry
 
-    nodes = structure.nodes_xyz()
-    elements = [structure.elements[i].nodes for i in sorted(structure.elements, key=int)]
-    nodal_data = structure.results[step]['nodal']
-    nkeys = sorted(structure.nodes, key=int)
-
-    ux = [nodal_data['ux{0}'.format(mode)][i] for i in nkeys]
-    uy = [nodal_data['uy{0}'.format(mode)][i] for i in nkeys]
-    uz = [nodal_data['uz{0}'.format(mode)][i] for i in nkeys]
+    inputs = plot_inputs(structure, step, field, mode)
+    result = plotting.plot_geometry(scale=scale, cbar=cbar, ctype=255, iptype=iptype, nodal=nodal, radius=radius,
+                                    cmap=cmap, **inputs)
 
     try:
-        data = [nodal_data['{0}{1}'.format(field, mode)][i] for i in nkeys]
-        dtype = 'nodal'
-
-    except(Exception):
-        data = structure.results[step]['element'][field]
-        dtype = 'element'
-
-    # Postprocess
-
-    result = functions.postprocess(nodes, elements, ux, uy, uz, data, dtype, scale, cbar, 255, iptype, nodal)
-
-    try:
-        toc, U, cnodes, fabs, fscaled, celements, eabs = result
-        print('\n***** Data processed : {0} s *****'.format(toc))
-
-        # Plot meshes
-
-        mesh_faces = []
-        line_faces = [[0, 4, 5, 1], [1, 5, 6, 2], [2, 6, 7, 3], [3, 7, 4, 0]]
-        block_faces = [[0, 1, 2, 3], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
-        tet_faces = [[0, 2, 1, 1], [1, 2, 3, 3], [1, 3, 0, 0], [0, 3, 2, 2]]
-
-        for element, nodes in enumerate(elements):
-
-            n = len(nodes)
-
-            if n == 2:
-
-                u, v = nodes
-                sp, ep = U[u], U[v]
-                plane = rs.PlaneFromNormal(sp, subtract_vectors(ep, sp))
-                xa = plane.XAxis
-                ya = plane.YAxis
-                r = radius
-                xa_pr = scale_vector(xa, +r)
-                xa_mr = scale_vector(xa, -r)
-                ya_pr = scale_vector(ya, +r)
-                ya_mr = scale_vector(ya, -r)
-                pts = [add_vectors(sp, xa_pr), add_vectors(sp, ya_pr),
-                       add_vectors(sp, xa_mr), add_vectors(sp, ya_mr),
-                       add_vectors(ep, xa_pr), add_vectors(ep, ya_pr),
-                       add_vectors(ep, xa_mr), add_vectors(ep, ya_mr)]
-                guid = rs.AddMesh(pts, line_faces)
-
-                if dtype == 'element':
-                    col1 = col2 = celements[element]
-
-                elif dtype == 'nodal':
-                    col1 = cnodes[u]
-                    col2 = cnodes[v]
-
-                rs.MeshVertexColors(guid, [col1] * 4 + [col2] * 4)
-
-            elif n == 3:
-
-                mesh_faces.append(nodes + [nodes[-1]])
+        fabs, eabs = result['fabs'], result['eabs']
+        print('\n***** Data processed : {0} s *****'.format(result['toc']))
 
-            elif n == 4:
+        # Plot mesh
 
-                if structure.elements[element].__name__ in ['ShellElement', 'MembraneElement']:
-                    mesh_faces.append(nodes)
-                else:
-                    for face in tet_faces:
-                        mesh_faces.append([nodes[i] for i in face])
-
-            elif n == 8:
-
-                for block in block_faces:
-                    mesh_faces.append([nodes[i] for i in block])
-
-        if mesh_faces:
-            guid = rs.AddMesh(U, mesh_faces)
-            rs.MeshVertexColors(guid, cnodes)
+        guid = rs.AddMesh(result['vertices'], result['faces'])
+        rs.MeshVertexColors(guid, result['colors'])
 
         # Plot colorbar
 
@@ -1004,7 +947,7 @@ def plot_data(structure, step, field='um', layer=None, scale=1.0, radius=0.05, c
 
         y = [i[1] for i in verts]
         yn = yran * cbar_size
-        colors = [colorbar(2 * (yi - ymin - 0.5 * yn) / yn, input='float', type=255) for yi in y]
+        colors = functions.colormap([2 * (yi - ymin - 0.5 * yn) / yn for yi in y], cmap=cmap, type=255)
         rs.MeshVertexColors(id, colors)
 
         h = 0.4 * s
@@ -1074,7 +1017,7 @@ def plot_principal_stresses(structure, step, sp, stype, scale, layer=None):
     spr, e = functions.principal_stresses(data)
 
     stresses = spr[sp][stype]
-    max_stress = max([abs(i) for i in stresses])
+    max_stress = max([abs(i) for i in stresses if i == i] or [1.])  # NaN rows for elements without data
     vectors = list(zip([e[sp][stype][0][i]*stresses[i]/scale for i in range(len(stresses))],
                        [e[sp][stype][1][i]*stresses[i]/scale for i in range(len(stresses))]))
 
@@ -1087,6 +1030,8 @@ def plot_principal_stresses(structure, step, sp, stype, scale, layer=None):
     centroids = [structure.element_centroid(i) for i in sorted(structure.elements, key=int)]
 
     for c, centroid in enumerate(centroids):
+        if stresses[c] != stresses[c]:
+            continue
         f2 = Frame(centroid, axes[c][0], axes[c][1])
         T = Transformation.from_frame(f2)
         v_plus = Vector(vectors[c][0]*0.5, vectors[c][1]*0.5, 0.).transformed(T)
@@ -1097,9 +1042,10 @@ def plot_principal_stresses(structure, step, sp, stype, scale, layer=None):
     rs.EnableRedraw(True)
 
 
-def plot_voxels(structure, step, field='smises', cbar=[None, None], iptype='mean', nodal='mean', vdx=None, mode=''):
+def plot_voxels(structure, step, field='smises', cbar=[None, None], iptype='mean', nodal='mean', vdx=None, mode='',
+                method='idw', workers=1):
     """
-    Voxel 4D visualisation.
+    Voxel 4D visualisation, written as a .vti volume for rendering in ParaView.
 
     Parameters
     ----------
@@ -1119,50 +1065,33 @@ def plot_voxels(structure, step, field='smises', cbar=[None, None], iptype='mean
         Voxel spacing.
     mode : int
         mode or frequency number to plot, in case of modal, harmonic or buckling analysis.
+    method : str
+        'nearest', 'idw' or 'elements' resampling, see utilities.voxelise.
+    workers : int
+        Number of voxel chunks processed in parallel.
 
     Returns
     -------
-    None
+    str
+        Path of the .vti file.
 
     """
 
-    # Node and element data
+    inputs = plot_inputs(structure, step, field, mode)
+    del inputs['etypes']
 
-    xyz = structure.nodes_xyz()
-    elements = [structure.elements[i].nodes for i in sorted(structure.elements, key=int)]
-    nodal_data = structure.results[step]['nodal']
-    nkeys = sorted(structure.nodes, key=int)
-
-    ux = [nodal_data['ux{0}'.format(mode)][i] for i in nkeys]
-    uy = [nodal_data['uy{0}'.format(mode)][i] for i in nkeys]
-    uz = [nodal_data['uz{0}'.format(mode)][i] for i in nkeys]
+    filename = os.path.join(structure.path, '{0}-{1}-{2}{3}.vti'.format(structure.name, step, field, mode))
 
     try:
-        data = [nodal_data[field + str(mode)][key] for key in nkeys]
-        dtype = 'nodal'
-
-    except(Exception):
-        data = structure.results[step]['element'][field]
-        dtype = 'element'
-
-    # Postprocess
-
-    result = functions.postprocess(xyz, elements, ux, uy, uz, data, dtype, 1, cbar, 255, iptype, nodal)
-
-    try:
-        toc, U, cnodes, fabs, fscaled, celements, eabs = result
-        print('\n***** Data processed : {0} s *****'.format(toc))
-
-    except Exception:
-        print('\n***** Error post-processing *****')
-
-    try:
-        functions.plotvoxels(values=fscaled, U=U, vdx=vdx)
-        print('\n***** Voxels finished *****')
+        shape = voxels.write_voxels(filename, vdx=vdx, field=field, cbar=cbar, iptype=iptype, nodal=nodal, method=method,
+                                    workers=workers, **inputs)
+        print('\n***** Voxels {0} saved to: {1} *****'.format(shape, filename))
 
     except Exception:
         print('\n***** Error plotting voxels *****')
 
+    return filename
+
 
 def weld_meshes_from_layer(layer_input, layer_output):
     """
@@ -65,6 +65,20 @@ opensees
     extract_data
     launch_process
 
+
+Export
+======
+
+.. currentmodule:: compas_fea.fea.vtu
+
+.. autosummary::
+    :toctree: generated/
+
+    structure_to_vtu
+    write_vtu
+    write_vti
+    write_pvd
+
 """
 from __future__ import absolute_import
 
@@ -3,7 +3,10 @@ from __future__ import division
 from __future__ import print_function
 
 from compas_fea.fea import Writer
+from compas_fea.fea.frames import FrameWriter
+from compas_fea.fea.workers import map_workers
 
+from compas_fea.fea.abaq import fil_read
 from compas_fea.fea.abaq import launch_job
 from compas_fea.fea.abaq import odb_extract
 
@@ -12,9 +15,13 @@ from subprocess import PIPE
 
 from time import time
 
+import compas
 import json
 import os
 
+if not compas.IPY:
+    import numpy as np
+
 
 # Author(s): Andrew Liew (github.com/andrewliew)
 
@@ -30,7 +37,7 @@ node_fields = ['rf', 'rm', 'u', 'ur', 'cf', 'cm']
 element_fields = ['sf', 'sm', 'sk', 'se', 's', 'e', 'pe', 'rbfor', 'ctf']
 
 
-def input_generate(structure, fields, output):
+def input_generate(structure, fields, output, fil=False):
     """ Creates the Abaqus .inp file from the Structure object.
 
     Parameters
@@ -41,6 +48,8 @@ def input_generate(structure, fields, output):
         Data field requests.
     output : bool
         Print terminal output.
+    fil : bool
+        Also request ASCII .fil results file output, readable without Abaqus CAE.
 
     Returns
     -------
@@ -56,7 +65,7 @@ def input_generate(structure, fields, output):
     if 'u' not in fields:
         fields.append('u')
 
-    with Writer(structure=structure, software='abaqus', filename=filename, fields=fields) as writer:
+    with Writer(structure=structure, software='abaqus', filename=filename, fields=fields, fil=fil) as writer:
 
         writer.write_heading()
         writer.write_nodes()
@@ -156,7 +165,7 @@ def launch_process(structure, exe, cpus, output):
         print('***** Analysis failed *****')
 
 
-def extract_data(structure, fields, exe, output, return_data, components):
+def extract_data(structure, fields, exe, output, return_data, components, frames=False, workers=1, fil=False):
     """ Extract data from the Abaqus .odb file.
 
     Parameters
@@ -173,6 +182,12 @@ def extract_data(structure, fields, exe, output, return_data, components):
         Return data back into structure.results.
     components : list
         Specific components to extract from the fields data.
+    frames : bool
+        Also write every frame to a chunked on-disk store for structure.iter_frames (requires NumPy).
+    workers : int
+        Number of steps to extract concurrently, each in its own Abaqus process (bounded by available licences).
+    fil : bool
+        Read the final increments from the ASCII .fil file instead, without starting Abaqus CAE.
 
     Returns
     -------
@@ -189,38 +204,39 @@ def extract_data(structure, fields, exe, output, return_data, components):
     if isinstance(fields, str):
         fields = [fields]
 
-    fields = ','.join(fields)
-    components = ','.join(components) if components else 'None'
+    if fil:
 
-    tic1 = time()
+        tic = time()
 
-    subprocess = 'noGUI={0}'.format(odb_extract.__file__.replace('\\', '/'))
+        fil_fields = set(fields) | ({'sf'} if 'sm' in fields else set())
+        if 'spf' in fil_fields or 'ctf' in fil_fields:
+            print('***** Spring forces are not available from the .fil file *****')
 
-    if not exe:
+        results = fil_read.read_fil('{0}{1}.fil'.format(temp, name), structure, fields=fil_fields, components=components)
 
-        args = ['abaqus', 'cae', subprocess, '--', components, fields, name, temp]
-        p = Popen(args, stdout=PIPE, stderr=PIPE, cwd=temp, shell=True)
-
-        while True:
+        if return_data:
+            structure.results = results
 
-            line = p.stdout.readline()
-            if not line:
-                break
-            line = str(line.strip())
+        if output:
+            print('\n***** Data extracted from Abaqus .fil file : {0:.3f} s *****\n'.format(time() - tic))
 
-            if output:
-                print(line)
+        return
 
-        stdout, stderr = p.communicate()
+    fields = ','.join(fields)
+    components = ','.join(components) if components else 'None'
+    mode = 'frames' if frames else 'last'
 
-        if output:
-            print(stdout)
-            print(stderr)
+    tic1 = time()
 
+    if workers > 1 and len(structure.steps_order) > 2:
+        tags = structure.steps_order[1:]
     else:
+        tags = ['all']
 
-        os.chdir(temp)
-        os.system('{0}{1} -- {2} {3} {4} {5}'.format(exe, subprocess, components, fields, name, temp))
+    def extract(steps):
+        _launch_extract(exe=exe, output=output, args=[steps, mode, components, fields, name, temp], temp=temp)
+
+    map_workers(extract, tags, workers)
 
     toc1 = time() - tic1
 
@@ -235,11 +251,18 @@ def extract_data(structure, fields, exe, output, return_data, components):
 
             tic2 = time()
 
-            with open('{0}{1}-results.json'.format(temp, name), 'r') as f:
-                results = json.load(f)
+            results = {}
+            info = {}
+
+            for tag in tags:
+
+                tag = '' if tag == 'all' else '-' + tag
+
+                with open('{0}{1}{2}-results.json'.format(temp, name, tag), 'r') as f:
+                    results.update(json.load(f))
 
-            with open('{0}{1}-info.json'.format(temp, name), 'r') as f:
-                info = json.load(f)
+                with open('{0}{1}{2}-info.json'.format(temp, name, tag), 'r') as f:
+                    info.update(json.load(f))
 
             for step in results:
 
@@ -270,3 +293,123 @@ def extract_data(structure, fields, exe, output, return_data, components):
 
             if output:
                 print('***** Saving data to structure.results unsuccessful *****')
+
+    # Save frames to disk
+
+    if frames:
+
+        for step in structure.steps_order:
+
+            filename = '{0}{1}-{2}-frames.jsonl'.format(temp, name, step)
+
+            if os.path.exists(filename):
+
+                _write_frames(structure, temp, step, filename)
+                os.remove(filename)
+
+                if output:
+                    print('***** {0} frames written to disk *****'.format(step))
+
+
+def _launch_extract(exe, output, args, temp):
+    """ Runs odb_extract in an Abaqus CAE process.
+
+    Parameters
+    ----------
+    exe : str
+        Abaqus exe path to bypass defaults.
+    output : bool
+        Print terminal output.
+    args : list
+        Arguments passed to odb_extract: steps, mode, components, fields, name and temp.
+    temp : str
+        Folder containing the .odb file.
+
+    Returns
+    -------
+    None
+
+    """
+
+    subprocess = 'noGUI={0}'.format(odb_extract.__file__.replace('\\', '/'))
+
+    if not exe:
+
+        p = Popen(['abaqus', 'cae', subprocess, '--'] + args, stdout=PIPE, stderr=PIPE, cwd=temp, shell=True)
+
+        while True:
+
+            line = p.stdout.readline()
+            if not line:
+                break
+            line = str(line.strip())
+
+            if output:
+                print(line)
+
+        stdout, stderr = p.communicate()
+
+        if output:
+            print(stdout)
+            print(stderr)
+
+    else:
+
+        os.chdir(temp)
+        os.system('{0}{1} -- {2}'.format(exe, subprocess, ' '.join(args)))
+
+
+def _write_frames(structure, temp, step, filename):
+    """ Converts the per-frame JSON lines of a step into a chunked on-disk store.
+
+    Parameters
+    ----------
+    structure : obj
+        Structure object.
+    temp : str
+        Folder to write the store to.
+    step : str
+        Name of the step.
+    filename : str
+        Path of the {name}-{step}-frames.jsonl file written by odb_extract.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    - Element components are stored as (m x points) arrays, with the points labelled 'ip{i}_sp{j}'.
+
+    """
+
+    n = structure.node_count()
+    m = structure.element_count()
+    labels = {}
+
+    with FrameWriter(temp, step) as writer, open(filename, 'r') as f:
+
+        for line in f:
+
+            frame = json.loads(line)
+            nodal = {}
+            element = {}
+
+            for key, data in frame['nodal'].items():
+                nodal[key] = np.full(n, np.nan)
+                nodal[key][[int(i) for i in data]] = list(data.values())
+
+            for key, data in frame['element'].items():
+
+                if key not in labels:
+                    labels[key] = sorted({id for item in data.values() for id in item})
+                columns = {id: c for c, id in enumerate(labels[key])}
+
+                element[key] = np.full((m, len(columns)), np.nan)
+
+                for ekey, item in data.items():
+                    for id, value in item.items():
+                        if id in columns:
+                            element[key][int(ekey), columns[id]] = value
+
+            writer.append(frame['time'], nodal=nodal, element=element, labels=labels)
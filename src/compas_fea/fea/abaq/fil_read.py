@@ -0,0 +1,238 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from math import sqrt
+
+
+__all__ = [
+    'iter_fil_records',
+    'read_fil',
+]
+
+
+# Record keys of the Abaqus results (.fil) file
+
+ELEMENT_HEADER = 1
+INCREMENT_START = 2000
+INCREMENT_END = 2001
+
+node_records = {101: 'u', 104: 'rf', 106: 'cf'}
+element_records = {11: 's', 21: 'e', 89: 'e', 22: 'pe', 13: 'sf'}
+
+node_components = {
+    'u':  [('u', 'x'), ('u', 'y'), ('u', 'z'), ('ur', 'x'), ('ur', 'y'), ('ur', 'z')],
+    'rf': [('rf', 'x'), ('rf', 'y'), ('rf', 'z'), ('rm', 'x'), ('rm', 'y'), ('rm', 'z')],
+    'cf': [('cf', 'x'), ('cf', 'y'), ('cf', 'z'), ('cm', 'x'), ('cm', 'y'), ('cm', 'z')],
+}
+
+# Section forces then moments of beams (6) and shells (8, with the transverse shears sf4 and sf5)
+
+section_components = {
+    6: ['sf1', 'sf2', 'sf3', 'sm1', 'sm2', 'sm3'],
+    8: ['sf1', 'sf2', 'sf3', 'sf4', 'sf5', 'sm1', 'sm2', 'sm3'],
+}
+
+direct = ['xx', 'yy', 'zz']
+shear = {1: ['xy'], 3: ['xy', 'xz', 'yz']}
+
+item_widths = {'D': 22, 'E': 12, 'A': 8}
+
+
+def iter_fil_records(filename):
+    """ Streams the records of an ASCII Abaqus results (.fil) file.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .fil file.
+
+    Yields
+    ------
+    int
+        Record key.
+    list
+        Record attributes (int, float or str items).
+
+    Notes
+    -----
+    - Records are written as a stream of 80 character lines, each record starting with '*'.
+    - Items are 'I' + two digit width + integer, 'D' + 22 character double, 'E' + 12 character float or 'A' + 8 characters.
+
+    """
+
+    record = None
+    buffer = ''
+    pos = 0
+
+    with open(filename, 'r') as f:
+
+        for line in f:
+
+            buffer = buffer[pos:] + line.rstrip('\r\n').ljust(80)
+            pos = 0
+            n = len(buffer)
+
+            while True:
+
+                while pos < n and buffer[pos] == ' ':
+                    pos += 1
+
+                if pos == n:
+                    break
+
+                code = buffer[pos]
+
+                if code == '*':
+                    if record:
+                        yield record[1], record[2:]
+                    record = []
+                    pos += 1
+                    continue
+
+                if code == 'I':
+                    if pos + 3 > n:
+                        break
+                    width = int(buffer[pos + 1:pos + 3])
+                    if pos + 3 + width > n:
+                        break
+                    record.append(int(buffer[pos + 3:pos + 3 + width]))
+                    pos += 3 + width
+
+                elif code in item_widths:
+                    width = item_widths[code]
+                    if pos + 1 + width > n:
+                        break
+                    item = buffer[pos + 1:pos + 1 + width]
+                    record.append(item if code == 'A' else float(item.replace('D', 'E')))
+                    pos += 1 + width
+
+                else:
+                    raise ValueError('***** Unknown .fil item {0} *****'.format(code))
+
+    if record:
+        yield record[1], record[2:]
+
+
+def read_fil(filename, structure, fields=None, components=None):
+    """ Reads the final increment of each step from an ASCII Abaqus results (.fil) file.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .fil file.
+    structure : obj
+        Structure object, used to name the steps.
+    fields : list
+        Data field requests, None for all fields in the file.
+    components : list
+        Specific components to keep, None for all components.
+
+    Returns
+    -------
+    dict
+        Results in the structure.results format, keyed by step name.
+
+    Notes
+    -----
+    - Modal steps store each mode (increment) as ux{mode} ... um{mode}, with the frequencies list.
+    - Von Mises stress (smises) is computed from the stress components.
+
+    """
+
+    results = {}
+    increment = None
+    header = None
+    modal = False
+
+    for key, values in iter_fil_records(filename):
+
+        if key == INCREMENT_START:
+
+            step = structure.steps_order[values[5]]
+            modal = structure.steps[step].__name__ == 'ModalStep'
+            number = values[6]
+            results.setdefault(step, {'nodal': {}, 'element': {}})
+
+            if modal:
+                results[step].setdefault('frequencies', []).append(values[9])
+                increment = {'nodal': {}, 'element': {}, 'mode': number}
+            else:
+                increment = {'nodal': {}, 'element': {}}
+
+        elif key == INCREMENT_END and increment is not None:
+
+            if modal:
+                nodal = results[step]['nodal']
+                for component, data in increment['nodal'].items():
+                    nodal['{0}{1}'.format(component, increment['mode'])] = data
+            else:
+                results[step]['nodal'] = increment['nodal']
+                results[step]['element'] = increment['element']
+
+            increment = None
+
+        elif increment is None:
+
+            continue
+
+        elif key == ELEMENT_HEADER:
+
+            header = values
+
+        elif key in node_records:
+
+            field = node_records[key]
+            node = values[0] - 1
+            _add_node_values(increment['nodal'], field, node, values[1:], fields)
+
+        elif key in element_records and header:
+
+            field = element_records[key]
+            if fields is None or field in fields:
+                element = header[0] - 1
+                id = 'ip{0}_sp{1}'.format(header[1], header[2])
+                _add_element_values(increment['element'], field, element, id, values, header)
+
+    if components:
+        for step in results:
+            for dtype in ['nodal', 'element']:
+                data = results[step][dtype]
+                for component in list(data):
+                    if component not in components and component.rstrip('0123456789') not in components:
+                        del data[component]
+
+    return results
+
+
+def _add_node_values(nodal, field, node, values, fields):
+
+    names = node_components[field]
+
+    for (prefix, axis), value in zip(names, values):
+        if fields is None or prefix in fields:
+            nodal.setdefault(prefix + axis, {})[node] = value
+
+    for prefix in set(prefix for prefix, _ in names[:len(values)]):
+        if fields is None or prefix in fields:
+            xyz = [nodal[prefix + axis][node] for axis in 'xyz' if node in nodal.get(prefix + axis, {})]
+            nodal.setdefault(prefix + 'm', {})[node] = sqrt(sum(i**2 for i in xyz))
+
+
+def _add_element_values(element, field, ekey, id, values, header):
+
+    if field == 'sf':
+        names = section_components.get(len(values)) or ['sf{0}'.format(i + 1) for i in range(len(values))]
+
+    else:
+        ndi, nshr = header[5], header[6]
+        names = [field + i for i in direct[:ndi] + shear.get(nshr, [])]
+
+    for name, value in zip(names, values):
+        element.setdefault(name, {}).setdefault(ekey, {})[id] = value
+
+    if field == 's':
+        sxx, syy, szz = (list(values[:header[5]]) + [0, 0, 0])[:3]
+        sxy, sxz, syz = (list(values[header[5]:header[5] + header[6]]) + [0, 0, 0])[:3]
+        smises = sqrt(0.5 * ((sxx - syy)**2 + (syy - szz)**2 + (szz - sxx)**2) + 3 * (sxy**2 + sxz**2 + syz**2))
+        element.setdefault('smises', {}).setdefault(ekey, {})[id] = smises
@@ -45,7 +45,7 @@ node_fields = ['rf', 'rm', 'u', 'ur', 'cf', 'cm']
 element_fields = ['sf', 'sm', 'sk', 'se', 's', 'e', 'pe', 'ctf', 'rbfor']
 
 
-def extract_odb_data(temp, name, fields, components, steps='all'):
+def extract_odb_data(temp, name, fields, components, steps='all', frames=False):
     """ Extracts data from the .odb file for the requested steps and fields.
 
     Parameters
@@ -60,6 +60,9 @@ def extract_odb_data(temp, name, fields, components, steps='all'):
         Specific components to extract from the fields data.
     steps : list, str
         Step names to extract data for, or 'all' for all steps.
+        Results of a subset of steps are saved to {name}-{steps}-results.json.
+    frames : bool
+        Also write every frame of the non-modal steps to {name}-{step}-frames.jsonl.
 
     Returns
     -------
@@ -67,7 +70,7 @@ def extract_odb_data(temp, name, fields, components, steps='all'):
 
     """
 
-    odb = openOdb(path='{0}{1}.odb'.format(temp, name))
+    odb = openOdb(path='{0}{1}.odb'.format(temp, name), readOnly=True)
 
     if not components:
         components = set()
@@ -81,6 +84,9 @@ def extract_odb_data(temp, name, fields, components, steps='all'):
 
     if steps == 'all':
         steps = odb.steps.keys()
+        tag = ''
+    else:
+        tag = '-' + '-'.join(steps)
 
     for step in steps:
 
@@ -143,6 +149,9 @@ def extract_odb_data(temp, name, fields, components, steps='all'):
 
             info[step]['description'] = description
 
+            if frames:
+                extract_odb_frames(odb=odb, temp=temp, name=name, step=step, fields=fields, components=components)
+
             frame = odb.steps[step].frames[-1]
             fieldoutputs = frame.fieldOutputs
 
@@ -286,13 +295,102 @@ def extract_odb_data(temp, name, fields, components, steps='all'):
                     except Exception:
                         pass
 
-    with open('{0}{1}-results.json'.format(temp, name), 'w') as f:
+    with open('{0}{1}{2}-results.json'.format(temp, name, tag), 'w') as f:
         json.dump(results, f)
 
-    with open('{0}{1}-info.json'.format(temp, name), 'w') as f:
+    with open('{0}{1}{2}-info.json'.format(temp, name, tag), 'w') as f:
         json.dump(info, f)
 
 
+def extract_odb_frames(odb, temp, name, step, fields, components):
+    """ Writes the nodal and element data of every frame of a step as one JSON line per frame.
+
+    Parameters
+    ----------
+    odb : obj
+        The opened Abaqus .odb object.
+    temp : str
+        Folder path containing the analysis .odb file.
+    name : str
+        Name of the Structure object.
+    step : str
+        Name of the step.
+    fields : list
+        Data field requests.
+    components : set
+        Components to extract from the fields data.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    - Only one frame is held in memory at a time.
+
+    """
+
+    with open('{0}{1}-{2}-frames.jsonl'.format(temp, name, step), 'w') as f:
+
+        for frame in odb.steps[step].frames:
+
+            fieldoutputs = frame.fieldOutputs
+            keys = fieldoutputs.keys()
+            data = {'time': frame.frameValue, 'nodal': {}, 'element': {}}
+
+            for field in node_fields:
+
+                if field in fields and field.upper() in keys:
+
+                    clabels = list(fieldoutputs[field.upper()].componentLabels)
+
+                    for value in fieldoutputs[field.upper()].values:
+
+                        values = value.data
+                        if isinstance(values, float):
+                            values = [values]
+                        node = value.nodeLabel - 1
+
+                        for i, c in enumerate(clabels):
+                            if convert[c] in components:
+                                data['nodal'].setdefault(convert[c], {})[node] = float(values[i])
+
+                        if field + 'm' in components:
+                            data['nodal'].setdefault(field + 'm', {})[node] = float(value.magnitude)
+
+            for field in element_fields:
+
+                if field in fields and field != 'rbfor':
+
+                    field = 'le' if field == 'e' else field
+
+                    if field.upper() not in keys:
+                        continue
+
+                    clabels = list(fieldoutputs[field.upper()].componentLabels)
+
+                    for value in fieldoutputs[field.upper()].values:
+
+                        values = value.data
+                        if isinstance(values, float):
+                            values = [values]
+                        element = value.elementLabel - 1
+                        sp = value.sectionPoint.number if value.sectionPoint else 0
+                        id = 'ip{0}_sp{1}'.format(value.integrationPoint, sp)
+
+                        for i, c in enumerate(clabels):
+                            if convert[c] in components:
+                                data['element'].setdefault(convert[c], {}).setdefault(element, {})[id] = float(values[i])
+
+                        if field == 's' and 'smises' in components:
+                            try:
+                                data['element'].setdefault('smises', {}).setdefault(element, {})[id] = float(value.mises)
+                            except Exception:
+                                pass
+
+            f.write(json.dumps(data) + '\n')
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -303,5 +401,7 @@ if __name__ == "__main__":
     name = sys.argv[-2]
     fields = sys.argv[-3].split(',')
     components = None if sys.argv[-4] == 'None' else sys.argv[-4].split(',')
+    frames = sys.argv[-5] == 'frames'
+    steps = 'all' if sys.argv[-6] == 'all' else sys.argv[-6].split(',')
 
-    extract_odb_data(temp=temp, name=name, fields=fields, components=components)
+    extract_odb_data(temp=temp, name=name, fields=fields, components=components, steps=steps, frames=frames)
@@ -2,6 +2,8 @@ import os
 import shutil
 import subprocess
 
+from compas_fea.fea.workers import map_workers
+
 from compas_fea.fea.ansys.writing import write_static_analysis_request
 from compas_fea.fea.ansys.writing import write_modal_analysis_request
 from compas_fea.fea.ansys.writing import write_harmonic_analysis_request
@@ -158,7 +160,7 @@ def ansys_launch_process(path, name, cpus=2, license='teaching', delete=True):
     subprocess.call(launch_string)
 
 
-def ansys_launch_process_extract(path, name, cpus=2, license='teaching'):
+def ansys_launch_process_extract(path, name, cpus=2, license='teaching', suffix=''):
     """ Calls an extraction of results from Ansys.
 
     Parameters:
@@ -166,14 +168,15 @@ def ansys_launch_process_extract(path, name, cpus=2, license='teaching'):
         name (str): Name of the structure.
         cpus (int): Number of CPU cores to use.
         license (str): Type of Ansys license.
+        suffix (str): Suffix of the extract file and job name, for concurrent extractions.
 
     Returns:
         None
     """
     ansys_path = 'MAPDL.exe'
-    inp_path = os.path.join(path, name + '_extract.txt')
+    inp_path = os.path.join(path, name + '_extract' + suffix + '.txt')
     work_dir = os.path.join(path, name + '_output')
-    out_path = os.path.join(work_dir, 'output_extract.out')
+    out_path = os.path.join(work_dir, 'output_extract' + suffix + '.out')
 
     if license == 'research':
         lic_str = 'aa_r'
@@ -186,7 +189,7 @@ def ansys_launch_process_extract(path, name, cpus=2, license='teaching'):
 
     launch_string = '\"' + ansys_path + '\" -p ' + lic_str + ' -np ' + str(cpus)
     launch_string += ' -dir \"' + work_dir
-    launch_string += '\" -j \"' + name + '\" -s read -l en-us -b -i \"'
+    launch_string += '\" -j \"' + name + suffix + '\" -s read -l en-us -b -i \"'
     launch_string += inp_path + ' \" -o \"' + out_path + '\"'
     subprocess.call(launch_string)
 
@@ -205,28 +208,30 @@ def delete_result_files(path, name):
     shutil.rmtree(out_path)
 
 
-def extract_rst_data(structure, fields='all', steps='all', sets=None, license='teaching'):
+def extract_rst_data(structure, fields='all', steps='all', sets=None, license='teaching', workers=1):
     """ Extracts results from Ansys rst file.
 
     Parameters:
         structure (obj): Structure object.
         fields (list, str): Data field requests.
         steps (list): Loads steps to extract from.
+        workers (int): Number of steps to extract concurrently (bounded by available licences).
 
     Returns:
         None
     """
-    write_results_from_rst(structure, fields, steps, sets=sets, license=license)
+    write_results_from_rst(structure, fields, steps, sets=sets, license=license, workers=workers)
     load_to_results(structure, fields, steps)
 
 
-def write_results_from_rst(structure, fields, steps, license='teaching', sets=None):
+def write_results_from_rst(structure, fields, steps, license='teaching', sets=None, workers=1):
     """ Writes results request file from Ansys.
 
     Parameters:
         structure (obj): Structure object.
         fields (list, str): Data field requests.
         steps (list): Loads steps to extract from.
+        workers (int): Number of steps to extract concurrently, each in its own Ansys job.
 
     Returns:
         None
@@ -239,35 +244,68 @@ def write_results_from_rst(structure, fields, steps, license='teaching', sets=No
         steps = [structure.steps_order[-1]]
     elif steps == 'all':
         steps = structure.steps_order
+    elif isinstance(steps, str):
+        steps = [steps]
+
+    if workers > 1 and len(steps) > 1:
+        suffixes = []
+        for i, skey in enumerate(steps):
+            suffix = '_' + str(i)
+            ansys_open_post_process(path, filename, rst=name)
+            _write_step_results(structure, fields, skey, filename, sets)
+            shutil.move(os.path.join(path, filename), os.path.join(path, name + '_extract' + suffix + '.txt'))
+            suffixes.append(suffix)
+
+        map_workers(lambda suffix: ansys_launch_process_extract(path, name, license=license, suffix=suffix), suffixes, workers)
+        return
 
     ansys_open_post_process(path, filename)
 
     for skey in steps:
-        step_index = structure.steps_order.index(skey)
-        stype = structure.steps[skey].type
-        if stype == 'static':
-            set_current_step(path, filename, step_index=step_index)
-            write_static_results_from_ansys_rst(structure, fields, step_index=step_index)
-        elif stype == 'modal':
-            num_modes = structure.steps[skey].modes
-            write_modal_results_from_ansys_rst(name, path, fields, num_modes,
-                                               step_index=step_index, step_name=skey)
-        elif stype == 'harmonic':
-            freq_list = structure.steps[skey].freq_list
-            if sets:
-                nodes = []
-                [nodes.extend(structure.sets[s]['selection']) for s in sets]
-            else:
-                nodes = None
-            write_harmonic_results_from_ansys_rst(name, path, fields, freq_list,
-                                                  step_index=step_index, step_name='step', sets=nodes)
-        elif stype == 'acoustic':
-            pass
+        _write_step_results(structure, fields, skey, filename, sets)
 
     ansys_launch_process_extract(path, name, license=license)
     # os.remove(path + '/' + filename)
 
 
+def _write_step_results(structure, fields, skey, filename, sets=None):
+    """ Appends the results requests of one step to the extract file.
+
+    Parameters:
+        structure (obj): Structure object.
+        fields (list, str): Data field requests.
+        skey (str): Step to extract from.
+        filename (str): Name of the extract file.
+        sets (list): Node sets to extract harmonic results for.
+
+    Returns:
+        None
+    """
+    name = structure.name
+    path = structure.path
+
+    step_index = structure.steps_order.index(skey)
+    stype = structure.steps[skey].type
+    if stype == 'static':
+        set_current_step(path, filename, step_index=step_index)
+        write_static_results_from_ansys_rst(structure, fields, step_index=step_index)
+    elif stype == 'modal':
+        num_modes = structure.steps[skey].modes
+        write_modal_results_from_ansys_rst(name, path, fields, num_modes,
+                                           step_index=step_index, step_name=skey)
+    elif stype == 'harmonic':
+        freq_list = structure.steps[skey].freq_list
+        if sets:
+            nodes = []
+            [nodes.extend(structure.sets[s]['selection']) for s in sets]
+        else:
+            nodes = None
+        write_harmonic_results_from_ansys_rst(name, path, fields, freq_list,
+                                              step_index=step_index, step_name='step', sets=nodes)
+    elif stype == 'acoustic':
+        pass
+
+
 def load_to_results(structure, fields, steps):
     """ Loads results from Ansys txt files to Structure object.
 
@@ -14,6 +14,9 @@ from compas_fea.fea.ansys.reading import get_nodes_elements_from_result_files
 
 from compas_fea.fea.ansys import ansys_launch_process
 
+from compas_fea.utilities.meshcache import mesh_cache
+from compas_fea.utilities.meshcache import mesh_cache_key
+
 
 # Author(s): Tomas Mendez Echenagucia (github.com/tmsmendez)
 
@@ -69,7 +72,11 @@ def volmesh_from_ansys_results(output_path, name):
     return mesh
 
 
-def ansys_remesh_2d(mesh, output_path, name, size=None):
+def ansys_remesh_2d(mesh, output_path, name, size=None, cache=None):
+    key, cached = _cached_remesh('ansys_remesh_2d', mesh, cache, size=size)
+    if cached:
+        return Mesh.from_vertices_and_faces(*cached)
+
     s = Structure(output_path, name=name)
 
     s.add_nodes_elements_from_mesh(mesh, 'ShellElement')
@@ -80,10 +87,18 @@ def ansys_remesh_2d(mesh, output_path, name, size=None):
     ansys_launch_process(output_path, name, cpus=4, license='teaching', delete=True)
 
     mesh = mesh_from_ansys_results(output_path, name)
+    if key:
+        vkeys = list(mesh.vertices())
+        index = {k: i for i, k in enumerate(vkeys)}
+        mesh_cache(cache).set(key, [[mesh.vertex_coordinates(k) for k in vkeys],
+                                    [[index[k] for k in mesh.face_vertices(f)] for f in mesh.faces()]])
     return mesh
 
 
-def ansys_remesh_3d(mesh, output_path, name, size=None, hex=False, div=None):
+def ansys_remesh_3d(mesh, output_path, name, size=None, hex=False, div=None, cache=None):
+    key, cached = _cached_remesh('ansys_remesh_3d', mesh, cache, size=size, hex=hex, div=div)
+    if cached:
+        return VolMesh.from_vertices_and_cells(*cached)
 
     s = Structure(output_path, name=name)
 
@@ -94,4 +109,21 @@ def ansys_remesh_3d(mesh, output_path, name, size=None, hex=False, div=None):
     write_request_mesh_volume(s, output_path, name, size=size, hex=hex, div=div)
     ansys_launch_process(output_path, name, cpus=4, license='teaching', delete=True)
     mesh = volmesh_from_ansys_results(output_path, name)
+    if key:
+        vkeys = list(mesh.vertices())
+        index = {k: i for i, k in enumerate(vkeys)}
+        cells = [[[index[k] for k in mesh.halfface_vertices(f)] for f in mesh.cell_faces(c)] for c in mesh.cells()]
+        mesh_cache(cache).set(key, [[mesh.vertex_coordinates(k) for k in vkeys], cells])
     return mesh
+
+
+def _cached_remesh(function, mesh, cache, **parameters):
+    cache = mesh_cache(cache)
+    if not cache:
+        return None, None
+    vkeys = sorted(mesh.vertices(), key=int)
+    index = {k: i for i, k in enumerate(vkeys)}
+    vertices = [mesh.vertex_coordinates(k) for k in vkeys]
+    faces = [[index[k] for k in mesh.face_vertices(f)] for f in sorted(mesh.faces(), key=int)]
+    key = mesh_cache_key(function, vertices, faces, **parameters)
+    return key, cache.get(key)
@@ -11,11 +11,13 @@ def add_load_to_ploads(structure, pload, load, factor):
         nkeys = structure.sets[nodes].selection
     elif type(nodes) == list:
         nkeys = nodes
+    if load.__name__ == 'TributaryLoad':
+        forces = dict(zip(load.nodes, load.forces))
     for nkey in nkeys:
         if nkey not in pload.keys():
             pload[nkey] = {'x': 0, 'y': 0, 'z': 0, 'xx': 0, 'yy': 0, 'zz': 0}
         if load.__name__ == 'TributaryLoad':
-            components = load.components[nkey]
+            components = dict(zip('xyz', forces[nkey]))
         else:
             components = load.components
 
@@ -76,10 +78,10 @@ def write_combined_point_loads(pload, output_path, filename):
 
 def write_appply_tributary_load(structure, output_path, filename, lkey, factor):
     cFile = open(os.path.join(output_path, filename), 'a')
-    nkeys = structure.loads[lkey].components
+    load = structure.loads[lkey]
     axis_dict = {'x': 'X', 'y': 'Y', 'z': 'Z', 'xx': 'MX', 'yy': 'MY', 'zz': 'MZ'}
-    for nkey in nkeys:
-        components = structure.loads[lkey].components[nkey]
+    for nkey, force in zip(load.nodes, load.forces):
+        components = dict(zip('xyz', force))
         node = int(nkey) + 1
         for ckey in components:
             value = components[ckey]
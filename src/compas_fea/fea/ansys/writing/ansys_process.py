@@ -15,12 +15,14 @@ def ansys_open_pre_process(path, filename):
     cFile.close()
 
 
-def ansys_open_post_process(path, filename):
+def ansys_open_post_process(path, filename, rst=None):
     cFile = open(os.path.join(path, filename), 'w')
     cFile.write('! Ansys post-process file written from compas_fea DUDE\n')
     cFile.write('!\n')
     cFile.write('!\n')
     cFile.write('/POST1 \n')
+    if rst:
+        cFile.write('FILE, ' + rst + ', rst \n')
     cFile.write('!\n')
     cFile.close()
 
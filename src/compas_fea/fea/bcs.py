@@ -52,8 +52,11 @@ class BCs(object):
 
                     entry = ['1' if components[dof] is not None else '0' for dof in dofs[:self.ndof]]
 
-                    for node in sorted(selection, key=int):
-                        self.write_line('fix {0} {1}'.format(node + 1, ' '.join(entry)))
+                    for part, nodes in self.split_nodes(selection):
+                        self.write_part(part)
+                        for node in nodes:
+                            self.write_line('fix {0} {1}'.format(node + 1, ' '.join(entry)))
+                    self.write_part(None)
 
                 # ----------------------------------------------------------------------------
                 # Abaqus
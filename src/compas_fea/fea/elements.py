@@ -77,7 +77,9 @@ class Elements(object):
                 E = material.E.get('E', None)
                 G = material.G.get('G', None)
 
-            for select in selection:
+            for part, select in [(part, i) for part, keys in self.split_elements(selection) for i in keys]:
+
+                self.write_part(part)
 
                 element = elements[select]
                 nodes = [str(i + 1) for i in element.nodes]
@@ -256,8 +258,10 @@ class Elements(object):
 
                             if kx:
 
+                                self.write_part(None)
                                 self.write_line('uniaxialMaterial Elastic 2{0:0>3} {1}'.format(s_index, kx))
                                 self.blank_line()
+                                self.write_part(part)
 
                             # else:
                             #     i = ' '.join([str(k) for k in section.forces['axial']])
@@ -323,7 +327,7 @@ class Elements(object):
 
                     if self.software == 'opensees':
 
-                        raise NotImplementedError
+                        pass  # lumped into the node masses
 
                     # -------------------------------------------------------------------------------------------------
                     # Abaqus
@@ -394,6 +398,7 @@ class Elements(object):
 
                 self.blank_line()
 
+            self.write_part(None)
             self.blank_line()
             self.blank_line()
 
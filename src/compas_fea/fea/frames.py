@@ -0,0 +1,207 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+import json
+import os
+
+
+__all__ = [
+    'FrameWriter',
+    'iter_frames',
+]
+
+
+chunk_bytes = 2**25
+
+
+class FrameWriter(object):
+    """ Writes the increments (frames) of a Step to a chunked on-disk store.
+
+    Parameters
+    ----------
+    temp : str
+        Folder to write the store to.
+    step : str
+        Name of the Step.
+    chunk : int
+        Number of frames per chunk file, None to size chunks to roughly 32 MB.
+
+    Notes
+    -----
+    - Each component is saved as (frames x ...) .npy chunks, described by {step}-frames.json.
+    - Every frame must contain the same components with the same shapes.
+
+    """
+
+    def __init__(self, temp, step, chunk=None):
+        self.temp = temp
+        self.step = step
+        self.chunk = chunk
+        self.chunks = 0
+        self.count = 0
+        self.fields = {}
+        self.times = []
+        self.buffer = {}
+        self.buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def append(self, time, nodal=None, element=None, labels=None):
+        """ Adds a frame to the store.
+
+        Parameters
+        ----------
+        time : float
+            Time (frame value) of the increment.
+        nodal : dict
+            Component name : (n,) array of nodal values.
+        element : dict
+            Component name : (m x points) array of element values.
+        labels : dict
+            Component name : labels of the element points (columns).
+
+        Returns
+        -------
+        None
+
+        """
+
+        for dtype, data in [('nodal', nodal or {}), ('element', element or {})]:
+
+            for key, values in data.items():
+
+                values = np.asarray(values, dtype=np.float64)
+
+                if key not in self.fields:
+                    self.fields[key] = {'type': dtype, 'shape': list(values.shape)}
+                    if labels and key in labels:
+                        self.fields[key]['labels'] = labels[key]
+
+                self.buffer.setdefault(key, []).append(values)
+
+        self.times.append(float(time))
+        self.count += 1
+        self.buffered += 1
+
+        if self.chunk is None:
+            nbytes = sum(values[-1].nbytes for values in self.buffer.values())
+            self.chunk = max(1, int(chunk_bytes // max(nbytes, 1)))
+
+        if self.buffered >= self.chunk:
+            self.flush()
+
+    def flush(self):
+        """ Writes the buffered frames to the next chunk files.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        """
+
+        for key, values in self.buffer.items():
+            np.save(_chunk_filename(self.temp, self.step, key, self.chunks), np.stack(values))
+
+        self.buffer = {}
+        self.buffered = 0
+        self.chunks += 1
+
+    def close(self):
+        """ Flushes the remaining frames and writes the store index.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        """
+
+        if self.buffered:
+            self.flush()
+
+        index = {
+            'step': self.step,
+            'frames': self.count,
+            'chunk': self.chunk,
+            'chunks': self.chunks,
+            'time': self.times,
+            'fields': self.fields,
+        }
+
+        with open(_index_filename(self.temp, self.step), 'w') as f:
+            json.dump(index, f)
+
+
+def iter_frames(temp, step, fields=None):
+    """ Iterates lazily over the frames of a Step in a chunked on-disk store.
+
+    Parameters
+    ----------
+    temp : str
+        Folder containing the store.
+    step : str
+        Name of the Step.
+    fields : list, str
+        Component names to load, e.g. ['ux', 'sf1'], or None for all stored components.
+
+    Yields
+    ------
+    float
+        Time (frame value) of the increment.
+    dict
+        Component name : array of nodal (n,) or element (m x points) values.
+
+    Notes
+    -----
+    - Only one chunk per component is memory-mapped at a time.
+
+    """
+
+    with open(_index_filename(temp, step), 'r') as f:
+        index = json.load(f)
+
+    if fields is None:
+        keys = sorted(index['fields'])
+    else:
+        if isinstance(fields, str):
+            fields = [fields]
+        keys = [key for key in fields if key in index['fields']]
+
+    times = index['time']
+    count = 0
+
+    for chunk in range(index['chunks']):
+
+        arrays = {key: np.load(_chunk_filename(temp, step, key, chunk), mmap_mode='r') for key in keys}
+        size = min(index['chunk'], index['frames'] - count)
+
+        for i in range(size):
+            yield times[count], {key: np.array(array[i]) for key, array in arrays.items()}
+            count += 1
+
+        del arrays
+
+
+def _index_filename(temp, step):
+    return os.path.join(temp, '{0}-frames.json'.format(step))
+
+
+def _chunk_filename(temp, step, key, chunk):
+    return os.path.join(temp, '{0}-frames_{1}_{2:05d}.npy'.format(step, key, chunk))
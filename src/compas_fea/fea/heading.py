@@ -27,4 +27,14 @@ class Heading(object):
         self.blank_line()
         self.write_line(header[self.software])
         self.blank_line()
+
+        if self.software == 'opensees' and self.parts:
+            self.write_line('set pid [getPID]')
+            self.write_line('set np [getNP]')
+            self.write_line('if {{$np != {0}}} {{'.format(len(self.parts['nodes'])))
+            self.write_line('    puts "***** Run with {0} OpenSeesMP processes *****"'.format(len(self.parts['nodes'])))
+            self.write_line('    exit')
+            self.write_line('}')
+            self.blank_line()
+
         self.blank_line()
@@ -33,15 +33,25 @@ class Nodes(object):
         self.write_section('Nodes')
         self.write_line(header[self.software])
 
-        for key in sorted(self.structure.nodes, key=int):
+        for part, nodes in self.split_nodes(self.structure.nodes):
 
-            self.write_node(key)
+            self.write_part(part)
+
+            for key in nodes:
+
+                self.write_node(key)
+
+        self.write_part(None)
 
         if self.software == 'opensees':
             self.blank_line()
-            for key in sorted(self.structure.nodes, key=int):
-                if self.structure.nodes[key].mass:
-                    self.write_mass(key)
+            masses = self.structure.mass_properties(kinds=['line', 'point'])['nodes']
+            for part, nodes in self.split_nodes(self.structure.nodes, owned=True):
+                self.write_part(part)
+                for key in nodes:
+                    if masses[key]:
+                        self.write_mass(key, masses[key])
+            self.write_part(None)
 
         self.blank_line()
         self.blank_line()
@@ -55,8 +65,8 @@ class Nodes(object):
         line = '{0}{1}{2}{3:.3f}{2}{4:.3f}{2}{5:.3f}'.format(prefix, key + 1, spacer, x, y, z)
         self.write_line(line)
 
-    def write_mass(self, key):
+    def write_mass(self, key, mass):
 
         mr = '' if self.ndof == 3 else '0 0 0'
-        line = 'mass {0} {1} {1} {1} {2}'.format(key + 1, self.structure.nodes[key].mass, mr)
+        line = 'mass {0} {1} {1} {1} {2}'.format(key + 1, mass, mr)
         self.write_line(line)
@@ -3,6 +3,8 @@ from __future__ import division
 from __future__ import print_function
 
 from compas_fea.fea import Writer
+from compas_fea.fea.frames import FrameWriter
+from compas_fea.fea.workers import map_workers
 
 from subprocess import Popen
 from subprocess import PIPE
@@ -11,8 +13,13 @@ from pprint import pprint
 from time import time
 from math import sqrt
 
+import compas
 import json
 import os
+import struct
+
+if not compas.IPY:
+    import numpy as np
 
 
 # Author(s): Andrew Liew (github.com/andrewliew)
@@ -25,7 +32,12 @@ __all__ = [
 ]
 
 
-def input_generate(structure, fields, output, ndof):
+# localForce columns per beam element: N_a Vy_a Vz_a T_a My_a Mz_a N_b Vy_b Vz_b T_b My_b Mz_b
+
+beam_columns = {'sf1': 0, 'sf2': 1, 'sf3': 2, 'sm1': 5, 'sm2': 4, 'sm3': 3}
+
+
+def input_generate(structure, fields, output, ndof, binary=False, parts=None, method='rcb'):
     """ Creates the OpenSees .tcl file from the Structure object.
 
     Parameters
@@ -38,16 +50,50 @@ def input_generate(structure, fields, output, ndof):
         Print terminal output.
     ndof : int
         Number of degrees-of-freedom in the model, 3 or 6.
+    binary : bool
+        Write binary recorders instead of text recorders.
+    parts : int
+        Number of OpenSeesMP processes to partition the model for, None for a sequential model.
+    method : str
+        Partitioning method 'rcb' or 'spectral', see Structure.partition.
 
     Returns
     -------
     None
 
+    Notes
+    -----
+    - A partitioned model is one .tcl file with a getPID guarded block of nodes, elements, boundary conditions,
+      loads and recorders for each process, solved with the Mumps parallel solver.
+    - Loads and masses on interface nodes are applied by the lowest partition only.
+    - Nodes without elements (reference, load or mass only nodes) are defined by the first partition.
+    - The partition sets used for writing are not kept in structure.sets.
+
     """
 
     filename = '{0}{1}.tcl'.format(structure.path, structure.name)
 
-    with Writer(structure=structure, software='opensees', filename=filename, fields=fields, ndof=ndof) as writer:
+    if parts:
+        sets = dict(structure.sets)
+        report = structure.partition(parts, method=method)
+        structure.sets = sets
+        owner = {}
+        for part, nodes in enumerate(report['nodes']):
+            for node in nodes:
+                owner.setdefault(node, part)
+        for node in sorted(structure.nodes, key=int):
+            if node not in owner:
+                owner[node] = 0
+                report['nodes'][0].append(node)
+        parts = {
+            'nodes':    report['nodes'],
+            'sets':     [set(nodes) for nodes in report['nodes']],
+            'owner':    owner,
+            'elements': {ekey: part for part, ekeys in enumerate(report['elements']) for ekey in ekeys},
+        }
+
+    with Writer(structure=structure, software='opensees', filename=filename, fields=fields, ndof=ndof,
+                binary=binary, parts=parts) as writer:
 
         writer.write_heading()
         writer.write_nodes()
@@ -59,7 +105,7 @@ def input_generate(structure, fields, output, ndof):
     print('***** OpenSees input file generated: {0} *****\n'.format(filename))
 
 
-def launch_process(structure, exe, output):
+def launch_process(structure, exe, output, mpiexec='mpiexec'):
     """ Runs the analysis through OpenSees.
 
     Parameters
@@ -67,9 +113,11 @@ def launch_process(structure, exe, output):
     structure : obj
         Structure object.
     exe : str
-        OpenSees exe path to bypass defaults.
+        OpenSees exe path to bypass defaults, OpenSeesMP for a partitioned model.
     output : bool
         Print terminal output.
+    mpiexec : str
+        MPI launcher of a partitioned model, run with the number of partitions from recorders.json.
 
     Returns
     -------
@@ -93,7 +141,16 @@ def launch_process(structure, exe, output):
         if not exe:
             exe = 'C:/OpenSees.exe'
 
+        try:
+            with open('{0}recorders.json'.format(temp), 'r') as f:
+                parts = json.load(f).get('parts')
+        except Exception:
+            parts = None
+
         command = '{0} {1}{2}.tcl'.format(exe, path, name)
+
+        if parts:
+            command = '{0} -n {1} {2}'.format(mpiexec, parts, command)
         p = Popen(command, stdout=PIPE, stderr=PIPE, cwd=temp, shell=True)
 
         print('Executing command ', command)
@@ -123,7 +180,7 @@ def launch_process(structure, exe, output):
         pprint('\n***** OpenSees analysis failed')
 
 
-def extract_data(structure, fields):
+def extract_data(structure, fields, history=False, frames=False, workers=1):
     """ Extract data from the OpenSees .out files.
 
     Parameters
@@ -132,11 +189,23 @@ def extract_data(structure, fields):
         Structure object.
     fields : list
         Requested fields output.
+    history : bool
+        Also load every recorded increment into structure.results[step]['history'] (requires NumPy).
+    frames : bool
+        Also stream every recorded increment to a chunked on-disk store for structure.iter_frames (requires NumPy).
+    workers : int
+        Number of steps to extract concurrently.
 
     Returns
     -------
     None
 
+    Notes
+    -----
+    - Only the final record of each .out file is read, unless history is requested.
+    - Text or binary recorders and their column layouts are read from the recorders.json manifest, output folders
+      without it (e.g. written by an older version) raise an IOError.
+
     """
 
     tic = time()
@@ -145,11 +214,68 @@ def extract_data(structure, fields):
     path = structure.path
     temp = '{0}{1}/'.format(path, name)
 
-    step = structure.steps_order[1]
-    results = structure.results[step] = {'nodal': {}, 'element': {}}
+    try:
+        with open('{0}recorders.json'.format(temp), 'r') as f:
+            manifest = json.load(f)
+
+    except (IOError, OSError):
+        raise IOError('***** No recorders.json in {0}, re-run write_input_file and the analysis to write the recorder '
+                      'manifest *****'.format(temp))
+
+    recorders = manifest['recorders']
+    groups = manifest['groups']
+    binary = manifest['format'] == 'binary'
+
+    steps = structure.steps_order[1:]
+
+    def extract(step):
+        return _extract_step(structure, step, fields, temp, recorders, groups, binary, history, frames)
+
+    for step, results in zip(steps, map_workers(extract, steps, workers)):
+        structure.results[step] = results
+
+    print('\n***** Data extracted from OpenSees .out file(s) : {0} s *****\n'.format(time() - tic))
+
+
+def _extract_step(structure, step, fields, temp, recorders, groups, binary, history=False, frames=False):
+    """ Extracts the data of one Step from its OpenSees .out files.
+
+    Parameters
+    ----------
+    structure : obj
+        Structure object.
+    step : str
+        Name of the Step.
+    fields : list
+        Requested fields output.
+    temp : str
+        Folder containing the .out files.
+    recorders : dict
+        Recorder entries of the recorders.json manifest.
+    groups : dict
+        Element keys of the truss, beam and spring recorders.
+    binary : bool
+        Whether the recorders are binary.
+    history : bool
+        Also load every recorded increment into results['history'].
+    frames : bool
+        Also stream every recorded increment to a chunked on-disk store.
+
+    Returns
+    -------
+    dict
+        Results of the Step.
+
+    """
+
+    results = {'nodal': {}, 'element': {}}
     nodal = results['nodal']
     element = results['element']
 
+    if history:
+        m = structure.element_count()
+        results['history'] = {'time': None, 'nodal': {}, 'element': {}}
+
     if structure.steps[step].__name__ != 'ModalStep':
 
         # Loads
@@ -160,24 +286,12 @@ def extract_data(structure, fields):
             nodal['cf{0}'.format(i)] = {i: 0 for i in nodes}
             nodal['cm{0}'.format(i)] = {i: 0 for i in nodes}
 
-        for k in structure.steps[structure.steps_order[1]].loads:
-
-            load = structure.loads[k]
+        vector = structure.step_load_vector(step)
 
-            if load.__name__ == 'PointLoad':
-                com = load.components
-
-                nn = load.nodes
-                if isinstance(nn, str):
-                    nn = [nn]
-
-                for node in nn:
-                    ns = structure.sets[node].selection if isinstance(node, str) else node
-
-                    for ni in ns:
-                        for i in 'xyz':
-                            nodal['cf{0}'.format(i)][ni] += com[i]
-                            nodal['cm{0}'.format(i)][ni] += com[i + i]
+        for node, force in zip(vector['nodes'], vector['forces']):
+            for c, i in enumerate('xyz'):
+                nodal['cf{0}'.format(i)][node] += force[c]
+                nodal['cm{0}'.format(i)][node] += force[c + 3]
 
         # Fields
 
@@ -191,19 +305,22 @@ def extract_data(structure, fields):
 
                 try:
 
-                    with open('{0}{1}.out'.format(temp, file), 'r') as f:
-                        lines = f.readlines()
-                    data = [float(i) for i in lines[-1].split(' ')[1:]]
+                    times, data = _read_recorder(temp, recorders[file], binary, history)
 
-                    dofx = data[0::3]
-                    dofy = data[1::3]
-                    dofz = data[2::3]
-                    dofm = [sqrt(u**2 + v**2 + w**2) for u, v, w in zip(dofx, dofy, dofz)]
+                    if history:
+                        records = data.reshape((len(times), -1, 3))
+                        results['history']['time'] = times
+                        for c, i in enumerate('xyz'):
+                            results['history']['nodal']['{0}{1}'.format(field, i)] = records[:, :, c]
+                        results['history']['nodal']['{0}m'.format(field)] = np.sqrt(np.sum(records**2, axis=2))
+                        data = records[-1].ravel()
 
-                    nodal['{0}x'.format(field)] = {i: dofx[i] for i in nodes}
-                    nodal['{0}y'.format(field)] = {i: dofy[i] for i in nodes}
-                    nodal['{0}z'.format(field)] = {i: dofz[i] for i in nodes}
-                    nodal['{0}m'.format(field)] = {i: dofm[i] for i in nodes}
+                    dofx, dofy, dofz, dofm = _nodal_columns(data)
+
+                    nodal['{0}x'.format(field)] = dict(zip(nodes, dofx))
+                    nodal['{0}y'.format(field)] = dict(zip(nodes, dofy))
+                    nodal['{0}z'.format(field)] = dict(zip(nodes, dofz))
+                    nodal['{0}m'.format(field)] = dict(zip(nodes, dofm))
 
                     print('***** {0}.out data loaded *****'.format(file))
 
@@ -219,17 +336,20 @@ def extract_data(structure, fields):
 
                 try:
 
-                    element['sf1'] = {}
+                    truss_ekeys = groups['truss']
+                    times, data = _read_recorder(temp, recorders[file + '_truss'], binary, history)
+
+                    if history:
+                        results['history']['time'] = times
+                        _element_history(results['history']['element'], 'sf1', m, truss_ekeys, data[:, :, None])
+                        data = data[-1]
 
-                    with open('{0}{1}_truss.out'.format(temp, file), 'r') as f:
-                        lines = f.readlines()
-                    data = [float(i) for i in lines[-1].split(' ')[1:]]
+                    sf1, = _element_columns(data, 1)
 
-                    with open('{0}truss_ekeys.json'.format(temp), 'r') as f:
-                        truss_ekeys = json.load(f)['truss_ekeys']
+                    element.setdefault('sf1', {})
 
-                    for ekey, sf1 in zip(truss_ekeys, data):
-                        element['sf1'][ekey] = {'ip': sf1}
+                    for ekey, value in zip(truss_ekeys, sf1):
+                        element['sf1'][ekey] = {'ip': value}
 
                     print('***** {0}.out data loaded *****'.format(file))
 
@@ -241,40 +361,23 @@ def extract_data(structure, fields):
 
                 try:
 
-                    with open('{0}{1}_beam.out'.format(temp, file), 'r') as f:
-                        lines = f.readlines()
-                    data = [float(i) for i in lines[-1].split(' ')[1:]]
-
-                    element['sf1'] = {}
-                    element['sf2'] = {}
-                    element['sf3'] = {}
-                    element['sm1'] = {}
-                    element['sm2'] = {}
-                    element['sm3'] = {}
-
-                    sf1_a = data[0::12]
-                    sf2_a = data[1::12]
-                    sf3_a = data[2::12]
-                    sm1_a = data[5::12]
-                    sm2_a = data[4::12]
-                    sm3_a = data[3::12]
-                    sf1_b = data[6::12]
-                    sf2_b = data[7::12]
-                    sf3_b = data[8::12]
-                    sm1_b = data[11::12]
-                    sm2_b = data[10::12]
-                    sm3_b = data[9::12]
-
-                    with open('{0}beam_ekeys.json'.format(temp), 'r') as f:
-                        beam_ekeys = json.load(f)['beam_ekeys']
-
-                    for c, ekey in enumerate(beam_ekeys):
-                        element['sf1'][ekey] = {'ip1': -sf1_a[c], 'ip2': sf1_b[c]}
-                        element['sf2'][ekey] = {'ip1': -sf2_a[c], 'ip2': sf2_b[c]}
-                        element['sf3'][ekey] = {'ip1': -sf3_a[c], 'ip2': sf3_b[c]}
-                        element['sm1'][ekey] = {'ip1': -sm1_a[c], 'ip2': sm1_b[c]}
-                        element['sm2'][ekey] = {'ip1': -sm2_a[c], 'ip2': sm2_b[c]}
-                        element['sm3'][ekey] = {'ip1': -sm3_a[c], 'ip2': sm3_b[c]}
+                    beam_ekeys = groups['beam']
+                    times, data = _read_recorder(temp, recorders[file + '_beam'], binary, history)
+
+                    if history:
+                        records = data.reshape((len(times), -1, 2, 6))
+                        results['history']['time'] = times
+                        for key, c in beam_columns.items():
+                            ends = records[:, :, :, c] * np.array([-1., 1.])
+                            _element_history(results['history']['element'], key, m, beam_ekeys, ends)
+                        data = records[-1].ravel()
+
+                    columns = _element_columns(data, 12)
+
+                    for key, c in beam_columns.items():
+                        element.setdefault(key, {})
+                        for ekey, a, b in zip(beam_ekeys, columns[c], columns[c + 6]):
+                            element[key][ekey] = {'ip1': -a, 'ip2': b}
 
                     print('***** {0}.out data loaded *****'.format(file))
 
@@ -286,18 +389,20 @@ def extract_data(structure, fields):
 
                 try:
 
-                    with open('{0}{1}_spring.out'.format(temp, file), 'r') as f:
-                        lines = f.readlines()
-                    data = [float(i) for i in lines[-1].split(' ')[1:]]
+                    spring_ekeys = groups['spring']
+                    times, data = _read_recorder(temp, recorders[file + '_spring'], binary, history)
 
-                    element['spfx'] = {}
+                    if history:
+                        results['history']['time'] = times
+                        _element_history(results['history']['element'], 'spfx', m, spring_ekeys, data[:, :, None])
+                        data = data[-1]
 
-                    with open('{0}spring_ekeys.json'.format(temp), 'r') as f:
-                        spring_ekeys = json.load(f)['spring_ekeys']
+                    spfx, = _element_columns(data, 1)
 
-                    for ekey, spfx in zip(spring_ekeys, data):
-                        element['spfx'][ekey] = {}
-                        element['spfx'][ekey]['ip'] = spfx
+                    element['spfx'] = {}
+
+                    for ekey, value in zip(spring_ekeys, spfx):
+                        element['spfx'][ekey] = {'ip': value}
 
                     print('***** {0}.out data loaded *****'.format(file))
 
@@ -305,7 +410,9 @@ def extract_data(structure, fields):
 
                     print('***** No spring element data loaded *****')
 
-        print('\n***** Data extracted from OpenSees .out file(s) : {0} s *****\n'.format(time() - tic))
+        if frames:
+            _write_frames(structure, temp, step, recorders, groups, binary)
+            print('***** {0} frames written to disk *****'.format(step))
 
     else:
 
@@ -317,8 +424,8 @@ def extract_data(structure, fields):
             lines = f.readlines()
         data = [float(i.rstrip('\n')) for i in lines]
 
-        structure.results[step]['frequencies'] = data
-        structure.results[step]['masses'] = [0 for i in data]
+        results['frequencies'] = data
+        results['masses'] = [0 for i in data]
 
         for mode in range(structure.steps[step].modes):
 
@@ -326,22 +433,464 @@ def extract_data(structure, fields):
 
                 file = '{0}_u_mode-{1}'.format(step, mode + 1)
 
-                with open('{0}{1}.out'.format(temp, file), 'r') as f:
-                    lines = f.readlines()
-                data = [float(i) for i in lines[-1].split(' ')]
-
-                dofx = data[0::3]
-                dofy = data[1::3]
-                dofz = data[2::3]
-                dofm = [sqrt(u**2 + v**2 + w**2) for u, v, w in zip(dofx, dofy, dofz)]
+                _, data = _read_recorder(temp, recorders[file], binary)
+                dofx, dofy, dofz, dofm = _nodal_columns(data)
 
-                nodal['ux{0}'.format(mode + 1)] = {i: dofx[i] for i in nodes}
-                nodal['uy{0}'.format(mode + 1)] = {i: dofy[i] for i in nodes}
-                nodal['uz{0}'.format(mode + 1)] = {i: dofz[i] for i in nodes}
-                nodal['um{0}'.format(mode + 1)] = {i: dofm[i] for i in nodes}
+                nodal['ux{0}'.format(mode + 1)] = dict(zip(nodes, dofx))
+                nodal['uy{0}'.format(mode + 1)] = dict(zip(nodes, dofy))
+                nodal['uz{0}'.format(mode + 1)] = dict(zip(nodes, dofz))
+                nodal['um{0}'.format(mode + 1)] = dict(zip(nodes, dofm))
 
                 print('***** {0}.out data loaded *****'.format(file))
 
             except Exception:
 
                 print('***** {0}.out data not loaded/saved'.format(file))
+
+    return results
+
+
+def _read_recorder(temp, recorder, binary=False, history=False):
+    """ Reads an OpenSees recorder described by its recorders.json manifest entry.
+
+    Parameters
+    ----------
+    temp : str
+        Folder containing the .out recorder files.
+    recorder : dict
+        Manifest entry with the 'file', 'time' and 'columns' of the recorder.
+    binary : bool
+        Whether the recorder was written with -binary.
+    history : bool
+        Read every record instead of only the final record (requires NumPy).
+
+    Returns
+    -------
+    array
+        Time of each record if history is requested, else None.
+    list, array
+        Values of the final record, or (records x values) array if history is requested.
+
+    """
+
+    if recorder.get('parts'):
+        return _read_parts(temp, recorder, binary, history)
+
+    filename = '{0}{1}'.format(temp, recorder['file'])
+    time = recorder['time']
+    ncolumns = recorder['columns']
+
+    if history:
+        records = _read_records(filename, ncolumns, binary)
+        if time:
+            return records[:, 0], records[:, 1:]
+        return np.arange(1, len(records) + 1, dtype=float), records
+
+    data = _read_last_record(filename, ncolumns, binary)
+
+    return None, (data[1:] if time else data)
+
+
+def _read_parts(temp, recorder, binary=False, history=False):
+    """ Reads and merges the per-process recorders of a partitioned OpenSeesMP model.
+
+    Parameters
+    ----------
+    temp : str
+        Folder containing the .out recorder files.
+    recorder : dict
+        Manifest entry with the 'parts' of the recorder, each with its 'file', 'columns' and 'nodes' or 'elements'
+        positions.
+    binary : bool
+        Whether the recorders were written with -binary.
+    history : bool
+        Read every record instead of only the final record (requires NumPy).
+
+    Returns
+    -------
+    array
+        Time of each record if history is requested, else None.
+    list, array
+        Merged values of the final record, or (records x values) array if history is requested.
+
+    Notes
+    -----
+    - Entries not recorded by any process, e.g. unconnected nodes, are zero.
+
+    """
+
+    values = recorder['values']
+    count = (recorder['columns'] - int(recorder['time'])) // values
+    times = None
+    merged = None
+
+    for part in recorder['parts']:
+
+        entry = {'file': part['file'], 'time': recorder['time'], 'columns': part['columns']}
+        positions = part.get('nodes', part.get('elements'))
+        t, data = _read_recorder(temp, entry, binary, history)
+
+        if history:
+            if merged is None:
+                times = t
+                merged = np.zeros((len(t), count, values))
+            records = min(len(merged), len(data))
+            merged = merged[:records]
+            times = times[:records]
+            merged[:, positions] = data[:records].reshape((records, -1, values))
+
+        else:
+            if merged is None:
+                merged = [0.] * (count * values)
+            for i, position in enumerate(positions):
+                merged[position * values:(position + 1) * values] = data[i * values:(i + 1) * values]
+
+    if history:
+        return times, merged.reshape((len(merged), -1))
+
+    return None, merged
+
+
+def _read_last_record(filename, ncolumns=None, binary=False, blocksize=65536):
+    """ Reads the final record of an OpenSees recorder by seeking back from the end of the file.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .out recorder file.
+    ncolumns : int
+        Number of values per record, required for binary recorders.
+    binary : bool
+        Whether the recorder was written with -binary.
+    blocksize : int
+        Initial number of bytes to read back from the end of a text file, doubled until a full line is found.
+
+    Returns
+    -------
+    list, array
+        The values of the final record.
+
+    Notes
+    -----
+    - An incomplete final record, e.g. from an aborted analysis, is skipped: a text line without its newline or
+      a binary record shorter than ncolumns values.
+    - Raises a ValueError if the file has no complete record.
+
+    """
+
+    with open(filename, 'rb') as f:
+
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+
+        if binary:
+
+            nbytes = 8 * ncolumns
+
+            if position >= nbytes:
+
+                f.seek(position - position % nbytes - nbytes)
+
+                if compas.IPY:
+                    return list(struct.unpack('{0}d'.format(ncolumns), f.read(nbytes)))
+
+                return np.fromfile(f, dtype=np.float64, count=ncolumns)
+
+        tail = b''
+
+        while not binary and position > 0:
+
+            size = min(blocksize, position)
+            position -= size
+            blocksize *= 2
+
+            f.seek(position)
+            tail = f.read(size) + tail
+            lines = tail.split(b'\n')[:-1]
+
+            # The first line may be cut by the block start, the part after the last newline is incomplete
+
+            for line in reversed(lines[1:] if position else lines):
+                if line.strip():
+                    return [float(i) for i in line.decode().split()]
+
+    raise ValueError('{0} has no complete record, the analysis may have been aborted'.format(filename))
+
+
+def _read_records(filename, ncolumns=None, binary=False):
+    """ Streams every record of an OpenSees recorder into a preallocated array.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .out recorder file.
+    ncolumns : int
+        Number of values per record, required for binary recorders.
+    binary : bool
+        Whether the recorder was written with -binary.
+
+    Returns
+    -------
+    array
+        (records x columns) array of the recorded values.
+
+    Notes
+    -----
+    - An incomplete final record, e.g. from an aborted analysis, is discarded.
+
+    """
+
+    if binary:
+        data = np.fromfile(filename, dtype=np.float64)
+        nrecords = len(data) // ncolumns
+        return data[:nrecords * ncolumns].reshape((nrecords, ncolumns))
+
+    nrecords = 0
+
+    with open(filename, 'r') as f:
+        for line in f:
+            if line.endswith('\n') and line.strip():
+                if not nrecords:
+                    ncolumns = len(line.split())
+                nrecords += 1
+
+    records = np.empty((nrecords, ncolumns))
+
+    for i, record in enumerate(_iter_records(filename, ncolumns, binary)):
+        records[i] = record
+
+    return records
+
+
+def _iter_records(filename, ncolumns=None, binary=False):
+    """ Yields the records of an OpenSees recorder one at a time.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .out recorder file.
+    ncolumns : int
+        Number of values per record, required for binary recorders.
+    binary : bool
+        Whether the recorder was written with -binary.
+
+    Yields
+    ------
+    array
+        The values of the next record.
+
+    Notes
+    -----
+    - An incomplete final record, e.g. from an aborted analysis, is not yielded.
+
+    """
+
+    if binary:
+
+        with open(filename, 'rb') as f:
+            while True:
+                record = np.fromfile(f, dtype=np.float64, count=ncolumns)
+                if len(record) < ncolumns:
+                    break
+                yield record
+
+    else:
+
+        with open(filename, 'r') as f:
+            for line in f:
+                if line.endswith('\n') and line.strip():
+                    yield np.array(line.split(), dtype=float)
+
+
+def _write_frames(structure, temp, step, recorders, groups, binary):
+    """ Streams the recorders of a Step increment by increment into a chunked on-disk store.
+
+    Parameters
+    ----------
+    structure : obj
+        Structure object.
+    temp : str
+        Folder containing the .out recorder files.
+    step : str
+        Name of the Step.
+    recorders : dict
+        Recorder entries of the recorders.json manifest.
+    groups : dict
+        Element keys of the truss, beam and spring groups.
+    binary : bool
+        Whether the recorders were written with -binary.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    - Element components are stored as (m x 2) arrays, with NaN for elements outside the recorded group(s).
+
+    """
+
+    m = structure.element_count()
+    keys = [key for key in sorted(recorders) if recorders[key]['step'] == step and recorders[key]['time']]
+    keys = [key for key in keys if all(os.path.exists('{0}{1}'.format(temp, i['file']))
+                                       for i in recorders[key].get('parts') or [recorders[key]])]
+    streams = [_iter_recorder(temp, recorders[key], binary) for key in keys]
+    labels = {key: ['ip1', 'ip2'] for key in list(beam_columns) + ['spfx']}
+
+    with FrameWriter(temp, step) as writer:
+
+        for records in zip(*streams):
+
+            nodal = {}
+            element = {}
+
+            for key, record in zip(keys, records):
+
+                recorder = recorders[key]
+                field = recorder['field']
+                data = record[1:]
+
+                if 'nodes' in recorder:
+
+                    dofs = data.reshape((-1, 3))
+                    for c, i in enumerate('xyz'):
+                        nodal['{0}{1}'.format(field, i)] = dofs[:, c]
+                    nodal['{0}m'.format(field)] = np.sqrt(np.sum(dofs**2, axis=1))
+
+                else:
+
+                    group = recorder['elements']
+                    ekeys = groups[group]
+
+                    if group == 'beam':
+                        forces = data.reshape((-1, 2, 6))
+                        for component, c in beam_columns.items():
+                            values = element.setdefault(component, np.full((m, 2), np.nan))
+                            values[ekeys] = forces[:, :, c] * np.array([-1., 1.])
+
+                    else:
+                        component = 'sf1' if group == 'truss' else 'spfx'
+                        values = element.setdefault(component, np.full((m, 2), np.nan))
+                        values[ekeys, 0] = data
+
+            writer.append(record[0], nodal=nodal, element=element, labels=labels)
+
+
+def _iter_recorder(temp, recorder, binary=False):
+    """ Yields the records of a recorder, merging the per-process recorders of a partitioned model.
+
+    Parameters
+    ----------
+    temp : str
+        Folder containing the .out recorder files.
+    recorder : dict
+        Manifest entry of the recorder.
+    binary : bool
+        Whether the recorders were written with -binary.
+
+    Yields
+    ------
+    array
+        Time and values of the next record.
+
+    """
+
+    if not recorder.get('parts'):
+        for record in _iter_records('{0}{1}'.format(temp, recorder['file']), recorder['columns'], binary):
+            yield record
+        return
+
+    values = recorder['values']
+    streams = [_iter_records('{0}{1}'.format(temp, part['file']), part['columns'], binary) for part in recorder['parts']]
+    positions = [np.array(part.get('nodes', part.get('elements')), dtype=int) for part in recorder['parts']]
+
+    for records in zip(*streams):
+        merged = np.zeros(recorder['columns'])
+        merged[0] = records[0][0]
+        data = merged[1:].reshape((-1, values))
+        for record, position in zip(records, positions):
+            data[position] = record[1:].reshape((-1, values))
+        yield merged
+
+
+def _nodal_columns(data):
+    """ Splits a nodal record into x, y, z and magnitude components.
+
+    Parameters
+    ----------
+    data : list, array
+        Nodal record [x0, y0, z0, x1, y1, z1, ...].
+
+    Returns
+    -------
+    list
+        Lists of the x, y, z and magnitude values of each node.
+
+    """
+
+    if compas.IPY:
+        dofx = data[0::3]
+        dofy = data[1::3]
+        dofz = data[2::3]
+        dofm = [sqrt(u**2 + v**2 + w**2) for u, v, w in zip(dofx, dofy, dofz)]
+        return [dofx, dofy, dofz, dofm]
+
+    dofs = np.asarray(data, dtype=float).reshape((-1, 3))
+    dofm = np.sqrt(np.sum(dofs**2, axis=1))
+
+    return dofs.T.tolist() + [dofm.tolist()]
+
+
+def _element_columns(data, ncolumns):
+    """ Splits an element record into its per element columns.
+
+    Parameters
+    ----------
+    data : list, array
+        Element record with ncolumns values per element.
+    ncolumns : int
+        Number of values recorded per element.
+
+    Returns
+    -------
+    list
+        Lists of the values of each column.
+
+    """
+
+    if compas.IPY:
+        return [data[i::ncolumns] for i in range(ncolumns)]
+
+    return np.asarray(data, dtype=float).reshape((-1, ncolumns)).T.tolist()
+
+
+def _element_history(history, key, m, ekeys, values):
+    """ Adds an element group's history to an (increments x elements x points) array.
+
+    Parameters
+    ----------
+    history : dict
+        Element history dictionary to update.
+    key : str
+        Component name, e.g. 'sf1'.
+    m : int
+        Number of elements in the Structure.
+    ekeys : list
+        Element keys of the group.
+    values : array
+        (increments x len(ekeys) x points) array of values.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    - Entries for elements outside of the group(s) are NaN.
+
+    """
+
+    if key not in history:
+        history[key] = np.full((values.shape[0], m, 2), np.nan)
+
+    history[key][:, ekeys, :values.shape[2]] = values
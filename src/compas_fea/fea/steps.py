@@ -41,6 +41,11 @@ class Steps(object):
         except Exception:
             os.mkdir(temp)
 
+        # Recorder manifest
+
+        recorders = {}
+        groups = {'truss': [], 'beam': [], 'spring': []}
+
         # Steps
 
         for key in self.structure.steps_order[1:]:
@@ -124,8 +129,30 @@ class Steps(object):
                 if isinstance(step.loads, str):
                     step.loads = [step.loads]
 
+                # OpenSees nodal loads
+
+                if self.software == 'opensees':
+
+                    vector = self.structure.step_load_vector(key)
+
+                    if vector['nodes']:
+
+                        self.write_subsection(', '.join(vector['loads']))
+                        forces = dict(zip(vector['nodes'], vector['forces']))
+
+                        for part, keys in self.split_nodes(vector['nodes'], owned=True):
+                            self.write_part(part)
+                            for nkey in keys:
+                                self.write_line('load {0} {1}'.format(nkey + 1, ' '.join([str(i) for i in forces[nkey][:self.ndof]])))
+                        self.write_part(None)
+
+                        self.blank_line()
+
                 for k in step.loads:
 
+                    if self.software == 'opensees' and self.structure.load_vector(k) is not None:
+                        continue
+
                     self.write_subsection(k)
 
                     load = loads[k]
@@ -154,46 +181,20 @@ class Steps(object):
 
                     if self.software == 'opensees':
 
-                        # PointLoad
-                        # ---------
-
-                        if ltype == 'PointLoad':
-
-                            compnents = ' '.join([str(com[dof] * fact) for dof in dofs[:self.ndof]])
-
-                            for node in nodes:
-
-                                ns = sets[node].selection if isinstance(node, str) else node
-
-                                for ni in [i + 1 for i in ns]:
-                                    self.write_line('load {0} {1}'.format(ni, compnents))
-
-                        # Gravity
-                        # -------
-
-                        elif ltype == 'GravityLoad':
-
-                            for nkey, node in self.structure.nodes.items():
-
-                                W = - fact * node.mass * 9.81
-                                self.write_line('load {0} {1} {2} {3} -0.0 -0.0 -0.0'.format(
-                                    nkey + 1, gx * W, gy * W, gz * W))
-
                         # LineLoad
                         # --------
 
-                        elif ltype == 'LineLoad':
-
-                            if axes == 'global':
-
-                                raise NotImplementedError
+                        if ltype == 'LineLoad':
 
-                            elif axes == 'local':
+                            lx = -com['x'] * fact
+                            ly = -com['y'] * fact
 
-                                elements = ' '.join([str(i + 1) for i in sets[k].selection])
-                                lx = -com['x'] * fact
-                                ly = -com['y'] * fact
-                                self.write_line('eleLoad -ele {0} -type -beamUniform {1} {2}'.format(elements, ly, lx))
+                            for part, keys in self.split_elements(sets[k].selection):
+                                if keys:
+                                    self.write_part(part)
+                                    elements = ' '.join([str(i + 1) for i in keys])
+                                    self.write_line('eleLoad -ele {0} -type -beamUniform {1} {2}'.format(elements, ly, lx))
+                            self.write_part(None)
 
                     # -------------------------------------------------------------------------------------------------
                     # Abaqus
@@ -262,13 +263,13 @@ class Steps(object):
                             self.write_line('*CLOAD, OP={0}'.format(op))
                             self.blank_line()
 
-                            for node in sorted(com, key=int):
+                            for node, force in zip(load.nodes, load.forces):
 
                                 ni = node + 1
 
-                                for ci, dof in enumerate(dofs[:3], 1):
-                                    if com[node][dof]:
-                                        self.write_line('{0}, {1}, {2}'.format(ni, ci, com[node][dof] * fact))
+                                for ci, value in enumerate(force, 1):
+                                    if value:
+                                        self.write_line('{0}, {1}, {2}'.format(ni, ci, value * fact))
 
                         # LineLoad
                         # --------
@@ -355,11 +356,17 @@ class Steps(object):
 
                             ns = sets[node].selection if isinstance(node, str) else node
 
-                            for ni in [i + 1 for i in ns]:
+                            for part, keys in self.split_nodes(ns):
 
-                                for c, dof in enumerate(dofs[:self.ndof], 1):
-                                    if com[dof] is not None:
-                                        self.write_line('sp {0} {1} {2}'.format(ni, c, com[dof]))
+                                self.write_part(part)
+
+                                for ni in [i + 1 for i in keys]:
+
+                                    for c, dof in enumerate(dofs[:self.ndof], 1):
+                                        if com[dof] is not None:
+                                            self.write_line('sp {0} {1} {2}'.format(ni, c, com[dof]))
+
+                            self.write_part(None)
 
                         self.blank_line()
                         self.blank_line()
@@ -417,6 +424,8 @@ class Steps(object):
                     'rm': '4 5 6 reaction',
                 }
 
+                option = '-binary' if self.binary else '-file'
+
                 if stype != 'ModalStep':
 
                     self.write_line('}')
@@ -424,14 +433,18 @@ class Steps(object):
                     self.blank_line()
                     self.write_subsection('Node recorders')
 
-                    prefix = 'recorder Node -file {0}{1}_'.format(temp, key)
+                    prefix = 'recorder Node {0} {1}'.format(option, temp)
                     n = self.structure.node_count()
 
                     for field in node_output:
                         if field in fields:
                             dof = node_output[field]
-                            self.write_line('{0}{1}.out -time -nodeRange 1 {2} -dof {3}'.format(prefix, field, n, dof))
+                            file = '{0}_{1}'.format(key, field)
+                            parts = self.write_node_recorder(prefix, file, '-time ', '-dof {0}'.format(dof))
                             self.blank_line()
+                            recorders[file] = {
+                                'file': '{0}.out'.format(file), 'step': key, 'field': field, 'time': True,
+                                'nodes': [0, n], 'values': 3, 'columns': 1 + 3 * n, 'parts': parts}
 
                     # Sort elements
 
@@ -462,37 +475,36 @@ class Steps(object):
                             spring_elements += n
                             spring_ekeys.append(ekey)
 
+                    groups = {'truss': truss_ekeys, 'beam': beam_ekeys, 'spring': spring_ekeys}
+
                     # Element recorders
 
                     self.blank_line()
                     self.write_subsection('Element recorders')
 
-                    prefix = 'recorder Element -file {0}{1}_'.format(temp, key)
+                    prefix = 'recorder Element {0} {1}'.format(option, temp)
+                    element_output = []
 
                     if 'sf' in fields:
 
                         if truss_elements:
-                            self.write_line('{0}sf_truss.out -time -ele {1} axialForce'.format(prefix, truss_elements))
+                            element_output.append(('sf', 'truss', 1, 'axialForce'))
 
                         if beam_elements:
-                            self.write_line('{0}sf_beam.out -time -ele {1} localForce'.format(prefix, beam_elements))
+                            element_output.append(('sf', 'beam', 12, 'localForce'))
 
                     if 'spf' in fields:
 
                         if spring_elements:
-                            self.write_line('{0}spf_spring.out -time -ele {1} basicForces'.format(prefix,
-                                                                                                  spring_elements))
-
-                    # ekeys
+                            element_output.append(('spf', 'spring', 1, 'basicForces'))
 
-                    with open('{0}truss_ekeys.json'.format(temp), 'w') as file:
-                        json.dump({'truss_ekeys': truss_ekeys}, file)
-
-                    with open('{0}beam_ekeys.json'.format(temp), 'w') as file:
-                        json.dump({'beam_ekeys': beam_ekeys}, file)
-
-                    with open('{0}spring_ekeys.json'.format(temp), 'w') as file:
-                        json.dump({'spring_ekeys': spring_ekeys}, file)
+                    for field, group, values, response in element_output:
+                        file = '{0}_{1}_{2}'.format(key, field, group)
+                        parts = self.write_element_recorder(prefix, file, groups[group], values, response)
+                        recorders[file] = {
+                            'file': '{0}.out'.format(file), 'step': key, 'field': field,
+                            'time': True, 'elements': group, 'values': values, 'columns': 1 + values * len(groups[group]),
+                            'parts': parts}
 
                     # Solver
 
@@ -501,8 +513,8 @@ class Steps(object):
                     self.blank_line()
 
                     self.write_line('constraints Transformation')
-                    self.write_line('numberer RCM')
-                    self.write_line('system ProfileSPD')
+                    self.write_line('numberer ParallelRCM' if self.parts else 'numberer RCM')
+                    self.write_line('system Mumps' if self.parts else 'system ProfileSPD')
                     self.write_line('test NormUnbalance {0} {1} 5'.format(tolerance, iterations))
                     self.write_line('algorithm NewtonLineSearch')
                     self.write_line('integrator LoadControl {0}'.format(1. / increments))
@@ -515,10 +527,14 @@ class Steps(object):
                     self.write_subsection('Node recorders')
 
                     for mode in range(modes):
-                        prefix = 'recorder Node -file {0}{1}_u_mode-{2}'.format(temp, key, mode + 1)
+                        prefix = 'recorder Node {0} {1}'.format(option, temp)
+                        file = '{0}_u_mode-{1}'.format(key, mode + 1)
                         n = self.structure.node_count()
-                        self.write_line('{0}.out -nodeRange 1 {1} -dof 1 2 3 "eigen {2}"'.format(prefix, n, mode + 1))
+                        parts = self.write_node_recorder(prefix, file, '', '-dof 1 2 3 "eigen {0}"'.format(mode + 1))
                         self.blank_line()
+                        recorders[file] = {
+                            'file': '{0}.out'.format(file), 'step': key, 'field': 'u',
+                            'time': False, 'nodes': [0, n], 'values': 3, 'columns': 3 * n, 'parts': parts}
 
                     self.write_subsection('Eigen analysis')
 
@@ -534,6 +550,7 @@ class Steps(object):
                     self.blank_line()
                     self.write_line('puts "frequencies: $f"')
                     self.blank_line()
+                    self.write_part(0 if self.parts else None)
                     self.write_line('set file "{0}{1}_frequencies.txt"'.format(temp, key))
                     self.write_line('set File [open $file "w"]')
                     self.blank_line()
@@ -541,6 +558,7 @@ class Steps(object):
                     self.write_line('    puts $File " $t"')
                     self.write_line('}')
                     self.write_line('close $File')
+                    self.write_part(None)
                     self.blank_line()
                     self.write_line('record')
 
@@ -570,6 +588,23 @@ class Steps(object):
                     self.write_line('*ELEMENT OUTPUT, REBAR')
                     self.write_line('RBFOR')
 
+                if self.fil:
+
+                    fil_node = {'u': 'U', 'ur': 'U', 'rf': 'RF', 'rm': 'RF', 'cf': 'CF', 'cm': 'CF'}
+                    fil_element = {'s': 'S', 'e': 'E', 'pe': 'PE', 'sf': 'SF', 'sm': 'SF'}
+
+                    node_file = sorted(set(fil_node[i] for i in fields if i in fil_node))
+                    element_file = sorted(set(fil_element[i] for i in fields if i in fil_element))
+
+                    self.blank_line()
+                    if key == self.structure.steps_order[1]:
+                        self.write_line('*FILE FORMAT, ASCII')
+                    self.write_line('*NODE FILE')
+                    self.write_line(', '.join(node_file))
+                    if element_file:
+                        self.write_line('*EL FILE')
+                        self.write_line(', '.join(element_file))
+
                 self.blank_line()
                 self.write_line('*END STEP')
                 self.blank_line()
@@ -583,6 +618,104 @@ class Steps(object):
 
                 pass
 
+        # Recorder manifest
+
+        if self.software == 'opensees':
+
+            manifest = {
+                'format': 'binary' if self.binary else 'text',
+                'groups': groups,
+                'parts': len(self.parts['nodes']) if self.parts else None,
+                'recorders': recorders,
+            }
+
+            with open('{0}recorders.json'.format(temp), 'w') as file:
+                json.dump(manifest, file)
+
+    def write_node_recorder(self, prefix, file, time, response):
+        """ Writes an OpenSees node recorder, or one recorder per process for the nodes it owns.
+
+        Parameters
+        ----------
+        prefix : str
+            Recorder command and folder, e.g. 'recorder Node -file temp/'.
+        file : str
+            Name of the .out file without extension.
+        time : str
+            '-time ' to record the time column, else ''.
+        response : str
+            DOFs and response, e.g. '-dof 1 2 3 disp'.
+
+        Returns
+        -------
+        list
+            Manifest 'file', 'nodes' and 'columns' of the recorder of each process, None for a sequential model.
+
+        """
+
+        if not self.parts:
+            n = self.structure.node_count()
+            self.write_line('{0}{1}.out {2}-nodeRange 1 {3} {4}'.format(prefix, file, time, n, response))
+            return None
+
+        parts = []
+
+        for part, nodes in self.split_nodes(self.structure.nodes, owned=True):
+            if nodes:
+                name = '{0}_p{1}.out'.format(file, part)
+                self.write_part(part)
+                self.write_line('{0}{1} {2}-node {3} {4}'.format(prefix, name, time, ' '.join([str(i + 1) for i in nodes]),
+                                                                 response))
+                parts.append({'file': name, 'nodes': nodes, 'columns': int(bool(time)) + 3 * len(nodes)})
+
+        self.write_part(None)
+
+        return parts
+
+    def write_element_recorder(self, prefix, file, ekeys, values, response):
+        """ Writes an OpenSees element recorder, or one recorder per process for its elements.
+
+        Parameters
+        ----------
+        prefix : str
+            Recorder command and folder, e.g. 'recorder Element -file temp/'.
+        file : str
+            Name of the .out file without extension.
+        ekeys : list
+            Element keys of the recorded group.
+        values : int
+            Number of values recorded per element.
+        response : str
+            Element response, e.g. 'axialForce'.
+
+        Returns
+        -------
+        list
+            Manifest 'file', 'elements' (positions in the group) and 'columns' of the recorder of each process, None
+            for a sequential model.
+
+        """
+
+        if not self.parts:
+            elements = ''.join(['{0} '.format(i + 1) for i in ekeys])
+            self.write_line('{0}{1}.out -time -ele {2} {3}'.format(prefix, file, elements, response))
+            return None
+
+        parts = []
+        position = {ekey: i for i, ekey in enumerate(ekeys)}
+
+        for part, keys in self.split_elements(ekeys):
+            if keys:
+                name = '{0}_p{1}.out'.format(file, part)
+                self.write_part(part)
+                self.write_line('{0}{1} -time -ele {2} {3}'.format(prefix, name, ' '.join([str(i + 1) for i in keys]),
+                                                                   response))
+                parts.append({'file': name, 'elements': [position[i] for i in keys], 'columns': 1 + values * len(keys)})
+
+        self.write_part(None)
+
+        return parts
+
 
 # Thermal
 
@@ -0,0 +1,408 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+import os
+import struct
+
+from compas_fea.utilities.functions import element_blocks
+
+
+__all__ = [
+    'write_vtu',
+    'write_vti',
+    'write_pvd',
+    'structure_to_vtu',
+]
+
+
+# VTK cell types
+
+VTK_VERTEX = 1
+VTK_LINE = 3
+VTK_TRIANGLE = 5
+VTK_POLYGON = 7
+VTK_QUAD = 9
+VTK_TETRA = 10
+VTK_HEXAHEDRON = 12
+VTK_WEDGE = 13
+
+solid_cells = {4: VTK_TETRA, 6: VTK_WEDGE, 8: VTK_HEXAHEDRON}
+shell_types = ['ShellElement', 'MembraneElement', 'FaceElement']
+
+vtk_types = {'f8': 'Float64', 'f4': 'Float32', 'i8': 'Int64', 'i4': 'Int32', 'u1': 'UInt8'}
+
+
+def write_vtu(filename, points, connectivity, offsets, types, point_data=None, cell_data=None):
+    """ Writes an unstructured grid to a VTK XML (.vtu) file with appended raw binary data.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .vtu file.
+    points : array
+        (n x 3) point co-ordinates.
+    connectivity : array
+        Flat point indices of all cells.
+    offsets : array
+        End position of each cell in connectivity.
+    types : array
+        VTK cell type of each cell.
+    point_data : list
+        [(name, components, function), ..] point fields, function returning the (n x components) array.
+    cell_data : list
+        [(name, components, function), ..] cell fields, function returning the (m x components) array.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    - Field functions are called one at a time while writing, so only one field array is held in memory.
+
+    """
+
+    n = len(points)
+    m = len(types)
+    point_data = point_data or []
+    cell_data = cell_data or []
+
+    arrays = [('Points', 'f8', 3, n, lambda: points)]
+    arrays += [(name, 'f8', c, n, function) for name, c, function in point_data]
+    arrays += [(name, 'f8', c, m, function) for name, c, function in cell_data]
+    arrays += [('connectivity', 'i8', 1, len(connectivity), lambda: connectivity),
+               ('offsets', 'i8', 1, m, lambda: offsets),
+               ('types', 'u1', 1, m, lambda: types)]
+
+    offset = 0
+    headers = {}
+
+    for name, dtype, c, count, _ in arrays:
+        headers[name] = '<DataArray type="{0}" Name="{1}" NumberOfComponents="{2}" format="appended" offset="{3}"/>'.format(
+            vtk_types[dtype], name, c, offset)
+        offset += 8 + count * c * int(dtype[1:])
+
+    lines = [
+        '<?xml version="1.0"?>',
+        '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64">',
+        '<UnstructuredGrid>',
+        '<Piece NumberOfPoints="{0}" NumberOfCells="{1}">'.format(n, m),
+        '<PointData>',
+    ]
+    lines += [headers[name] for name, _, _ in point_data]
+    lines += ['</PointData>', '<CellData>']
+    lines += [headers[name] for name, _, _ in cell_data]
+    lines += ['</CellData>', '<Points>', headers['Points'], '</Points>', '<Cells>']
+    lines += [headers[name] for name in ['connectivity', 'offsets', 'types']]
+    lines += ['</Cells>', '</Piece>', '</UnstructuredGrid>', '<AppendedData encoding="raw">']
+
+    with open(filename, 'wb') as f:
+
+        f.write(('\n'.join(lines) + '\n_').encode('ascii'))
+
+        for name, dtype, c, count, function in arrays:
+            data = np.ascontiguousarray(function(), dtype='<' + dtype).reshape(count * c)
+            f.write(struct.pack('<Q', data.nbytes))
+            f.write(data.tobytes())
+
+        f.write(b'\n</AppendedData>\n</VTKFile>\n')
+
+
+def write_vti(filename, volume, origin, spacing, name='values'):
+    """ Writes a voxel volume to a VTK XML image data (.vti) file with appended raw binary data.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .vti file.
+    volume : array
+        (nx x ny x nz) point values.
+    origin : list
+        Co-ordinates [x, y, z] of the first point.
+    spacing : float
+        Grid spacing.
+    name : str
+        Name of the point field.
+
+    Returns
+    -------
+    None
+
+    """
+
+    nx, ny, nz = volume.shape
+    extent = '0 {0} 0 {1} 0 {2}'.format(nx - 1, ny - 1, nz - 1)
+    data = np.asarray(volume, dtype='<f8').ravel(order='F')
+
+    lines = [
+        '<?xml version="1.0"?>',
+        '<VTKFile type="ImageData" version="1.0" byte_order="LittleEndian" header_type="UInt64">',
+        '<ImageData WholeExtent="{0}" Origin="{1} {2} {3}" Spacing="{4} {4} {4}">'.format(extent, *(list(origin) + [spacing])),
+        '<Piece Extent="{0}">'.format(extent),
+        '<PointData Scalars="{0}">'.format(name),
+        '<DataArray type="Float64" Name="{0}" NumberOfComponents="1" format="appended" offset="0"/>'.format(name),
+        '</PointData>',
+        '</Piece>',
+        '</ImageData>',
+        '<AppendedData encoding="raw">',
+    ]
+
+    with open(filename, 'wb') as f:
+        f.write(('\n'.join(lines) + '\n_').encode('ascii'))
+        f.write(struct.pack('<Q', data.nbytes))
+        f.write(data.tobytes())
+        f.write(b'\n</AppendedData>\n</VTKFile>\n')
+
+
+def write_pvd(filename, datasets):
+    """ Writes a ParaView collection (.pvd) file of a time series.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .pvd file.
+    datasets : list
+        [(time, file), ..] with file paths relative to the .pvd file.
+
+    Returns
+    -------
+    None
+
+    """
+
+    with open(filename, 'w') as f:
+        f.write('<?xml version="1.0"?>\n')
+        f.write('<VTKFile type="Collection" version="1.0" byte_order="LittleEndian">\n<Collection>\n')
+        for time, file in datasets:
+            f.write('<DataSet timestep="{0}" group="" part="0" file="{1}"/>\n'.format(time, file))
+        f.write('</Collection>\n</VTKFile>\n')
+
+
+def structure_to_vtu(structure, path, steps=None, fields=None, iptype='mean'):
+    """ Exports the Structure and its results to .vtu files and .pvd series for ParaView.
+
+    Parameters
+    ----------
+    structure : obj
+        Structure object.
+    path : str
+        Folder to write the files to.
+    steps : list, str
+        Steps to export, None for all Steps with results.
+    fields : list
+        Nodal and element components to export, e.g. ['ux', 'smises'], None for all.
+    iptype : str
+        'mean', 'max' or 'min' of an element's integration point data for the cell values.
+
+    Returns
+    -------
+    list
+        Paths of the written .pvd files.
+
+    Notes
+    -----
+    - Steps with a single set of results form one series {name}.pvd, one time per Step.
+    - Modal (ux1, ux2, ..) and harmonic Steps form their own series {name}_{step}.pvd, one time per mode or frequency.
+    - A displacement vector 'u' is added when ux, uy and uz are present.
+
+    """
+
+    if steps is None:
+        steps = [step for step in structure.steps_order if step in structure.results]
+    elif isinstance(steps, str):
+        steps = [steps]
+
+    if not os.path.exists(path):
+        os.makedirs(path)
+
+    points, connectivity, offsets, types, ekeys = _geometry(structure)
+    geometry = [points, connectivity, offsets, types]
+    name = structure.name
+
+    series = []
+    files = []
+
+    for step in steps:
+
+        frames = _step_frames(structure, step, fields)
+
+        if len(frames) == 1 and frames[0][0] is None:
+            filename = '{0}_{1}.vtu'.format(name, step)
+            _write_frame(os.path.join(path, filename), geometry, ekeys, frames[0][1], frames[0][2], iptype)
+            series.append((len(series), filename))
+
+        else:
+            datasets = []
+            for time, nodal, element in frames:
+                filename = '{0}_{1}_{2}.vtu'.format(name, step, time)
+                _write_frame(os.path.join(path, filename), geometry, ekeys, nodal, element, iptype)
+                datasets.append((time, filename))
+            files.append(os.path.join(path, '{0}_{1}.pvd'.format(name, step)))
+            write_pvd(files[-1], datasets)
+
+        print('***** Step {0} exported to .vtu *****'.format(step))
+
+    if series:
+        files.insert(0, os.path.join(path, '{0}.pvd'.format(name)))
+        write_pvd(files[0], series)
+
+    return files
+
+
+def _geometry(structure):
+
+    nkeys = sorted(structure.nodes, key=int)
+    points = np.array(structure.nodes_xyz(nkeys), dtype=float).reshape(-1, 3)
+
+    ekeys, cells, types = [], [], []
+
+    for ekey in sorted(structure.elements, key=int):
+
+        element = structure.elements[ekey]
+        nodes = element.nodes
+        n = len(nodes)
+
+        if n == 1:
+            type = VTK_VERTEX
+        elif n == 2:
+            type = VTK_LINE
+        elif element.__name__ in shell_types or n == 3:
+            type = {3: VTK_TRIANGLE, 4: VTK_QUAD}.get(n, VTK_POLYGON)
+        elif n in solid_cells:
+            type = solid_cells[n]
+        else:
+            print('***** Element {0} with {1} nodes not exported *****'.format(ekey, n))
+            continue
+
+        ekeys.append(int(ekey))
+        cells.append(nodes)
+        types.append(type)
+
+    counts = np.array([len(i) for i in cells], dtype=int)
+    connectivity = np.fromiter((node for cell in cells for node in cell), dtype=int, count=int(counts.sum()))
+
+    return points, connectivity, np.cumsum(counts), np.array(types, dtype=np.uint8), np.array(ekeys, dtype=int)
+
+
+def _step_frames(structure, step, fields):
+
+    results = structure.results
+    nodal = results[step].get('nodal', {})
+    element = results[step].get('element', {})
+
+    if fields:
+        for field in fields:
+            if results.is_derived(field) and field not in nodal and field not in element:
+                try:
+                    results.field(step, field)
+                except KeyError:
+                    pass
+
+    if nodal and not isinstance(next(iter(nodal)), str):
+        return _harmonic_frames(nodal)
+
+    modes = sorted(set(int(i[len(i.rstrip('0123456789')):]) for i in nodal if i[-1].isdigit()))
+
+    if not modes:
+        return [(None, _select(nodal, fields), _select(element, fields))]
+
+    frames = []
+
+    for mode in modes:
+        suffix = str(mode)
+        data = {i[:-len(suffix)]: j for i, j in nodal.items() if i.endswith(suffix) and i[:-len(suffix)].isalpha()}
+        frames.append((mode, _select(data, fields), {}))
+
+    return frames
+
+
+def _harmonic_frames(nodal):
+
+    frequencies = sorted(set(f for data in nodal.values() for f in data))
+    frames = []
+
+    for frequency in frequencies:
+        data = {}
+        for part in ['real', 'imag']:
+            for axis in 'xyz':
+                values = {node: nodal[node][frequency][part][axis] for node in nodal if frequency in nodal[node]}
+                data['u{0}_{1}'.format(axis, part)] = values
+        frames.append((frequency, data, {}))
+
+    return frames
+
+
+def _select(data, fields):
+
+    return {i: j for i, j in data.items() if fields is None or i in fields}
+
+
+def _write_frame(filename, geometry, ekeys, nodal, element, iptype):
+
+    points, connectivity, offsets, types = geometry
+    n = len(points)
+
+    point_data = []
+    cell_data = []
+
+    for component in sorted(nodal):
+        if _numeric(nodal[component]):
+            point_data.append((component, 1, _nodal_array(nodal[component], n)))
+
+    for suffix in ['', '_real', '_imag']:
+        names = ['u{0}{1}'.format(axis, suffix) for axis in 'xyz']
+        if all(i in nodal for i in names):
+            point_data.append(('u' + suffix, 3, _vector_array([nodal[i] for i in names], n)))
+
+    for component in sorted(element):
+        values = element[component]
+        if values and isinstance(next(iter(values.values())), dict) and _numeric(next(iter(values.values()))):
+            cell_data.append((component, 1, _cell_array(element, component, ekeys, iptype)))
+
+    write_vtu(filename, points, connectivity, offsets, types, point_data, cell_data)
+
+
+def _numeric(data):
+
+    value = next(iter(data.values()), None)
+
+    return isinstance(value, (int, float)) or (value is None and len(data) > 1)
+
+
+def _nodal_array(data, n):
+
+    def function():
+        array = np.full(n, np.nan)
+        keys = np.fromiter((int(i) for i in data), dtype=int, count=len(data))
+        array[keys] = np.array([np.nan if i is None else i for i in data.values()], dtype=float)
+        return array
+
+    return function
+
+
+def _vector_array(components, n):
+
+    def function():
+        return np.column_stack([_nodal_array(i, n)() for i in components])
+
+    return function
+
+
+def _cell_array(element, component, ekeys, iptype):
+
+    def function():
+        _, blocks = element_blocks(element, [component])
+        block = blocks[component]
+        values = np.full(max(block.shape[0], int(ekeys.max()) + 1 if len(ekeys) else 0), np.nan)
+        present = ~np.all(np.isnan(block), axis=1)
+        reduce = {'mean': np.nanmean, 'max': np.nanmax, 'min': np.nanmin}[iptype]
+        values[np.nonzero(present)[0]] = reduce(block[present], axis=1)
+        return values[ekeys]
+
+    return function
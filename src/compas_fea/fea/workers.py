@@ -0,0 +1,54 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+__all__ = [
+    'map_workers',
+]
+
+
+def map_workers(function, items, workers=1, processes=False):
+    """ Maps a function over items with a bounded pool of worker threads or processes.
+
+    Parameters
+    ----------
+    function : obj
+        Function taking a single item.
+    items : list
+        Items to map the function over.
+    workers : int
+        Maximum number of concurrent calls, e.g. the number of available licences.
+    processes : bool
+        Use a process pool, for CPU bound functions holding the GIL. The function must be picklable (module level).
+
+    Returns
+    -------
+    list
+        Function results in the order of items.
+
+    Notes
+    -----
+    - Threads suit the extraction jobs, which wait on external processes or file reads.
+    - With one worker or one item the calls run serially without creating a pool.
+
+    """
+
+    items = list(items)
+    workers = min(int(workers or 1), len(items))
+
+    if workers <= 1:
+        return [function(item) for item in items]
+
+    if processes:
+        from multiprocessing import Pool
+        pool = Pool(workers)
+    else:
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(workers)
+
+    try:
+        return pool.map(function, items)
+    finally:
+        pool.close()
+        pool.join()
@@ -32,7 +32,22 @@ class Writer(Steps, Materials, BCs, Sets, Elements, Nodes, Heading):
 
     Parameters
     ----------
-    None
+    structure : obj
+        The Structure object to write.
+    software : str
+        Analysis software / library, 'abaqus', 'opensees' or 'ansys'.
+    filename : str
+        Path of the input file to write.
+    fields : list
+        Data field requests.
+    ndof : int
+        Number of degrees-of-freedom in the model, 3 or 6.
+    binary : bool
+        Write binary instead of text recorders (OpenSees only).
+    fil : bool
+        Also request ASCII .fil results file output (Abaqus only).
+    parts : dict
+        Partitions of an OpenSeesMP model from Structure.partition, None for a sequential model (OpenSees only).
 
     Returns
     -------
@@ -40,10 +55,14 @@ class Writer(Steps, Materials, BCs, Sets, Elements, Nodes, Heading):
 
     """
 
-    def __init__(self, structure, software, filename, fields, ndof=6):
+    def __init__(self, structure, software, filename, fields, ndof=6, binary=False, fil=False, parts=None):
+        self.binary = binary
         self.comment = comments[software]
+        self.fil = fil
         self.filename = filename
         self.ndof = ndof
+        self.part = None
+        self.parts = parts
         self.software = software
         self.structure = structure
         self.fields = fields
@@ -74,3 +93,81 @@ class Writer(Steps, Materials, BCs, Sets, Elements, Nodes, Heading):
         self.write_line('{0} {1}'.format(self.comment, subsection))
         self.write_line('{0}-{1}'.format(self.comment, '-' * len(subsection)))
         self.blank_line()
+
+    def write_part(self, part):
+        """ Switches to the getPID guarded block of an OpenSeesMP process, None to close the open block.
+
+        Parameters
+        ----------
+        part : int
+            Partition (process) number.
+
+        Returns
+        -------
+        None
+
+        """
+
+        if part == self.part:
+            return
+
+        if self.part is not None:
+            self.write_line('}')
+
+        if part is not None:
+            self.write_line('if {{$pid == {0}}} {{'.format(part))
+
+        self.part = part
+
+    def split_nodes(self, nodes, owned=False):
+        """ Splits node keys into the partitions that define them.
+
+        Parameters
+        ----------
+        nodes : list
+            Node keys.
+        owned : bool
+            Assign interface nodes only to their owning partition, for loads and masses applied once.
+
+        Returns
+        -------
+        list
+            (partition, node keys) pairs keeping their order, a single (None, nodes) pair for a sequential model.
+
+        """
+
+        nodes = list(nodes)
+
+        if not self.parts:
+            return [(None, nodes)]
+
+        if owned:
+            owner = self.parts['owner']
+            return [(part, [i for i in nodes if owner.get(i) == part]) for part in range(len(self.parts['nodes']))]
+
+        return [(part, [i for i in nodes if i in keys]) for part, keys in enumerate(self.parts['sets'])]
+
+    def split_elements(self, elements):
+        """ Splits element keys into their partitions, keeping their order.
+
+        Parameters
+        ----------
+        elements : list
+            Element keys.
+
+        Returns
+        -------
+        list
+            (partition, element keys) pairs, a single (None, elements) pair for a sequential model.
+
+        """
+
+        if not self.parts:
+            return [(None, list(elements))]
+
+        split = [[] for i in self.parts['nodes']]
+
+        for ekey in elements:
+            split[self.parts['elements'][ekey]].append(ekey)
+
+        return list(enumerate(split))
@@ -15,6 +15,15 @@ structure
     Structure
 
 
+results
+=======
+
+.. autosummary::
+    :toctree: generated/
+
+    Results
+
+
 constraint
 ==========
 
@@ -260,6 +269,7 @@ from .section import (
     SpringSection,
     MassSection
 )
+from .results import Results
 from .set import Set
 from .step import (
     Step,
@@ -355,6 +365,7 @@ __all__ = [
     'SpringSection',
     'MassSection',
 
+    'Results',
     'Set',
 
     'Step',
@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
+
 
 # Author(s): Andrew Liew (github.com/andrewliew), Tomas Mendez Echenagucia (github.com/tmsmendez)
 
@@ -284,34 +286,84 @@ class TributaryLoad(Load):
         z component of area load.
     axes : str
         TributaryLoad applied via 'local' or 'global' axes.
+    tributary : dict
+        Nodes and areas from TributaryLoad.tributary for the same mesh, None to compute them.
+
+    Attributes
+    ----------
+    nodes : list
+        Nodes of the mesh vertices.
+    areas : list
+        Tributary area of each node.
+    forces : list
+        (n x 3) nodal forces of each node.
 
     Notes
     -----
     - The load components are loads per unit area [N/m2].
     - Currently only supports 'global' axis.
+    - Mesh vertices without a node are ignored, vertices sharing a node add their areas.
+    - Pass the tributary of a first load to the loads of other intensities on the same mesh, to not repeat
+      the geometry.
 
     """
 
-    def __init__(self, structure, name, mesh, x=0, y=0, z=0, axes='global'):
+    def __init__(self, structure, name, mesh, x=0, y=0, z=0, axes='global', tributary=None):
         Load.__init__(self, name=name, axes=axes)
 
         self.__name__ = 'TributaryLoad'
-        self.attr_list.append('mesh')
-
-        nodes = []
-        components = {}
+        self.attr_list.append('areas')
 
-        for key in mesh.vertices():
-
-            node = structure.check_node_exists(mesh.vertex_coordinates(key))
+        if tributary is None:
+            tributary = TributaryLoad.tributary(structure, mesh)
 
+        self.components = {'x': x, 'y': y, 'z': z}
+        self.nodes = list(tributary['nodes'])
+        self.areas = list(tributary['areas'])
+
+    @property
+    def forces(self):
+        return [[A * self.components[i] for i in 'xyz'] for A in self.areas]
+
+    @staticmethod
+    def tributary(structure, mesh):
+        """ Computes the tributary areas of all the mesh vertices and matches them to the Structure nodes.
+
+        Parameters
+        ----------
+        structure : obj
+            Structure class.
+        mesh : obj
+            Tributary Mesh datastructure.
+
+        Returns
+        -------
+        dict
+            'nodes' sorted node keys and 'areas' their tributary areas.
+
+        """
+
+        vkeys = list(mesh.vertices())
+        index = {key: i for i, key in enumerate(vkeys)}
+        vertices = [mesh.vertex_coordinates(key) for key in vkeys]
+        faces = [[index[i] for i in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+
+        if compas.IPY:
+            from compas.rpc import Proxy
+            areas = Proxy('compas_fea.utilities.meshing').tributary_areas(vertices, faces)
+        else:
+            from compas_fea.utilities.meshing import tributary_areas
+            areas = tributary_areas(vertices, faces)
+
+        tributary = {}
+
+        for node, A in zip(structure.check_nodes_exist(vertices), areas):
             if node is not None:
-                A = mesh.vertex_area(key)
-                nodes.append(node)
-                components[node] = {'x': x * A, 'y': y * A, 'z': z * A}
+                tributary[node] = tributary.get(node, 0) + A
 
-        self.components = components
-        self.nodes = nodes
+        nodes = sorted(tributary, key=int)
+
+        return {'nodes': nodes, 'areas': [tributary[node] for node in nodes]}
 
 
 class HarmonicPointLoad(Load):
@@ -19,6 +19,9 @@ from compas_fea.structure.element import PentahedronElement
 from compas_fea.structure.element import HexahedronElement
 from compas_fea.structure.element import MassElement
 
+from compas_fea.structure.mixins.nodemixins import geometric_keys
+from compas_fea.utilities.functions import incidence_matrix
+
 # Author(s): Andrew Liew (github.com/andrewliew), Tomas Mendez Echenagucia (github.com/tmsmendez)
 
 __all__ = [
@@ -121,6 +124,65 @@ class ElementMixins(object):
 
         return [self.add_element(nodes=nodes, type=type, thermal=thermal, axes=axes) for nodes in elements]
 
+    def add_elements_bulk(self, elements, type, thermal=False, axes={}, mass=None, centroids=None):
+        """Adds many elements of the same type to structure.elements, with the key rules of add_element.
+
+        Parameters
+        ----------
+        elements : list
+            List of lists of the nodes the elements are connected to.
+        type : str
+            Element type: 'HexahedronElement', 'BeamElement, 'TrussElement' etc.
+        thermal : bool
+            Thermal properties on or off.
+        axes : dict, list
+            The local element axes 'ex', 'ey' and 'ez' for all elements, or a dict for each element.
+        mass : float
+            Element mass.
+        centroids : list
+            [[x, y, z], ..] centroid of each element, None to compute them from the nodes.
+
+        Returns
+        -------
+        list
+            Keys of the added or existing elements, None for elements with repeated nodes.
+
+        Notes
+        -----
+        - The geometric keys of all centroids are formatted at once.
+
+        """
+
+        if centroids is None:
+            centroids = [centroid_points([self.node_xyz(node) for node in nodes]) for nodes in elements]
+
+        keys = []
+
+        for count, (nodes, gkey) in enumerate(zip(elements, geometric_keys(centroids, self.tol))):
+
+            nodes = list(nodes)
+
+            if len(nodes) != len(set(nodes)):
+                keys.append(None)
+                continue
+
+            ekey = self.element_index.get(gkey, None)
+
+            if ekey is None:
+                ekey = self.element_count()
+                element = func_dict[type]()
+                element.axes = axes[count] if isinstance(axes, list) else axes
+                element.nodes = nodes
+                element.number = ekey
+                element.thermal = thermal
+                element.mass = mass
+                self.elements[ekey] = element
+                self.element_index[gkey] = ekey
+
+            keys.append(ekey)
+
+        return keys
+
     def add_element_to_element_index(self, key, nodes, virtual=False):
         """Adds the element to the element_index dictionary.
 
@@ -198,6 +260,35 @@ class ElementMixins(object):
         """
         return len(self.elements) + len(self.virtual_elements)
 
+    def element_incidence(self):
+        """Return the element-node incidence matrix and node degrees, cached until the connectivity changes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        obj
+            Sparse (m x n) csr_matrix of the (non-virtual) elements and nodes.
+        array
+            (n x 1) number of elements connected to each node.
+
+        Notes
+        -----
+        - The cache is rebuilt when nodes or elements are added, not when element.nodes is edited in place.
+
+        """
+
+        key = (len(self.nodes), len(self.elements))
+        cache = getattr(self, '_incidence', None)
+
+        if cache is None or cache[0] != key:
+            elements = [self.elements[i].nodes for i in sorted(self.elements, key=int)]
+            cache = self._incidence = (key, incidence_matrix(elements, key[0]))
+
+        return cache[1]
+
     def element_centroid(self, element):
         """Return the centroid of an element.
 
@@ -15,6 +15,16 @@ __all__ = [
 ]
 
 
+def geometric_keys(points, tol):
+
+    precision = '{0}f'.format(tol)
+    template = '{{0:.{0}}},{{1:.{0}}},{{2:.{0}}}'.format(precision)
+    minzero = '-{0:.{1}}'.format(0.0, precision)
+    gkeys = [template.format(*point) for point in points]
+
+    return [geometric_key(point, precision) if minzero in gkey else gkey for point, gkey in zip(points, gkeys)]
+
+
 class NodeMixins(object):
 
     def add_node(self, xyz, ex=[1, 0, 0], ey=[0, 1, 0], ez=[0, 0, 1], mass=0, virtual=False):
@@ -88,6 +98,49 @@ class NodeMixins(object):
 
         return [self.add_node(xyz=node, ex=ex, ey=ey, ez=ez) for node in nodes]
 
+    def add_nodes_from_xyz(self, nodes, ex=[1, 0, 0], ey=[0, 1, 0], ez=[0, 0, 1], mass=0):
+        """ Adds nodes to structure.nodes in bulk, with the key rules of add_node.
+
+        Parameters
+        ----------
+        nodes : list
+            [[x, y, z], ..] co-ordinates for each node.
+        ex : list
+            Nodes' local x axis.
+        ey : list
+            Nodes' local y axis.
+        ez : list
+            Nodes' local z axis.
+        mass : float
+            Lumped mass at each node.
+
+        Returns
+        -------
+        list
+            Keys of the added or pre-existing nodes.
+
+        Notes
+        -----
+        - The geometric keys of all nodes are formatted at once, see check_nodes_exist.
+
+        """
+
+        xyz = [[float(i) for i in node] for node in nodes]
+        keys = []
+
+        for point, gkey in zip(xyz, geometric_keys(xyz, self.tol)):
+
+            key = self.node_index.get(gkey, None)
+
+            if key is None:
+                key = self.node_count()
+                self.nodes[key] = Node(key=key, xyz=point, ex=ex, ey=ey, ez=ez, mass=mass)
+                self.node_index[gkey] = key
+
+            keys.append(key)
+
+        return keys
+
     def add_node_to_node_index(self, key, xyz, virtual=False):
         """ Adds the node to the node_index dictionary.
 
@@ -134,6 +187,28 @@ class NodeMixins(object):
         xyz = [float(i) for i in xyz]
         return self.node_index.get(geometric_key(xyz, '{0}f'.format(self.tol)), None)
 
+    def check_nodes_exist(self, nodes):
+        """ Check if nodes already exist at given x, y, z co-ordinates, in bulk.
+
+        Parameters
+        ----------
+        nodes : list
+            [[x, y, z], ..] co-ordinates of the nodes to check.
+
+        Returns
+        -------
+        list
+            The node index of each existing node, None if not.
+
+        Notes
+        -----
+        - Geometric key check is made according to self.tol [m] tolerance.
+
+        """
+
+        xyz = [[float(i) for i in node] for node in nodes]
+        return [self.node_index.get(gkey, None) for gkey in geometric_keys(xyz, self.tol)]
+
     def edit_node(self, key, attr_dict):
         """ Edit a node's data.
 
@@ -0,0 +1,116 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import compas
+
+from compas_fea.utilities.fields import derived_fields
+
+
+__all__ = [
+    'Results',
+]
+
+
+class Results(dict):
+    """Analysis results keyed by Step, with memoised derived fields.
+
+    Parameters
+    ----------
+    None
+
+    Notes
+    -----
+    - Behaves as the structure.results dictionary {step: {'nodal': {...}, 'element': {...}}}.
+    - Derived fields are stored next to the raw components once computed, so existing readers find them.
+    - A derived field is recomputed only when one of its source components is replaced, e.g. by extract_data.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._cache = {}
+
+    def is_derived(self, name):
+        """Whether a field name is a registered derived field (with an optional mode number suffix).
+
+        Parameters
+        ----------
+        name : str
+            Field name, e.g. 'tresca' or 'um2'.
+
+        Returns
+        -------
+        bool
+            True if the field can be derived.
+
+        """
+
+        return name.rstrip('0123456789') in derived_fields
+
+    def field(self, step, name):
+        """Returns a raw or derived field of a Step, computing and memoising derived fields on first request.
+
+        Parameters
+        ----------
+        step : str
+            Name of the Step.
+        name : str
+            Field name, e.g. 'ux', 'smises' or 'tresca'.
+
+        Returns
+        -------
+        dict
+            The field data in the structure.results format.
+
+        Notes
+        -----
+        - Raw output of the same name, e.g. Abaqus 'smises', is returned in preference to the derived field.
+
+        """
+
+        results = self[step]
+
+        if not self.is_derived(name):
+            for dtype in ['nodal', 'element']:
+                if name in results.get(dtype, {}):
+                    return results[dtype][name]
+            raise KeyError('***** Field {0} not found in Step {1} *****'.format(name, step))
+
+        field = derived_fields[name.rstrip('0123456789')]
+        mode = name[len(name.rstrip('0123456789')):]
+        requires = [i + mode for i in field['requires']] if field['dtype'] == 'nodal' else field['requires']
+        data = results.setdefault(field['dtype'], {})
+
+        cached = self._cache.get((step, name))
+
+        if name in data and (cached is None or data[name] is not cached[1]):
+            return data[name]
+
+        sources = tuple(data.get(i) for i in requires)
+
+        if cached and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+
+        if all(i is None for i in sources):
+            raise KeyError('***** Field {0} needs {1} in Step {2} *****'.format(name, ', '.join(requires), step))
+
+        values = _derive_field(name, {i: j for i, j in zip(requires, sources) if j is not None})
+
+        data[name] = values
+        self._cache[(step, name)] = (sources, values)
+
+        return values
+
+
+def _derive_field(name, data):
+
+    if compas.IPY:
+        from compas.rpc import Proxy
+        fields = Proxy('compas_fea.utilities.fields')
+        values = fields.derive_field(name, data)
+        return {int(key): value for key, value in values.items()}
+
+    from compas_fea.utilities.fields import derive_field
+
+    return derive_field(name, data)
@@ -5,6 +5,8 @@ from __future__ import print_function
 from compas_fea.fea.abaq import abaq
 from compas_fea.fea.ansys import ansys
 from compas_fea.fea.opensees import opensees
+from compas_fea.fea.frames import iter_frames
+from compas_fea.fea import vtu
 
 # from compas_fea.utilities import combine_all_sets
 # from compas_fea.utilities import group_keys_by_attribute
@@ -14,11 +16,26 @@ from compas_fea.structure.mixins.nodemixins import NodeMixins
 from compas_fea.structure.mixins.elementmixins import ElementMixins
 from compas_fea.structure.mixins.objectmixins import ObjectMixins
 # from compas_fea.structure.displacement import *
+from compas_fea.structure.results import Results
 from compas_fea.structure.set import Set
 
+from compas_fea.utilities import loading
+from compas_fea.utilities import masses
+from compas_fea.utilities import partitioning
+from compas_fea.utilities import probing
+from compas_fea.utilities import selections
+from compas_fea.utilities import validation
+from compas_fea.utilities.functions import process_data
+
+import compas
 import pickle
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    pass
+
 
 # Author(s): Andrew Liew (github.com/andrewliew), Tomas Mendez Echenagucia (github.com/tmsmendez)
 
@@ -28,6 +45,25 @@ __all__ = [
 ]
 
 
+dofs = ['x', 'y', 'z', 'xx', 'yy', 'zz']
+
+element_kinds = {
+    'MassElement':        'point',
+    'SpringElement':      'spring',
+    'BeamElement':        'line',
+    'TrussElement':       'line',
+    'StrutElement':       'line',
+    'TieElement':         'line',
+    'ShellElement':       'shell',
+    'FaceElement':        'shell',
+    'MembraneElement':    'shell',
+    'SolidElement':       'solid',
+    'PentahedronElement': 'solid',
+    'TetrahedronElement': 'solid',
+    'HexahedronElement':  'solid',
+}
+
+
 class Structure(ObjectMixins, ElementMixins, NodeMixins):
     """Initialises Structure object for use in finite element analysis.
 
@@ -112,6 +148,17 @@ class Structure(ObjectMixins, ElementMixins, NodeMixins):
         self.virtual_elements = {}
         self.virtual_element_index = {}
 
+    @property
+    def results(self):
+        """dict : Analysis results {step: {'nodal': {...}, 'element': {...}}}, with derived fields (see Results.field)."""
+        if '_results' not in self.__dict__:
+            self._results = Results(self.__dict__.pop('results', {}))
+        return self._results
+
+    @results.setter
+    def results(self, value):
+        self._results = value if isinstance(value, Results) else Results(value)
+
     def __str__(self):
         n = self.node_count()
         m = self.element_count()
@@ -208,13 +255,188 @@ Steps
         -------
         None
 
+        Notes
+        -----
+        - Node and element selections are stored as sorted lists of unique keys.
+
         """
 
         if isinstance(selection, int):
             selection = [selection]
 
+        if type in ['node', 'element'] and not isinstance(selection, dict):
+            selection = sorted(set(selection))
+
         self.sets[name] = Set(name=name, type=type, selection=selection, index=len(self.sets))
 
+    def set_union(self, sets, name=None):
+        """Return the keys in any of the given node or element sets.
+
+        Parameters
+        ----------
+        sets : list
+            Names of node or element sets of the same type.
+        name : str
+            Name of a new set to add with the keys, None to only return them.
+
+        Returns
+        -------
+        list
+            Sorted keys.
+
+        """
+
+        return self._set_operation('selection_union', sets, name)
+
+    def set_intersection(self, sets, name=None):
+        """Return the keys in all of the given node or element sets.
+
+        Parameters
+        ----------
+        sets : list
+            Names of node or element sets of the same type.
+        name : str
+            Name of a new set to add with the keys, None to only return them.
+
+        Returns
+        -------
+        list
+            Sorted keys.
+
+        """
+
+        return self._set_operation('selection_intersection', sets, name)
+
+    def set_difference(self, sets, name=None):
+        """Return the keys in the first node or element set that are not in any of the other sets.
+
+        Parameters
+        ----------
+        sets : list
+            Names of node or element sets of the same type.
+        name : str
+            Name of a new set to add with the keys, None to only return them.
+
+        Returns
+        -------
+        list
+            Sorted keys.
+
+        """
+
+        return self._set_operation('selection_difference', sets, name)
+
+    def set_complement(self, sets, name=None):
+        """Return the node or element keys that are not in any of the given sets.
+
+        Parameters
+        ----------
+        sets : list
+            Names of node or element sets of the same type.
+        name : str
+            Name of a new set to add with the keys, None to only return them.
+
+        Returns
+        -------
+        list
+            Sorted keys.
+
+        """
+
+        return self._set_operation('selection_complement', sets, name)
+
+    def _set_operation(self, operation, sets, name):
+
+        sets = [sets] if isinstance(sets, str) else list(sets)
+        types = set(self.sets[i].type for i in sets)
+
+        if len(types) != 1 or not types <= set(['node', 'element']):
+            raise ValueError('Set operations need node or element sets of one type, got {0}'.format(sorted(types)))
+
+        type = types.pop()
+        n = self.node_count() if type == 'node' else self.element_count()
+        module = selections
+
+        if compas.IPY:
+            from compas.rpc import Proxy
+            module = Proxy('compas_fea.utilities.selections')
+
+        keys = getattr(module, operation)([self.sets[i].selection for i in sets], n)
+
+        if name is not None:
+            self.add_set(name=name, type=type, selection=keys)
+
+        return keys
+
+    # ==============================================================================
+    # Partitioning
+    # ==============================================================================
+
+    def partition(self, parts, method='rcb', name='partition', ncommon=1, weights=None):
+        """Partitions the elements into balanced parts and adds them as sets.
+
+        Parameters
+        ----------
+        parts : int
+            Number of parts.
+        method : str
+            'rcb' recursive coordinate bisection or 'spectral' graph bisection.
+        name : str
+            Prefix of the sets.
+        ncommon : int
+            Number of shared nodes for two elements to be adjacent.
+        weights : dict
+            Work weight of each element key, None for equal weights.
+
+        Returns
+        -------
+        dict
+            'elements' and 'nodes' lists of element and node keys of each part, 'interface' node keys,
+            'edge_cut' and 'imbalance', see utilities.partition_elements.
+
+        Notes
+        -----
+        - Adds element sets '{name}_{i}', node sets '{name}_{i}_nodes' (including the interface nodes) and the
+          node set '{name}_interface'.
+        - Virtual elements are not partitioned.
+
+        """
+
+        ekeys = sorted(self.elements, key=int)
+        elements = [self.elements[i].nodes for i in ekeys]
+
+        if weights is not None:
+            weights = [weights.get(i, 1) for i in ekeys]
+
+        report = partitioning.partition_elements(self.nodes_xyz(), elements, parts, method=method, ncommon=ncommon,
+                                                 weights=weights, incidence=self.element_incidence())
+        labels = report['elements']
+
+        part_elements = [[] for i in range(parts)]
+        part_nodes = [set() for i in range(parts)]
+
+        for ekey, nodes, label in zip(ekeys, elements, labels.tolist()):
+            part_elements[label].append(ekey)
+            part_nodes[label].update(nodes)
+
+        interface = report['interface'].tolist()
+
+        for i in range(parts):
+            self.add_set(name='{0}_{1}'.format(name, i), type='element', selection=part_elements[i])
+            self.add_set(name='{0}_{1}_nodes'.format(name, i), type='node', selection=sorted(part_nodes[i]))
+        self.add_set(name='{0}_interface'.format(name), type='node', selection=interface)
+
+        print('***** Partitioned into {0} parts : edge cut {1}, imbalance {2:.3f} *****'.format(
+            parts, report['edge_cut'], report['imbalance']))
+
+        return {
+            'elements':  part_elements,
+            'nodes':     [sorted(i) for i in part_nodes],
+            'interface': interface,
+            'edge_cut':  report['edge_cut'],
+            'imbalance': report['imbalance'],
+        }
+
     # ==============================================================================
     # Constructors    EXPERIMENTAL
     # ==============================================================================
@@ -481,6 +703,252 @@ Steps
 
         return loads_dic
 
+    # ==============================================================================
+    # Mass
+    # ==============================================================================
+
+    def mass_properties(self, elements=None, kinds=None):
+        """Return the element masses from section geometry and material density, lumped to the nodes, with the total
+        mass, centre of gravity and inertia tensor.
+
+        Parameters
+        ----------
+        elements : list
+            Element keys or set names to include, None for all elements with ElementProperties.
+        kinds : list
+            Element kinds to include, 'line', 'shell', 'solid' and/or 'point', None for all.
+
+        Returns
+        -------
+        dict
+            'elements' {key: mass}, 'nodes' lumped mass of each node (with the node masses), 'total' mass, 'centre'
+            of gravity and 'inertia' (3 x 3) tensor about the centre of gravity.
+
+        Notes
+        -----
+        - Line elements weigh p A L, shells p t area, solids p volume and MassElements their mass, lumped equally
+          to their nodes.
+        - Cached until the elements' properties, node masses, node co-ordinates or element nodes change.
+
+        """
+
+        include = None if elements is None else set(self._load_selection(elements))
+        ekeys, ekinds, factors = [], [], []
+
+        for name in sorted(self.element_properties):
+
+            prop = self.element_properties[name]
+            section = self.sections.get(prop.section)
+            p = getattr(self.materials.get(prop.material), 'p', None)
+            stype = getattr(section, '__name__', None)
+            geometry = getattr(section, 'geometry', None) or {}
+
+            if stype == 'MassSection':
+                kind = 'point'
+            elif stype in ['ShellSection', 'MembraneSection'] and p:
+                kind, factor = 'shell', p * geometry['t']
+            elif stype == 'SolidSection' and p:
+                kind, factor = 'solid', p
+            elif geometry.get('A') and p:
+                kind, factor = 'line', p * geometry['A']
+            else:
+                continue
+
+            if kinds is not None and kind not in kinds:
+                continue
+
+            for key in (prop.elements if prop.elements else self.sets[prop.elset].selection):
+                if include is None or key in include:
+                    ekeys.append(key)
+                    ekinds.append(kind)
+                    factors.append((self.elements[key].mass or 0) if kind == 'point' else factor)
+
+        node_masses = [self.nodes[i].mass or 0 for i in sorted(self.nodes, key=int)]
+        xyz = self.nodes_xyz()
+        connectivity = [self.elements[i].nodes for i in ekeys]
+        key = (xyz, connectivity, ekeys, ekinds, factors, node_masses)
+        cache = self.__dict__.setdefault('_masses', {})
+        entry = repr((elements, kinds))
+
+        if entry in cache and cache[entry][0] == key:
+            return cache[entry][1]
+
+        module = masses
+
+        if compas.IPY:
+            from compas.rpc import Proxy
+            module = Proxy('compas_fea.utilities.masses')
+
+        lumped = module.lumped_masses(xyz, connectivity, ekinds, factors)
+        nodal = [i + j for i, j in zip(lumped['nodes'], node_masses)]
+
+        properties = module.mass_properties(xyz, nodal)
+        properties['elements'] = dict(zip(ekeys, lumped['elements']))
+        properties['nodes'] = nodal
+        cache[entry] = (key, properties)
+
+        return properties
+
+    # ==============================================================================
+    # Loads
+    # ==============================================================================
+
+    def load_vector(self, name):
+        """Return the nodal load vector of a Load, cached until the load or the model changes.
+
+        Parameters
+        ----------
+        name : str
+            Name of the Load.
+
+        Returns
+        -------
+        dict
+            'nodes' loaded node keys and 'forces' their [x, y, z, xx, yy, zz] forces and moments, None for loads
+            applied to the elements by the solver (local LineLoad, PrestressLoad, harmonic and acoustic loads).
+
+        Notes
+        -----
+        - PointLoad and TributaryLoad give their nodal forces, GravityLoad the weight of the lumped masses of its
+          elements and of the node masses, and a global LineLoad or an AreaLoad the consistent nodal loads on its
+          line or shell elements.
+        - The cache is keyed by the load data, its node and element keys, the number of nodes and elements, and the
+          nodes and co-ordinates of the loaded elements (or the nodal masses for a GravityLoad).
+
+        """
+
+        load = self.loads[name]
+        ltype = load.__name__
+        com = getattr(load, 'components', {})
+
+        if ltype == 'PointLoad':
+            selection = self._load_selection(load.nodes)
+            data = [com[i] for i in dofs]
+
+        elif ltype == 'GravityLoad':
+            selection = sorted(self.nodes, key=int)
+            data = self.mass_properties(elements=load.elements or None)['nodes']
+
+        elif ltype == 'TributaryLoad':
+            selection = load.nodes
+            data = load.areas
+
+        elif (ltype == 'LineLoad' and load.axes == 'global') or ltype == 'AreaLoad':
+            selection = self._load_selection(load.elements)
+            data = [(self.elements[i].nodes, self.nodes_xyz(self.elements[i].nodes)) for i in selection]
+
+        else:
+            return None
+
+        key = (len(self.nodes), len(self.elements), ltype, sorted(com.items()), load.axes, getattr(load, 'g', None),
+               list(selection), data)
+        cache = self.__dict__.setdefault('_load_vectors', {})
+
+        if name in cache and cache[name][0] == key:
+            return cache[name][1]
+
+        if ltype == 'PointLoad':
+            vector = self._sum_load_vectors([({'nodes': selection, 'forces': [data] * len(selection)}, 1)])
+
+        elif ltype == 'GravityLoad':
+            g = [load.g * com[i] for i in 'xyz']
+            vector = {'nodes': [], 'forces': []}
+            for node, mass in zip(selection, data):
+                if mass:
+                    vector['nodes'].append(node)
+                    vector['forces'].append([mass * i for i in g] + [0, 0, 0])
+
+        elif ltype == 'TributaryLoad':
+            vector = {'nodes': list(selection), 'forces': [force + [0, 0, 0] for force in load.forces]}
+
+        else:
+            module = loading
+
+            if compas.IPY:
+                from compas.rpc import Proxy
+                module = Proxy('compas_fea.utilities.loading')
+
+            xyz = self.nodes_xyz()
+            elements = [self.elements[i].nodes for i in selection]
+            w = [com[i] for i in 'xyz']
+
+            if ltype == 'LineLoad':
+                moments = [self.elements[i].__name__ == 'BeamElement' for i in selection]
+                vector = module.line_load_vector(xyz, elements, w, moments=moments)
+            else:
+                vector = module.area_load_vector(xyz, elements, w, axes=load.axes)
+
+        cache[name] = (key, vector)
+
+        return vector
+
+    def step_load_vector(self, step):
+        """Return the sum of the nodal load vectors of a Step's loads, scaled by the Step factor(s).
+
+        Parameters
+        ----------
+        step : str
+            Name of the Step.
+
+        Returns
+        -------
+        dict
+            'nodes' sorted loaded node keys, 'forces' their [x, y, z, xx, yy, zz] forces and moments, and 'loads'
+            the names of the summed loads.
+
+        """
+
+        step = self.steps[step]
+        factor = getattr(step, 'factor', 1)
+        loads = getattr(step, 'loads', None) or []
+
+        if isinstance(loads, str):
+            loads = [loads]
+
+        vectors = []
+        names = []
+
+        for name in loads:
+            vector = self.load_vector(name)
+            if vector is not None:
+                vectors.append((vector, factor.get(name, 1.0) if isinstance(factor, dict) else factor))
+                names.append(name)
+
+        vector = self._sum_load_vectors(vectors)
+        vector['loads'] = names
+
+        return vector
+
+    def _load_selection(self, selection):
+
+        if isinstance(selection, str):
+            selection = [selection]
+
+        keys = []
+
+        for i in selection:
+            if isinstance(i, str):
+                keys.extend(self.sets[i].selection)
+            else:
+                keys.append(i)
+
+        return keys
+
+    @staticmethod
+    def _sum_load_vectors(vectors):
+
+        total = {}
+
+        for vector, factor in vectors:
+            for node, force in zip(vector['nodes'], vector['forces']):
+                row = total.setdefault(node, [0.] * 6)
+                for i in range(6):
+                    row[i] += factor * force[i]
+
+        nodes = [node for node in sorted(total, key=int) if any(total[node])]
+
+        return {'nodes': nodes, 'forces': [total[node] for node in nodes]}
+
     # ==============================================================================
     # Steps
     # ==============================================================================
@@ -501,11 +969,158 @@ Steps
 
         self.steps_order = order
 
+    # ==============================================================================
+    # Validation
+    # ==============================================================================
+
+    def validate(self, output=True):
+        """Checks the Structure for errors before an analysis.
+
+        Parameters
+        ----------
+        output : bool
+            Print the errors and warnings.
+
+        Returns
+        -------
+        dict
+            'valid', 'errors' and 'warnings' messages, and the keys found by each check: 'unused_nodes',
+            'duplicate_nodes', 'degenerate_elements', 'inverted_elements', 'unassigned_elements', 'components'
+            (number of connected components), 'mechanisms' (see utilities.validate_mesh) and 'missing' references.
+
+        Notes
+        -----
+        - Errors: degenerate or inverted elements, elements without ElementProperties, components free to translate
+          under the displacements of the Steps, and references to unknown objects, sets, nodes or elements.
+        - Warnings: unused nodes, duplicate nodes and disconnected components.
+        - The mesh checks are array operations of utilities.validate_mesh.
+
+        """
+
+        nkeys = sorted(self.nodes, key=int)
+        ekeys = sorted(self.elements, key=int)
+        missing = []
+
+        def check(owner, objects, name, kind):
+            if name is not None and name not in objects:
+                missing.append('{0}: unknown {1} {2}'.format(owner, kind, name))
+                return False
+            return True
+
+        def check_selection(owner, selection, kind):
+            selection = [selection] if isinstance(selection, (str, int)) else selection or []
+            keys = self.nodes if kind == 'node' else self.elements
+            valid = []
+            for i in selection:
+                if isinstance(i, str):
+                    if check(owner, self.sets, i, 'set'):
+                        valid.extend(self.sets[i].selection)
+                elif check(owner, keys, i, kind):
+                    valid.append(i)
+            return valid
+
+        # References
+
+        for name, set_ in self.sets.items():
+            if set_.type in ['node', 'element']:
+                check_selection("Set '{0}'".format(name), list(set_.selection), set_.type)
+
+        assigned = set()
+
+        for name, prop in self.element_properties.items():
+            owner = "ElementProperties '{0}'".format(name)
+            check(owner, self.materials, prop.material, 'material')
+            check(owner, self.sections, prop.section, 'section')
+            assigned.update(check_selection(owner, prop.elements if prop.elements else prop.elset, 'element'))
+
+        for name, load in self.loads.items():
+            owner = "Load '{0}'".format(name)
+            check_selection(owner, getattr(load, 'nodes', None), 'node')
+            check_selection(owner, getattr(load, 'elements', None), 'element')
+
+        restrained = {}
+
+        for name, displacement in self.displacements.items():
+            restrained[name] = check_selection("Displacement '{0}'".format(name), displacement.nodes, 'node')
+
+        restraints = [[False] * 6 for i in nkeys]
+
+        for name in self.steps_order:
+            if not check('Steps order', self.steps, name, 'step'):
+                continue
+            owner = "Step '{0}'".format(name)
+            step = self.steps[name]
+            for key in _names(getattr(step, 'loads', None)):
+                check(owner, self.loads, key, 'load')
+            for key in _names(getattr(step, 'displacements', None)):
+                if check(owner, self.displacements, key, 'displacement'):
+                    components = self.displacements[key].components
+                    for node in restrained[key]:
+                        for i, dof in enumerate(dofs):
+                            if components.get(dof) is not None:
+                                restraints[node][i] = True
+
+        # Mesh
+
+        module = validation
+
+        if compas.IPY:
+            from compas.rpc import Proxy
+            module = Proxy('compas_fea.utilities.validation')
+
+        elements = [self.elements[i] for i in ekeys]
+        mesh = module.validate_mesh(self.nodes_xyz(), [i.nodes for i in elements],
+                                    [element_kinds.get(i.__name__, 'point') for i in elements], restraints, tol=self.tol)
+
+        report = {
+            'unused_nodes':        [nkeys[i] for i in mesh['unused']],
+            'duplicate_nodes':     [[nkeys[i] for i in group] for group in mesh['duplicates']],
+            'degenerate_elements': [ekeys[i] for i in mesh['degenerate']],
+            'inverted_elements':   [ekeys[i] for i in mesh['inverted']],
+            'unassigned_elements': [i for i in ekeys if i not in assigned],
+            'components':          max(mesh['components'] + [-1]) + 1,
+            'mechanisms':          mesh['mechanisms'],
+            'missing':             missing,
+        }
+
+        errors = list(missing)
+        warnings = []
+
+        for key, message in [('degenerate_elements', 'degenerate elements'), ('inverted_elements', 'inverted elements'),
+                             ('unassigned_elements', 'elements without ElementProperties')]:
+            if report[key]:
+                errors.append('{0} {1}: {2}'.format(len(report[key]), message, _head(report[key])))
+
+        for mechanism in report['mechanisms']:
+            errors.append('Component {0} ({1} nodes) is free to translate in {2}'.format(
+                mechanism['component'], mechanism['size'], ', '.join(mechanism['free'])))
+
+        if report['unused_nodes']:
+            warnings.append('{0} unused nodes: {1}'.format(len(report['unused_nodes']), _head(report['unused_nodes'])))
+        if report['duplicate_nodes']:
+            warnings.append('{0} groups of duplicate nodes: {1}'.format(len(report['duplicate_nodes']),
+                                                                        _head(report['duplicate_nodes'])))
+        if report['components'] > 1:
+            warnings.append('{0} disconnected components'.format(report['components']))
+
+        report['errors'] = errors
+        report['warnings'] = warnings
+        report['valid'] = not errors
+
+        if output:
+            print('***** Validation : {0} errors, {1} warnings *****'.format(len(errors), len(warnings)))
+            for message in errors:
+                print('ERROR : {0}'.format(message))
+            for message in warnings:
+                print('WARNING : {0}'.format(message))
+
+        return report
+
     # ==============================================================================
     # Analysis
     # ==============================================================================
 
-    def write_input_file(self, software, fields='u', output=True, save=False, ndof=6):
+    def write_input_file(self, software, fields='u', output=True, save=False, ndof=6, binary=False, fil=False, parts=None):
         """Writes the FE software's input file.
 
         Parameters
@@ -518,6 +1133,14 @@ Steps
             Print terminal output.
         save : bool
             Save structure to .obj before file writing.
+        ndof : int
+            Number of degrees-of-freedom in the model, 3 or 6 ('opensees' only).
+        binary : bool
+            Write binary instead of text recorders ('opensees' only).
+        fil : bool
+            Also request ASCII .fil results output ('abaqus' only).
+        parts : int
+            Number of OpenSeesMP processes to partition the model for ('opensees' only), see Structure.partition.
 
         Returns
         -------
@@ -529,15 +1152,15 @@ Steps
             self.save_to_obj()
 
         if software == 'abaqus':
-            abaq.input_generate(self, fields=fields, output=output)
+            abaq.input_generate(self, fields=fields, output=output, fil=fil)
 
         elif software == 'ansys':
             ansys.input_generate(self)
 
         elif software == 'opensees':
-            opensees.input_generate(self, fields=fields, output=output, ndof=ndof)
+            opensees.input_generate(self, fields=fields, output=output, ndof=ndof, binary=binary, parts=parts)
 
-    def analyse(self, software, exe=None, cpus=4, license='research', delete=True, output=True):
+    def analyse(self, software, exe=None, cpus=4, license='research', delete=True, output=True, validate=False):
         """Runs the analysis through the chosen FEA software / library.
 
         Parameters
@@ -554,6 +1177,8 @@ Steps
             -
         output : bool
             Print terminal output.
+        validate : bool
+            Run Structure.validate first and raise a ValueError instead of launching if it finds errors.
 
         Returns
         -------
@@ -561,6 +1186,12 @@ Steps
 
         """
 
+        if validate:
+            report = self.validate(output=output)
+            if not report['valid']:
+                raise ValueError('Structure validation failed with {0} errors: {1}'.format(
+                    len(report['errors']), '; '.join(report['errors'])))
+
         if software == 'abaqus':
             cpus = 1 if license == 'student' else cpus
             abaq.launch_process(self, exe=exe, cpus=cpus, output=output)
@@ -572,7 +1203,7 @@ Steps
             opensees.launch_process(self, exe=exe, output=output)
 
     def extract_data(self, software, fields='u', steps='all', exe=None, sets=None, license='research', output=True,
-                     return_data=True, components=None):
+                     return_data=True, components=None, history=False, frames=False, workers=1, fil=False):
         """Extracts data from the analysis output files.
 
         Parameters
@@ -595,6 +1226,14 @@ Steps
             Return data back into structure.results.
         components : list
             Specific components to extract from the fields data.
+        history : bool
+            Extract every increment into structure.results[step]['history'] ('opensees' only).
+        frames : bool
+            Write every increment to a chunked on-disk store for iter_frames ('abaqus' and 'opensees').
+        workers : int
+            Number of steps to extract concurrently, bounded by the available licences.
+        fil : bool
+            Read results from the ASCII .fil file without starting Abaqus CAE ('abaqus' only).
 
         Returns
         -------
@@ -604,16 +1243,17 @@ Steps
 
         if software == 'abaqus':
             abaq.extract_data(self, fields=fields, exe=exe, output=output, return_data=return_data,
-                              components=components)
+                              components=components, frames=frames, workers=workers, fil=fil)
 
         elif software == 'ansys':
-            ansys.extract_rst_data(self, fields=fields, steps=steps, sets=sets, license=license)
+            ansys.extract_rst_data(self, fields=fields, steps=steps, sets=sets, license=license, workers=workers)
 
         elif software == 'opensees':
-            opensees.extract_data(self, fields=fields)
+            opensees.extract_data(self, fields=fields, history=history, frames=frames, workers=workers)
 
     def analyse_and_extract(self, software, fields='u', exe=None, cpus=4, license='research', output=True, save=False,
-                            return_data=True, components=None, ndof=6):
+                            return_data=True, components=None, ndof=6, binary=False, workers=1, fil=False, parts=None,
+                            validate=False):
         """Runs the analysis through the chosen FEA software / library and extracts data.
 
         Parameters
@@ -636,6 +1276,18 @@ Steps
             Return data back into structure.results.
         components : list
             Specific components to extract from the fields data.
+        ndof : int
+            Number of degrees-of-freedom in the model, 3 or 6 ('opensees' only).
+        binary : bool
+            Write binary instead of text recorders ('opensees' only).
+        workers : int
+            Number of steps to extract concurrently, bounded by the available licences.
+        fil : bool
+            Request and read the ASCII .fil results file instead of the .odb ('abaqus' only).
+        parts : int
+            Number of OpenSeesMP processes to partition the model for ('opensees' only).
+        validate : bool
+            Run Structure.validate before launching the analysis, see analyse.
 
         Returns
         -------
@@ -643,12 +1295,13 @@ Steps
 
         """
 
-        self.write_input_file(software=software, fields=fields, output=output, save=save, ndof=ndof)
+        self.write_input_file(software=software, fields=fields, output=output, save=save, ndof=ndof, binary=binary,
+                              fil=fil, parts=parts)
 
-        self.analyse(software=software, exe=exe, cpus=cpus, license=license, output=output)
+        self.analyse(software=software, exe=exe, cpus=cpus, license=license, output=output, validate=validate)
 
         self.extract_data(software=software, fields=fields, exe=exe, license=license, output=output,
-                          return_data=return_data, components=components)
+                          return_data=return_data, components=components, workers=workers, fil=fil)
 
     # ==============================================================================
     # Results
@@ -674,6 +1327,10 @@ Steps
         """
 
         data = {}
+
+        if self.results.is_derived(field):
+            self.results.field(step, field)
+
         rdict = self.results[step]['nodal']
 
         if nodes == 'all':
@@ -710,6 +1367,10 @@ Steps
         """
 
         data = {}
+
+        if self.results.is_derived(field):
+            self.results.field(step, field)
+
         rdict = self.results[step]['element']
 
         if elements == 'all':
@@ -726,6 +1387,136 @@ Steps
 
         return data
 
+    def locate_points(self, points, tol=None):
+        """Locates points in the elements, cached for repeated probes of the same points.
+
+        Parameters
+        ----------
+        points : list
+            [[x, y, z], ..] co-ordinates of the points.
+        tol : float
+            Largest distance of a point from a line or shell element, None for 1e-3 of the model size.
+
+        Returns
+        -------
+        array
+            (p,) containing element of each point, -1 if not found.
+        array
+            (p x 8) node numbers of the containing elements.
+        array
+            (p x 8) shape function weights of these nodes.
+
+        Notes
+        -----
+        - The cache is cleared when nodes or elements are added, or node co-ordinates or element nodes change.
+
+        """
+
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        ekeys = sorted(self.elements, key=int)
+        xyz = self.nodes_xyz()
+        elements = [self.elements[i].nodes for i in ekeys]
+        key = (xyz, elements)
+        cache = getattr(self, '_probes', None)
+
+        if cache is None or cache[0] != key:
+            cache = self._probes = (key, {})
+
+        pkey = (tol, points.tobytes())
+
+        if pkey not in cache[1]:
+            etypes = [self.elements[i].__name__ for i in ekeys]
+            cache[1][pkey] = probing.locate_points(xyz, elements, etypes, points, tol=tol)
+
+        return cache[1][pkey]
+
+    def probe(self, step, field, points, iptype='mean', nodal='mean', smooth=False, tol=None):
+        """Interpolates results at arbitrary points with the element shape functions.
+
+        Parameters
+        ----------
+        step : str
+            Step to probe.
+        field : str, list
+            Data field request(s), e.g. 'ux' or ['um', 'smises'].
+        points : list
+            [[x, y, z], ..] co-ordinates of the points, e.g. from utilities.polyline_points.
+        iptype : str
+            'mean', 'max' or 'min' of an element's integration point data.
+        nodal : str
+            'mean', 'max' or 'min' for nodal values of element data with smooth=True.
+        smooth : bool
+            Interpolate element data from nodal values, instead of taking the containing element's value.
+        tol : float
+            Largest distance of a point from a line or shell element.
+
+        Returns
+        -------
+        list, dict
+            Values at the points, None outside the elements, or {field: values} for a list of fields.
+
+        Notes
+        -----
+        - Point locations are cached, so probing more fields or Steps at the same points reuses them.
+
+        """
+
+        owner, owner_nodes, weights = self.locate_points(points, tol=tol)
+        n = len(self.nodes)
+        fields = [field] if isinstance(field, str) else field
+        values = {}
+
+        for name in fields:
+
+            if self.results.is_derived(name):
+                self.results.field(step, name)
+
+            if name in self.results[step].get('nodal', {}):
+                data = self.results[step]['nodal'][name]
+                vn = np.full(n, np.nan)
+                vn[[int(i) for i in data]] = [np.nan if i is None else i for i in data.values()]
+                result = probing.interpolate_nodal(vn, owner, owner_nodes, weights)
+
+            else:
+                elements = [self.elements[i].nodes for i in sorted(self.elements, key=int)]
+                vn, ve = process_data(self.results[step]['element'][name], 'element', iptype, nodal, elements, n,
+                                      incidence=self.element_incidence())
+                if smooth:
+                    result = probing.interpolate_nodal(vn.ravel(), owner, owner_nodes, weights)
+                else:
+                    result = np.where(owner >= 0, ve.ravel()[owner], np.nan)
+
+            values[name] = [None if i != i else i for i in result.tolist()]
+
+        return values if not isinstance(field, str) else values[field]
+
+    def iter_frames(self, step, fields=None):
+        """Iterates lazily over the increments of a Step written by extract_data(frames=True).
+
+        Parameters
+        ----------
+        step : str
+            Step to iterate over.
+        fields : list, str
+            Components to load, e.g. ['ux', 'sf1'], or None for all stored components.
+
+        Yields
+        ------
+        float
+            Time (frame value) of the increment.
+        dict
+            Component name : array of nodal (n,) or element (m x points) values.
+
+        Notes
+        -----
+        - Memory use is bounded by one chunk of frames, regardless of the number of increments.
+
+        """
+
+        temp = '{0}{1}/'.format(self.path, self.name)
+
+        return iter_frames(temp, step, fields)
+
     # ==============================================================================
     # Summary
     # ==============================================================================
@@ -803,6 +1594,32 @@ Steps
         if output:
             print('***** Structure saved to: {0} *****\n'.format(filename))
 
+    def to_vtu(self, path=None, steps=None, fields=None, iptype='mean'):
+        """Exports the Structure and its results to binary .vtu files with .pvd series for ParaView.
+
+        Parameters
+        ----------
+        path : str
+            Folder to write the files to, None for {path}{name}_vtu/.
+        steps : list, str
+            Steps to export, None for all Steps with results.
+        fields : list
+            Nodal and element components to export, e.g. ['ux', 'smises'], None for all.
+        iptype : str
+            'mean', 'max' or 'min' of an element's integration point data for the cell values.
+
+        Returns
+        -------
+        list
+            Paths of the written .pvd files.
+
+        """
+
+        if path is None:
+            path = os.path.join(self.path, self.name + '_vtu')
+
+        return vtu.structure_to_vtu(self, path=path, steps=steps, fields=fields, iptype=iptype)
+
     # ==============================================================================
     # Load
     # ==============================================================================
@@ -832,3 +1649,13 @@ Steps
             print('***** Structure loaded from: {0} *****'.format(filename))
 
         return structure
+
+
+def _names(names):
+
+    return [names] if isinstance(names, str) else names or []
+
+
+def _head(keys, n=10):
+
+    return '{0}{1}'.format(keys[:n], ' ...' if len(keys) > n else '')
@@ -15,17 +15,22 @@ functions
     :toctree: generated/
 
     colorbar
+    colormap
+    colormap_lut
     combine_all_sets
+    element_blocks
     group_keys_by_attribute
     group_keys_by_attributes
     identify_ranges
+    incidence_matrix
     mesh_from_shell_elements
     network_order
     normalise_data
     principal_stresses
+    principal_stress_field
+    stress_principals
     process_data
     postprocess
-    # plotvoxels
 
 
 meshing
@@ -36,46 +41,260 @@ meshing
 
     discretise_faces
     extrude_mesh
+    extrude_layers
     tets_from_vertices_faces
+    tributary_areas
+
+
+meshcache
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    MeshCache
+    mesh_cache
+    mesh_cache_key
+
+
+plotting
+========
+
+.. autosummary::
+    :toctree: generated/
+
+    plot_geometry
+    plot_inputs
+
+
+voxels
+======
+
+.. autosummary::
+    :toctree: generated/
+
+    voxel_grid
+    voxelise
+    write_voxels
+
+
+probing
+=======
+
+.. autosummary::
+    :toctree: generated/
+
+    element_kinds
+    shape_functions
+    locate_points
+    interpolate_nodal
+    polyline_points
+    transfer_results
+
+
+partitioning
+============
+
+.. autosummary::
+    :toctree: generated/
+
+    element_adjacency
+    partition_elements
+
+
+loading
+=======
+
+.. autosummary::
+    :toctree: generated/
+
+    line_load_vector
+    area_load_vector
+
+
+masses
+======
+
+.. autosummary::
+    :toctree: generated/
+
+    lumped_masses
+    mass_properties
+
+
+validation
+==========
+
+.. autosummary::
+    :toctree: generated/
+
+    validate_mesh
+
+
+selections
+==========
+
+.. autosummary::
+    :toctree: generated/
+
+    selection_union
+    selection_intersection
+    selection_difference
+    selection_complement
+    combine_selections
+
+
+fields
+======
+
+.. autosummary::
+    :toctree: generated/
+
+    derive_field
+    register_field
 
 """
 from __future__ import absolute_import
 
 from .functions import (
     colorbar,
+    colormap,
+    colormap_lut,
+    colormaps,
     combine_all_sets,
+    element_blocks,
     group_keys_by_attribute,
     group_keys_by_attributes,
+    incidence_matrix,
     network_order,
     normalise_data,
     postprocess,
     process_data,
     principal_stresses,
-    # plotvoxels,
+    principal_stress_field,
+    stress_principals,
     identify_ranges,
     mesh_from_shell_elements
 )
 from .meshing import (
     discretise_faces,
     extrude_mesh,
+    extrude_layers,
     tets_from_vertices_faces,
+    tributary_areas,
+)
+from .meshcache import (
+    MeshCache,
+    mesh_cache,
+    mesh_cache_key,
+)
+from .plotting import (
+    plot_geometry,
+    plot_inputs,
+)
+from .voxels import (
+    voxel_grid,
+    voxelise,
+    write_voxels,
+)
+from .probing import (
+    element_kinds,
+    shape_functions,
+    locate_points,
+    interpolate_nodal,
+    polyline_points,
+    transfer_results,
+)
+from .partitioning import (
+    element_adjacency,
+    partition_elements,
+)
+from .loading import (
+    line_load_vector,
+    area_load_vector,
+)
+from .masses import (
+    lumped_masses,
+    mass_properties,
+)
+from .validation import (
+    validate_mesh,
+)
+from .selections import (
+    selection_union,
+    selection_intersection,
+    selection_difference,
+    selection_complement,
+    combine_selections,
+)
+from .fields import (
+    derived_fields,
+    derive_field,
+    register_field,
 )
 
 __all__ = [
     'colorbar',
+    'colormap',
+    'colormap_lut',
+    'colormaps',
     'combine_all_sets',
+    'element_blocks',
     'group_keys_by_attribute',
     'group_keys_by_attributes',
+    'incidence_matrix',
     'network_order',
     'normalise_data',
     'postprocess',
     'process_data',
     'principal_stresses',
-    # 'plotvoxels',
+    'principal_stress_field',
+    'stress_principals',
     'identify_ranges',
     'mesh_from_shell_elements',
 
     'discretise_faces',
     'extrude_mesh',
+    'extrude_layers',
     'tets_from_vertices_faces',
+    'tributary_areas',
+
+    'MeshCache',
+    'mesh_cache',
+    'mesh_cache_key',
+
+    'plot_geometry',
+    'plot_inputs',
+
+    'voxel_grid',
+    'voxelise',
+    'write_voxels',
+
+    'element_kinds',
+    'shape_functions',
+    'locate_points',
+    'interpolate_nodal',
+    'polyline_points',
+    'transfer_results',
+
+    'element_adjacency',
+    'partition_elements',
+
+    'line_load_vector',
+    'area_load_vector',
+
+    'lumped_masses',
+    'mass_properties',
+
+    'validate_mesh',
+
+    'selection_union',
+    'selection_intersection',
+    'selection_difference',
+    'selection_complement',
+    'combine_selections',
+
+    'derived_fields',
+    'derive_field',
+    'register_field',
 ]
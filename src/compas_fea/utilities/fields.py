@@ -0,0 +1,175 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas_fea.utilities.functions import element_blocks
+from compas_fea.utilities.functions import stress_components
+from compas_fea.utilities.functions import stress_principals
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'derived_fields',
+    'derive_field',
+    'register_field',
+]
+
+
+derived_fields = {}
+
+
+def register_field(name, dtype, requires, function):
+    """Registers a derived field computed from raw result components.
+
+    Parameters
+    ----------
+    name : str
+        Name of the derived field, e.g. 'tresca'.
+    dtype : str
+        'nodal' or 'element'.
+    requires : list
+        Raw components the field is computed from, missing ones are passed as NaN arrays.
+    function : obj
+        Takes a dict of component : array, nodal (n,) or element (m x points), and returns the array of the field.
+
+    Returns
+    -------
+    None
+
+    """
+
+    derived_fields[name] = {'dtype': dtype, 'requires': list(requires), 'function': function}
+
+
+def derive_field(name, data):
+    """Computes a derived field from the raw result components.
+
+    Parameters
+    ----------
+    name : str
+        Name of the derived field, with a mode number suffix for modal nodal fields, e.g. 'um2'.
+    data : dict
+        Component : raw data from structure.results[step][dtype] for the required components.
+
+    Returns
+    -------
+    dict
+        The derived field in the structure.results format.
+
+    """
+
+    field = derived_fields[name.rstrip('0123456789')]
+    mode = name[len(name.rstrip('0123456789')):]
+    requires = [i + mode for i in field['requires']] if field['dtype'] == 'nodal' else field['requires']
+
+    if field['dtype'] == 'nodal':
+
+        keys = sorted(set(int(key) for c in requires if c in data for key in data[c]))
+        n = keys[-1] + 1 if keys else 0
+        arrays = {}
+
+        for c, r in zip(field['requires'], requires):
+            array = arrays[c] = np.full(n, np.nan)
+            if r in data:
+                array[[int(key) for key in data[r]]] = [np.nan if i is None else i for i in data[r].values()]
+
+        values = field['function'](arrays)
+
+        return {key: float(values[key]) for key in keys}
+
+    labels, blocks = element_blocks(data, requires)
+    values, labels = field['function'](blocks, labels)
+
+    results = {}
+    for ekey, row in enumerate(values.tolist()):
+        item = {label: value for label, value in zip(labels, row) if value == value}
+        if item:
+            results[ekey] = item
+
+    return results
+
+
+# ==============================================================================
+# Built-in fields
+# ==============================================================================
+
+def _magnitude(components):
+
+    def function(arrays, labels=None):
+        values = np.sqrt(sum(np.nan_to_num(arrays[c])**2 for c in components))
+        missing = np.all([np.isnan(arrays[c]) for c in components], axis=0)
+        values[missing] = np.nan
+        return values if labels is None else (values, labels)
+
+    return function
+
+
+def _principal(index):
+
+    def function(blocks, labels):
+        values = stress_principals(blocks)[0]
+        return values[..., index], labels
+
+    return function
+
+
+def _von_mises(blocks, labels):
+
+    return stress_principals(blocks)[2], labels
+
+
+def _tresca(blocks, labels):
+
+    values = stress_principals(blocks)[0]
+
+    if values.shape[-1] == 2:
+        values = np.concatenate([values, np.zeros(values.shape[:-1] + (1,))], axis=-1)
+
+    return np.max(values, axis=-1) - np.min(values, axis=-1), labels
+
+
+def _shell_split(component, part):
+
+    def function(blocks, labels):
+
+        ips = sorted(set(label.split('_')[0] for label in labels))
+        values = np.full((blocks[component].shape[0], len(ips)), np.nan)
+
+        for i, ip in enumerate(ips):
+            points = sorted((_section_point(label), c) for c, label in enumerate(labels) if label.split('_')[0] == ip)
+            stack = blocks[component][:, [c for _, c in points]]
+            valid = ~np.isnan(stack)
+            rows = np.arange(stack.shape[0])
+            bottom = stack[rows, np.argmax(valid, axis=1)]
+            top = stack[rows, stack.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)]
+            values[:, i] = 0.5 * (top + bottom) if part == 'membrane' else 0.5 * (top - bottom)
+
+        return values, ips
+
+    return function
+
+
+def _section_point(label):
+
+    return int(label.split('_sp')[1]) if '_sp' in label else 0
+
+
+for _field in ['u', 'ur', 'rf', 'rm', 'cf', 'cm']:
+    _requires = ['{0}{1}'.format(_field, i) for i in 'xyz']
+    register_field(_field + 'm', 'nodal', _requires, _magnitude(_requires))
+
+register_field('smises', 'element', stress_components, _von_mises)
+register_field('tresca', 'element', stress_components, _tresca)
+register_field('smaxp', 'element', stress_components, _principal(0))
+register_field('sminp', 'element', stress_components, _principal(-1))
+
+register_field('sfv', 'element', ['sf2', 'sf3'], _magnitude(['sf2', 'sf3']))
+register_field('smb', 'element', ['sm1', 'sm2'], _magnitude(['sm1', 'sm2']))
+
+for _c in ['xx', 'yy', 'xy']:
+    register_field('sm' + _c, 'element', ['s' + _c], _shell_split('s' + _c, 'membrane'))
+    register_field('sb' + _c, 'element', ['s' + _c], _shell_split('s' + _c, 'bending'))
@@ -7,6 +7,10 @@ from compas.geometry import distance_point_point
 from compas.topology import dijkstra_path
 from compas.utilities import geometric_key
 
+import compas
+
+from compas_fea.utilities.selections import combine_selections
+
 from time import time
 
 from operator import itemgetter
@@ -19,7 +23,6 @@ except ImportError:
 
 
 try:
-    # from scipy.interpolate import griddata
     from scipy.sparse import csr_matrix
 except ImportError:
     pass
@@ -30,21 +33,57 @@ except ImportError:
 
 __all__ = [
     'colorbar',
+    'colormap',
+    'colormap_lut',
+    'colormaps',
     'combine_all_sets',
     'group_keys_by_attribute',
     'group_keys_by_attributes',
+    'incidence_matrix',
     'network_order',
     'normalise_data',
     'postprocess',
     'process_data',
     'principal_stresses',
-    # 'plotvoxels',
+    'principal_stress_field',
+    'stress_principals',
+    'element_blocks',
     'identify_ranges',
     'mesh_from_shell_elements'
 ]
 
 
-def process_data(data, dtype, iptype, nodal, elements, n):
+def incidence_matrix(elements, n):
+    """Builds the element-node incidence matrix and the node degrees.
+
+    Parameters
+    ----------
+    elements : list
+        Node numbers for each element.
+    n : int
+        Number of nodes.
+
+    Returns
+    -------
+    obj
+        Sparse (m x n) csr_matrix with a 1 where an element connects a node.
+    array
+        (n x 1) number of elements connected to each node.
+
+    """
+
+    m = len(elements)
+    lengths = np.array([len(nodes) for nodes in elements], dtype=np.int64)
+    rows = np.repeat(np.arange(m), lengths)
+    cols = np.fromiter((node for nodes in elements for node in nodes), dtype=np.int64, count=int(lengths.sum()))
+
+    A = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(m, n))
+    degree = np.asarray(A.sum(0)).reshape((n, 1))
+
+    return A, degree
+
+
+def process_data(data, dtype, iptype, nodal, elements, n, incidence=None):
     """Process the raw data.
 
     Parameters
@@ -61,6 +100,8 @@ def process_data(data, dtype, iptype, nodal, elements, n):
         Node numbers for each element.
     n : int
         Number of nodes.
+    incidence : tuple
+        Cached (A, degree) from incidence_matrix or structure.element_incidence, None to build it.
 
     Returns
     -------
@@ -79,81 +120,44 @@ def process_data(data, dtype, iptype, nodal, elements, n):
     elif dtype == 'element':
 
         m = len(elements)
-        lengths = np.zeros(m, dtype=np.int64)
-        data_array = np.zeros((m, 20), dtype=np.float64)
 
-        iptypes = {'max': 0, 'min': 1, 'mean': 2, 'abs': 3}
+        # Integration point block, masked where an element has fewer points or no data
 
-        for ekey, item in data.items():
-            fdata = list(item.values())
-            j = int(ekey)
+        ekeys = np.array([int(ekey) for ekey in data], dtype=np.int64)
+        lengths = np.array([len(item) for item in data.values()], dtype=np.int64)
+        values = np.array([np.nan if i is None else i for item in data.values() for i in item.values()], dtype=np.float64)
 
-            if None in fdata:
-                fdata = [i for i in fdata if i is not None]
+        block = np.full((m, max(lengths.max() if len(lengths) else 0, 1)), np.nan)
+        rows = np.repeat(ekeys, lengths)
+        cols = np.arange(len(values)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        block[rows, cols] = values
+        block = np.ma.masked_invalid(block)
 
-            if fdata:
-                length = len(fdata)
-                lengths[j] = length
-                data_array[j, :length] = fdata
+        if iptype == 'max':
+            ve = block.max(axis=1)
+        elif iptype == 'min':
+            ve = block.min(axis=1)
+        elif iptype == 'mean':
+            ve = block.mean(axis=1)
+        elif iptype == 'abs':
+            ve = abs(block).max(axis=1)
 
-        rows, cols = [], []
+        ve = np.ma.filled(ve, 0.)[:, np.newaxis]
 
-        for ekey, nodes in enumerate(elements):
-            rows.extend([ekey] * len(nodes))
-            cols.extend(nodes)
-        vals = [1] * len(rows)
+        # Element to nodal values
 
-        A = csr_matrix((vals, (rows, cols)), shape=(m, n))
-        AT = A.transpose()
-
-        def _process(data_array, lengths, iptype):
-
-            m = len(lengths)
-            ve = np.zeros((m, 1))
-
-            for i in range(m):
-
-                if iptype == 0:
-                    ve[i] = max(data_array[i, :lengths[i]])
-
-                elif iptype == 1:
-                    ve[i] = min(data_array[i, :lengths[i]])
-
-                elif iptype == 2:
-                    ve[i] = np.mean(data_array[i, :lengths[i]])
-
-                elif iptype == 3:
-                    ve[i] = max(abs(data_array[i, :lengths[i]]))
-
-            return ve
-
-        def _nodal(rows, cols, nodal, ve, n):
-
-            vn = np.zeros((n, 1))
-
-            for i in range(len(rows)):
-
-                node = cols[i]
-                element = rows[i]
-
-                if nodal == 0:
-                    if ve[element] > vn[node]:
-                        vn[node] = ve[element]
-
-                elif nodal == 1:
-                    if ve[element] < vn[node]:
-                        vn[node] = ve[element]
-
-            return vn
-
-        ve = _process(data_array, lengths, iptypes[iptype])
+        if incidence is None:
+            incidence = incidence_matrix(elements, n)
+        A, degree = incidence
 
         if nodal == 'mean':
-            vsum = np.asarray(AT.dot(ve))
-            vn = vsum / AT.sum(1)
+            vn = np.asarray(A.T.dot(ve)) / degree
 
         else:
-            vn = _nodal(rows, cols, 0 if nodal == 'max' else 1, ve, n)
+            vn = np.zeros((n, 1))
+            erows = np.repeat(np.arange(m), np.diff(A.indptr))
+            ufunc = np.maximum if nodal == 'max' else np.minimum
+            ufunc.at(vn[:, 0], A.indices, ve[erows, 0])
 
     return vn, ve
 
@@ -187,6 +191,91 @@ def identify_ranges(data):
     return ranges
 
 
+colormaps = {
+    'default': None,
+    'jet':     [(-1.0, (0, 0, 128)), (-0.75, (0, 0, 255)), (-0.25, (0, 255, 255)), (0.25, (255, 255, 0)),
+                (0.75, (255, 0, 0)), (1.0, (128, 0, 0))],
+    'bwr':     [(-1.0, (0, 0, 255)), (0.0, (255, 255, 255)), (1.0, (255, 0, 0))],
+    'grey':    [(-1.0, (0, 0, 0)), (1.0, (255, 255, 255))],
+}
+
+_luts = {}
+
+
+def colormap_lut(cmap='default', n=256):
+    """Returns the lookup table of a colormap.
+
+    Parameters
+    ----------
+    cmap : str
+        Name of the colormap in colormaps, 'default' for the colorbar colours.
+    n : int
+        Number of entries, usually 256 to 4096.
+
+    Returns
+    -------
+    array
+        (n x 3) uint8 RGB values for -1 to 1 scaled data.
+
+    Notes
+    -----
+    - Tables are built once and cached.
+
+    """
+
+    key = (cmap, int(n))
+
+    if key not in _luts:
+
+        x = np.linspace(-1, 1, int(n))
+
+        if colormaps[cmap] is None:
+            rgb = colorbar(x[:, np.newaxis], input='array', type=255)
+        else:
+            positions, colors = zip(*colormaps[cmap])
+            rgb = np.column_stack([np.interp(x, positions, [c[i] for c in colors]) for i in range(3)])
+
+        _luts[key] = np.rint(rgb).astype(np.uint8)
+
+    return _luts[key]
+
+
+def colormap(fsc, cmap='default', n=256, type=255, nan=(128, 128, 128)):
+    """Maps -1 to 1 scaled values to RGB colours through a lookup table.
+
+    Parameters
+    ----------
+    fsc : array
+        (m,) or (m x 1) array of scaled data.
+    cmap : str
+        Name of the colormap in colormaps.
+    n : int
+        Number of lookup table entries.
+    type : int
+        RGB as 255 (uint8) or 1 (float) scaled.
+    nan : tuple
+        RGB 255 colour of NaN values.
+
+    Returns
+    -------
+    array
+        (m x 3) uint8 (type 255) or float32 (type 1) RGB values.
+
+    """
+
+    f = np.asarray(fsc, dtype=float).reshape(-1)
+    lut = colormap_lut(cmap, n)
+
+    index = np.rint((np.clip(np.nan_to_num(f), -1, 1) + 1) * (0.5 * (len(lut) - 1))).astype(np.intp)
+    rgb = lut[index]
+
+    missing = np.isnan(f)
+    if missing.any():
+        rgb[missing] = nan
+
+    return rgb if type == 255 else rgb.astype(np.float32) / 255
+
+
 def colorbar(fsc, input='array', type=255):
     """Creates RGB color information from -1 to 1 scaled values.
 
@@ -294,25 +383,50 @@ def combine_all_sets(sets_a, sets_b):
 
     Parameters
     ----------
-    sets_a : list
-        First nested list containing lists of element or node keys.
-    sets_b : list
-        Second nested list containing lists of element or node keys.
+    sets_a : dic
+        First dictionary of lists of element or node keys.
+    sets_b : dic
+        Second dictionary of lists of element or node keys.
 
     Returns
     -------
     dic
         A dictionary containing the minimum number of set combinations.
 
+    Notes
+    -----
+    - Integer keys are joined at once on sorted arrays with selections.combine_selections, other keys through a
+      dictionary of the sets_b membership of each key, both linear in the number of keys.
+
     """
 
-    comb = {}
-    for i in sets_a:
-        for j in sets_b:
-            for x in sets_a[i]:
-                if x in sets_b[j]:
-                    comb.setdefault(str(i) + ',' + str(j), []).append(x)
-    return comb
+    names_a = list(sets_a)
+    names_b = list(sets_b)
+    selections_a = [sets_a[i] for i in names_a]
+    selections_b = [sets_b[j] for j in names_b]
+
+    types = set(type(x) for selection in selections_a + selections_b for x in selection)
+
+    if not compas.IPY and all(issubclass(i, (int, np.integer)) for i in types):
+        combinations = combine_selections(selections_a, selections_b)
+
+    else:
+        index = {}
+        for j, selection in enumerate(selections_b):
+            for x in selection:
+                js = index.setdefault(x, [])
+                if not js or js[-1] != j:
+                    js.append(j)
+
+        combinations = []
+        for i, selection in enumerate(selections_a):
+            groups = {}
+            for x in selection:
+                for j in index.get(x, ()):
+                    groups.setdefault(j, []).append(x)
+            combinations.extend([i, j, groups[j]] for j in sorted(groups))
+
+    return dict((str(names_a[i]) + ',' + str(names_b[j]), keys) for i, j, keys in combinations)
 
 
 def group_keys_by_attribute(adict, name, tol='3f'):
@@ -332,14 +446,26 @@ def group_keys_by_attribute(adict, name, tol='3f'):
     dic
         Group dictionary.
 
+    Notes
+    -----
+    - Each distinct float is formatted once.
+
     """
+
     groups = {}
+    labels = {}
+    fmt = '{0:.' + str(tol) + '}'
+
     for key, item in adict.items():
         if name in item:
             value = item[name]
             if type(value) == float:
-                value = '{0:.{1}}'.format(value, tol)
+                label = labels.get(value) if value else None
+                if label is None:
+                    label = labels[value] = fmt.format(value)
+                value = label
             groups.setdefault(value, []).append(key)
+
     return groups
 
 
@@ -360,22 +486,33 @@ def group_keys_by_attributes(adict, names, tol='3f'):
     dic
         Group dictionary.
 
+    Notes
+    -----
+    - Each distinct float is formatted once.
+
     """
+
     groups = {}
+    labels = {}
+    fmt = '{0:.' + str(tol) + '}'
+
     for key, item in adict.items():
         values = []
         for name in names:
             if name in item:
                 value = item[name]
                 if type(value) == float:
-                    value = '{0:.{1}}'.format(value, tol)
+                    label = labels.get(value) if value else None
+                    if label is None:
+                        label = labels[value] = fmt.format(value)
+                    value = label
                 else:
                     value = str(value)
             else:
                 value = '-'
             values.append(value)
-        vkey = '_'.join(values)
-        groups.setdefault(vkey, []).append(key)
+        groups.setdefault('_'.join(values), []).append(key)
+
     return groups
 
 
@@ -449,18 +586,17 @@ def normalise_data(data, cmin, cmax):
         The maximum absolute unscaled value.
 
     """
-    f = np.asarray(data)
-    fmax = cmax if cmax is not None else max(abs(f))
-    fmin = cmin if cmin is not None else min(abs(f))
-    fabs = max([abs(fmin), abs(fmax)])
-    fscaled = f / fabs if fabs else f
-    fscaled[fscaled > +1] = +1
-    fscaled[fscaled < -1] = -1
+    f = np.asarray(data, dtype=float)
+    fmax = cmax if cmax is not None else np.nanmax(abs(f))
+    fmin = cmin if cmin is not None else np.nanmin(abs(f))
+    fabs = float(max([abs(fmin), abs(fmax)]))
+    fscaled = np.clip(f / fabs if fabs else f, -1, 1)
 
     return fscaled, fabs
 
 
-def postprocess(nodes, elements, ux, uy, uz, data, dtype, scale, cbar, ctype, iptype, nodal):
+def postprocess(nodes, elements, ux, uy, uz, data, dtype, scale, cbar, ctype, iptype, nodal, incidence=None,
+                cmap='default', n=256):
     """Post-process data from analysis results for given step and field.
 
     Parameters
@@ -484,96 +620,219 @@ def postprocess(nodes, elements, ux, uy, uz, data, dtype, scale, cbar, ctype, ip
     cbar : list
         Minimum and maximum limits on the colorbar.
     ctype : int
-        RGB color type, 1 or 255.
+        RGB color type, 1 (float) or 255 (uint8).
     iptype : str
         'mean', 'max' or 'min' of an element's integration point data.
     nodal : str
         'mean', 'max' or 'min' for nodal values.
+    incidence : tuple
+        Cached (A, degree) element-node incidence, None to build it.
+    cmap : str
+        Name of the colormap in colormaps.
+    n : int
+        Number of colormap lookup table entries.
 
     Returns
     -------
     float
         Time taken to process data.
-    list
-        Scaled deformed nodal co-ordinates.
-    list
-        Nodal colors.
+    array
+        (n x 3) scaled deformed nodal co-ordinates.
+    array
+        (n x 3) nodal colors.
     float
         Absolute maximum nodal data value.
-    list
-        Normalised data values.
-    list
-        Element colors.
+    array
+        (n,) normalised data values.
+    array
+        (m x 3) element colors, empty for nodal data.
     float
         Absolute maximum element data value.
 
+    Notes
+    -----
+    - Arrays are returned throughout, compas.rpc turns them into lists for Rhino.
+
     """
     tic = time()
 
-    dU = np.hstack((np.array(ux)[:, np.newaxis], np.array(uy)[:, np.newaxis], np.array(uz)[:, np.newaxis]))
-    U = [list(i) for i in list(np.array(nodes) + scale * dU)]
+    U = np.asarray(nodes, dtype=float) + scale * np.column_stack([ux, uy, uz]).astype(float)
 
-    vn, ve = process_data(data=data, dtype=dtype, iptype=iptype, nodal=nodal, elements=elements, n=len(U))
+    vn, ve = process_data(data=data, dtype=dtype, iptype=iptype, nodal=nodal, elements=elements, n=len(U),
+                          incidence=incidence)
 
-    fscaled, fabs = normalise_data(data=vn, cmin=cbar[0], cmax=cbar[1])
-    cnodes = colorbar(fsc=fscaled, input='array', type=ctype)
+    fscaled, fabs = normalise_data(data=vn.reshape(-1), cmin=cbar[0], cmax=cbar[1])
+    cnodes = colormap(fscaled, cmap=cmap, n=n, type=ctype)
 
     if dtype == 'element':
-        escaled, eabs = normalise_data(data=ve, cmin=cbar[0], cmax=cbar[1])
-        celements = colorbar(fsc=escaled, input='array', type=ctype)
-        celements_ = [list(i) for i in list(celements)]
+        escaled, eabs = normalise_data(data=ve.reshape(-1), cmin=cbar[0], cmax=cbar[1])
+        celements = colormap(escaled, cmap=cmap, n=n, type=ctype)
     else:
         eabs = 0
-        celements_ = []
+        celements = np.zeros((0, 3), dtype=cnodes.dtype)
+
+    return time() - tic, U, cnodes, float(fabs), fscaled, celements, float(eabs)
+
+
+stress_components = ['sxx', 'syy', 'szz', 'sxy', 'sxz', 'syz']
+
+
+def element_blocks(data, components, m=None):
+    """Stacks element results of several components into (elements x points) arrays.
+
+    Parameters
+    ----------
+    data : dict
+        Element data from structure.results for the Step.
+    components : list
+        Components to stack, e.g. ['sxx', 'syy', 'sxy'].
+    m : int
+        Number of elements, None to use the largest element key + 1.
+
+    Returns
+    -------
+    list
+        Sorted point labels (columns), e.g. ['ip1_sp1', 'ip1_sp5'].
+    dict
+        Component : (m x points) array, NaN where an element has no value.
+
+    """
+
+    items = [data[c] for c in components if c in data]
+    labels = sorted(set(id for item in items for values in item.values() for id in values))
+    column = {id: i for i, id in enumerate(labels)}
+
+    if m is None:
+        m = 1 + max([int(ekey) for item in items for ekey in item] or [-1])
+
+    blocks = {}
+
+    for c in components:
+
+        block = np.full((m, len(labels)), np.nan)
+
+        if c in data:
+            entries = [(int(ekey), column[id], value) for ekey, values in data[c].items() for id, value in values.items()]
+            if entries:
+                rows, cols, values = zip(*entries)
+                block[list(rows), list(cols)] = [np.nan if i is None else i for i in values]
 
-    toc = time() - tic
-    cnodes_ = [list(i) for i in list(cnodes)]
-    fabs_ = float(fabs)
-    fscaled_ = [float(i) for i in list(fscaled)]
+        blocks[c] = block
 
-    return toc, U, cnodes_, fabs_, fscaled_, celements_, float(eabs)
+    return labels, blocks
 
 
-# def plotvoxels(values, U, vdx, indexing=None):
-#     """Plot values as voxel data.
+def _face_corners(P):
 
-#     Parameters
-#     ----------
-#     values : array
-#         Normalised data at nodes.
-#     U : array
-#         Nodal co-ordinates.
-#     vdx : float
-#         Representative volume size for a voxel.
+    # Vector areas (f x 3) and corner tributary areas (f x m) of faces P (f x m x 3)
 
-#     Returns
-#     -------
-#     None
+    fn = 0.5 * np.cross(P, np.roll(P, -1, axis=1)).sum(axis=1)
+    c = P.mean(axis=1)[:, None, :] - P
+    corner = np.linalg.norm(np.cross(np.roll(P, -1, axis=1) - P, c), axis=2)
+    corner += np.linalg.norm(np.cross(np.roll(P, 1, axis=1) - P, c), axis=2)
 
-#     """
+    return fn, 0.25 * corner
 
-#     U = np.array(U)
-#     x = U[:, 0]
-#     y = U[:, 1]
-#     z = U[:, 2]
-#     xmin, xmax = min(x), max(x)
-#     ymin, ymax = min(y), max(y)
-#     zmin, zmax = min(z), max(z)
-#     X = np.linspace(xmin, xmax, (xmax - xmin) / vdx)
-#     Y = np.linspace(ymin, ymax, (ymax - ymin) / vdx)
-#     Z = np.linspace(zmin, zmax, (zmax - zmin) / vdx)
-#     Xm, Ym, Zm = np.meshgrid(X, Y, Z)
-#     # Zm, Ym, Xm = meshgrid(X, Y, Z, indexing='ij')
 
-#     f = abs(np.asarray(values))
-#     Am = np.squeeze(griddata(U, f, (Xm, Ym, Zm), method='linear', fill_value=0))
-#     Am[np.isnan(Am)] = 0
+def _principal_2d(sxx, syy, sxy):
+    """Closed-form principal values and directions of 2x2 symmetric tensors (any array shape)."""
 
-#     voxels = VtkViewer(data={'voxels': Am})
-#     voxels.setup()
-#     voxels.start()
+    centre = 0.5 * (sxx + syy)
+    radius = np.sqrt((0.5 * (sxx - syy))**2 + sxy**2)
+    theta = 0.5 * np.arctan2(2 * sxy, sxx - syy)
+    c, s = np.cos(theta), np.sin(theta)
 
-#     return Am
+    values = np.stack([centre + radius, centre - radius], axis=-1)
+    vectors = np.stack([np.stack([c, s], axis=-1), np.stack([-s, c], axis=-1)], axis=-1)
+
+    return values, vectors
+
+
+def _principal_3d(tensors):
+    """Batched principal values (descending) and directions of (..., 3, 3) symmetric tensors."""
+
+    shape = tensors.shape[:-2]
+    values = np.full(shape + (3,), np.nan)
+    vectors = np.full(shape + (3, 3), np.nan)
+
+    valid = ~np.isnan(tensors).any(axis=(-2, -1))
+
+    if valid.any():
+        w, v = np.linalg.eigh(tensors[valid])
+        values[valid] = w[..., ::-1]
+        vectors[valid] = v[..., ::-1]
+
+    return values, vectors
+
+
+def principal_stress_field(data, m=None):
+    """Computes principal stresses, directions and von Mises stress at all element points at once.
+
+    Parameters
+    ----------
+    data : dict
+        Element data from structure.results for the Step, with 'sxx', 'syy', 'sxy' and for solids 'szz', 'sxz', 'syz'.
+    m : int
+        Number of elements, None to use the largest element key + 1.
+
+    Returns
+    -------
+    dict
+        'labels': point labels (columns), 'values': (m x points x k) principal stresses in descending order,
+        'vectors': (m x points x k x k) unit directions as columns, 'smises': (m x points) von Mises stress.
+        k is 2 for plane stress (shells) and 3 when out-of-plane components exist (solids).
+
+    Notes
+    -----
+    - Plane stress uses closed-form 2x2 eigenpairs, solids a batched eigh of stacked 3x3 tensors.
+    - Missing components at a point with stress output are taken as zero, points without output are NaN.
+
+    """
+
+    labels, blocks = element_blocks(data, stress_components, m)
+    values, vectors, smises = stress_principals(blocks)
+
+    return {'labels': labels, 'values': values, 'vectors': vectors, 'smises': smises}
+
+
+def stress_principals(blocks):
+    """Computes principal stresses, directions and von Mises stress from stacked stress components.
+
+    Parameters
+    ----------
+    blocks : dict
+        Stress component : array of any shape, from element_blocks, missing components may be omitted.
+
+    Returns
+    -------
+    array
+        Principal stresses in descending order, (... x k).
+    array
+        Unit principal directions as columns, (... x k x k).
+    array
+        von Mises stress, (...).
+
+    """
+
+    shape = next(blocks[c] for c in stress_components if c in blocks).shape
+    blocks = {c: blocks.get(c, np.full(shape, np.nan)) for c in stress_components}
+
+    present = np.zeros(shape, dtype=bool)
+    for c in stress_components:
+        present |= ~np.isnan(blocks[c])
+
+    sxx, syy, szz, sxy, sxz, syz = [np.where(np.isnan(blocks[c]) & present, 0., blocks[c]) for c in stress_components]
+    solid = any(np.any(i[present] != 0) for i in [szz, sxz, syz])
+
+    if solid:
+        tensors = np.stack([sxx, sxy, sxz, sxy, syy, syz, sxz, syz, szz], axis=-1).reshape(sxx.shape + (3, 3))
+        values, vectors = _principal_3d(tensors)
+    else:
+        values, vectors = _principal_2d(sxx, syy, sxy)
+
+    smises = np.sqrt(0.5 * ((sxx - syy)**2 + (syy - szz)**2 + (szz - sxx)**2) + 3 * (sxy**2 + sxz**2 + syz**2))
+
+    return values, vectors, smises
 
 
 def principal_stresses(data):
@@ -599,25 +858,24 @@ def principal_stresses(data):
 
     Warnings
     --------
-    The function is experimental and works only for shell elements at the moment.
+    The function is experimental and works only for shell elements at the moment,
+    see principal_stress_field for solids and per integration point results.
     """
     components = ['sxx', 'sxy', 'syy']
     stype = ['max', 'min']
     section_points = ['sp1', 'sp5']
 
-    stress_results = list(zip(*[data[stress_name].values() for stress_name in components]))
-    spr = {sp: {st: np.zeros((len(stress_results))) for st in stype} for sp in section_points}
-    e = {sp: {k: np.zeros((2, len(stress_results))) for k in stype} for sp in section_points}
+    labels, blocks = element_blocks(data, components)
+    spr = {}
+    e = {}
+
     for sp in section_points:
-        for c, element_stresses in enumerate(stress_results):
-            # Stresses are computed as mean values of the integration points
-            stress_vector = [np.mean(np.array([v for k, v in i.items() if sp in k])) for i in element_stresses]
-            # The principal stresses and their directions are computed solving the eigenvalues problem
-            stress_matrix = np.array([(stress_vector[0], stress_vector[1]),
-                                      (stress_vector[1], stress_vector[2])])
-            w_sp, v_sp = np.linalg.eig(stress_matrix)
-            for v, k in enumerate(stype):
-                spr[sp][k][c] += w_sp[v]
-                e[sp][k][:, c] += v_sp[:, v]
+        # Stresses are computed as mean values of the integration points
+        columns = [i for i, label in enumerate(labels) if sp in label]
+        sxx, sxy, syy = [np.ma.masked_invalid(blocks[c][:, columns]).mean(axis=1).filled(np.nan) for c in components]
+        # The principal stresses and their directions are computed in closed form for all elements at once
+        values, vectors = _principal_2d(sxx, syy, sxy)
+        spr[sp] = {k: values[:, v] for v, k in enumerate(stype)}
+        e[sp] = {k: vectors[:, :, v].T for v, k in enumerate(stype)}
 
     return spr, e
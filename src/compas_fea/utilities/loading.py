@@ -0,0 +1,123 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas_fea.utilities.functions import _face_corners
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'line_load_vector',
+    'area_load_vector',
+]
+
+
+def line_load_vector(nodes, elements, w, moments=None):
+    """Consistent nodal loads of a uniform global line load on 2-node elements.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        [[a, b], ..] end nodes of each element.
+    w : list
+        [wx, wy, wz] load per unit length.
+    moments : list
+        True for the elements that take the end moments, e.g. beams, None for no moments.
+
+    Returns
+    -------
+    dict
+        'nodes' loaded nodes and 'forces' their [x, y, z, xx, yy, zz] forces and moments.
+
+    Notes
+    -----
+    - Each end takes w L / 2 and the fixed-end moment +- L^2 / 12 (ex x w) of a clamped beam.
+    - Returns plain lists, so that it can be called through compas.rpc.
+
+    """
+
+    X = np.asarray(nodes, dtype=float)
+    E = np.asarray(elements, dtype=int).reshape(-1, 2)
+    w = np.asarray(w, dtype=float)
+
+    d = X[E[:, 1]] - X[E[:, 0]]
+    L = np.linalg.norm(d, axis=1)
+
+    F = np.zeros((len(E), 2, 6))
+    F[:, :, :3] = 0.5 * L[:, None, None] * w
+
+    if moments is not None:
+        M = np.cross(d, w) * (L / 12.)[:, None] * np.asarray(moments, dtype=float)[:, None]
+        F[:, 0, 3:] = M
+        F[:, 1, 3:] = -M
+
+    return _collect(E.ravel(), F.reshape(-1, 6))
+
+
+def area_load_vector(nodes, elements, w, axes='global'):
+    """Consistent nodal loads of a uniform area load on shell elements.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Nodes of each element, triangles or quads.
+    w : list
+        [wx, wy, wz] load per unit area.
+    axes : str
+        'global' for global components, 'local' for a pressure wz against the element normal.
+
+    Returns
+    -------
+    dict
+        'nodes' loaded nodes and 'forces' their [x, y, z, xx, yy, zz] forces and moments.
+
+    Notes
+    -----
+    - Each node takes the load on its tributary area of the element, as for Mesh.vertex_area.
+    - A positive local pressure acts against the element normal, as the Abaqus P load.
+    - Returns plain lists, so that it can be called through compas.rpc.
+
+    """
+
+    X = np.asarray(nodes, dtype=float)
+    w = np.asarray(w, dtype=float)
+    keys = []
+    forces = []
+
+    for m in sorted(set(len(element) for element in elements)):
+
+        E = np.array([element for element in elements if len(element) == m], dtype=int)
+        fn, corner = _face_corners(X[E])
+
+        if axes == 'local':
+            load = -w[2] * fn / np.maximum(np.linalg.norm(fn, axis=1), 1e-12)[:, None]
+        else:
+            load = np.tile(w, (len(E), 1))
+
+        F = np.zeros((len(E), m, 6))
+        F[:, :, :3] = corner[:, :, None] * load[:, None, :]
+        keys.append(E.ravel())
+        forces.append(F.reshape(-1, 6))
+
+    if not keys:
+        return {'nodes': [], 'forces': []}
+
+    return _collect(np.concatenate(keys), np.vstack(forces))
+
+
+def _collect(keys, forces):
+
+    nodes, index = np.unique(keys, return_inverse=True)
+    total = np.zeros((len(nodes), 6))
+    np.add.at(total, index.ravel(), forces)
+    loaded = np.abs(total).max(axis=1) > 0
+
+    return {'nodes': nodes[loaded].tolist(), 'forces': total[loaded].tolist()}
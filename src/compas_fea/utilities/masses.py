@@ -0,0 +1,132 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas_fea.utilities.functions import _face_corners
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'lumped_masses',
+    'mass_properties',
+]
+
+
+solid_faces = {
+    4: [[0, 2, 1], [0, 1, 3], [1, 2, 3], [0, 3, 2]],
+    6: [[0, 2, 1], [3, 4, 5], [0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]],
+    8: [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]],
+}
+
+
+def lumped_masses(nodes, elements, kinds, factors):
+    """Masses of all elements from their length, area or volume, lumped equally to their nodes.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Nodes of each element.
+    kinds : list
+        Kind of each element, 'line' (factor density x area), 'shell' (density x thickness), 'solid' (density)
+        or 'point' (factor is the mass).
+    factors : list
+        Mass per unit length, area or volume of each element, or the mass of a point element.
+
+    Returns
+    -------
+    dict
+        'elements' mass of each element and 'nodes' (n,) lumped mass of each node.
+
+    Notes
+    -----
+    - Elements are grouped by kind and node count, each group is measured in one array operation.
+    - Solid volumes are summed over the faces (divergence theorem) for 4, 6 and 8 node solids.
+    - Returns plain lists, so that it can be called through compas.rpc.
+
+    """
+
+    X = np.asarray(nodes, dtype=float)
+    factors = np.asarray(factors, dtype=float)
+    emass = np.zeros(len(elements))
+    nmass = np.zeros(len(X))
+    groups = {}
+
+    for i, (element, kind) in enumerate(zip(elements, kinds)):
+        groups.setdefault((kind, len(element)), []).append(i)
+
+    for (kind, m), ids in groups.items():
+
+        ids = np.array(ids, dtype=int)
+        E = np.array([elements[i] for i in ids], dtype=int).reshape(len(ids), m)
+        P = X[E]
+
+        if kind == 'line':
+            measure = np.linalg.norm(P[:, -1] - P[:, 0], axis=1)
+
+        elif kind == 'shell':
+            measure = np.linalg.norm(_face_corners(P)[0], axis=1)
+
+        elif kind == 'solid':
+            measure = _volumes(P)
+
+        else:
+            measure = np.ones(len(ids))
+
+        emass[ids] = factors[ids] * measure
+        np.add.at(nmass, E.ravel(), np.repeat(emass[ids] / m, m))
+
+    return {'elements': emass.tolist(), 'nodes': nmass.tolist()}
+
+
+def mass_properties(nodes, masses):
+    """Total mass, centre of gravity and inertia tensor of nodal masses.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    masses : list
+        Mass of each node.
+
+    Returns
+    -------
+    dict
+        'total' mass, 'centre' [x, y, z] of gravity and 'inertia' (3 x 3) tensor about the centre of gravity.
+
+    """
+
+    X = np.asarray(nodes, dtype=float).reshape(-1, 3)
+    m = np.asarray(masses, dtype=float)
+    total = m.sum()
+
+    if not total:
+        return {'total': 0., 'centre': [0., 0., 0.], 'inertia': np.zeros((3, 3)).tolist()}
+
+    centre = m.dot(X) / total
+    r = X - centre
+    inertia = np.eye(3) * np.einsum('i,ij,ij', m, r, r) - np.einsum('i,ij,ik->jk', m, r, r)
+
+    return {'total': float(total), 'centre': centre.tolist(), 'inertia': inertia.tolist()}
+
+
+def _volumes(P, signed=False):
+
+    m = P.shape[1]
+    P = P - P.mean(axis=1)[:, None, :]
+    volume = np.zeros(len(P))
+
+    for face in solid_faces.get(m, []):
+        F = P[:, face]
+        c = F.mean(axis=1)
+        for i in range(len(face)):
+            volume += np.einsum('ij,ij->i', c, np.cross(F[:, i], F[:, (i + 1) % len(face)]))
+
+    # Positive for the right-handed (Abaqus) node order
+
+    return volume / 6. if signed else np.abs(volume) / 6.
@@ -0,0 +1,224 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import json
+import os
+
+
+__all__ = [
+    'MeshCache',
+    'mesh_cache',
+    'mesh_cache_key',
+]
+
+
+default_path = os.path.join(os.path.expanduser('~'), '.compas_fea', 'mesh_cache')
+default_bytes = 2**28
+
+
+class MeshCache(object):
+    """ Persistent on-disk cache of meshing results, keyed by a hash of the input geometry and parameters.
+
+    Parameters
+    ----------
+    path : str
+        Folder of the cache, None for the COMPAS_FEA_MESH_CACHE environment variable or ~/.compas_fea/mesh_cache.
+    max_bytes : int
+        Size limit of the cache, the least recently used entries are evicted beyond it.
+
+    Notes
+    -----
+    - Each entry is a JSON file {key}.json, its modification time records the last use.
+
+    """
+
+    def __init__(self, path=None, max_bytes=default_bytes):
+        self.path = path or os.environ.get('COMPAS_FEA_MESH_CACHE', default_path)
+        self.max_bytes = max_bytes
+
+    def filename(self, key):
+        return os.path.join(self.path, '{0}.json'.format(key))
+
+    def get(self, key):
+        """ Returns the cached data of a key.
+
+        Parameters
+        ----------
+        key : str
+            Key from mesh_cache_key.
+
+        Returns
+        -------
+        obj
+            Cached data, None if not cached.
+
+        """
+
+        filename = self.filename(key)
+
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+            os.utime(filename, None)
+            return data
+
+        except (IOError, OSError, ValueError):
+            return None
+
+    def set(self, key, data):
+        """ Stores data under a key and evicts the least recently used entries beyond max_bytes.
+
+        Parameters
+        ----------
+        key : str
+            Key from mesh_cache_key.
+        data : obj
+            JSON serialisable data, e.g. lists of points and elements.
+
+        Returns
+        -------
+        None
+
+        """
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        filename = self.filename(key)
+        temp = '{0}.{1}.tmp'.format(filename, os.getpid())
+
+        with open(temp, 'w') as f:
+            json.dump(data, f)
+
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(temp, filename)
+
+        self.evict()
+
+    def entries(self):
+        """ Returns the (last use, size, filename) of every entry, oldest first.
+
+        Returns
+        -------
+        list
+            Sorted entries.
+
+        """
+
+        if not os.path.exists(self.path):
+            return []
+
+        entries = []
+
+        for name in os.listdir(self.path):
+            if name.endswith('.json'):
+                filename = os.path.join(self.path, name)
+                entries.append((os.path.getmtime(filename), os.path.getsize(filename), filename))
+
+        return sorted(entries)
+
+    def evict(self):
+        """ Deletes the least recently used entries until the cache fits in max_bytes.
+
+        Returns
+        -------
+        int
+            Number of deleted entries.
+
+        """
+
+        entries = self.entries()
+        size = sum(i[1] for i in entries)
+        count = 0
+
+        for _, nbytes, filename in entries[:-1]:
+            if size <= self.max_bytes:
+                break
+            os.remove(filename)
+            size -= nbytes
+            count += 1
+
+        return count
+
+    def clear(self):
+        """ Deletes all entries.
+
+        Returns
+        -------
+        None
+
+        """
+
+        for _, _, filename in self.entries():
+            os.remove(filename)
+
+
+def mesh_cache(cache):
+    """ Resolves the cache argument of the meshing functions.
+
+    Parameters
+    ----------
+    cache : bool, str, obj
+        None or False for no cache, True for the default MeshCache, a folder path or a MeshCache object.
+
+    Returns
+    -------
+    obj
+        MeshCache object or None.
+
+    """
+
+    if not cache:
+        return None
+    if cache is True:
+        return MeshCache()
+    if isinstance(cache, MeshCache):
+        return cache
+
+    return MeshCache(path=cache)
+
+
+def mesh_cache_key(name, vertices, faces, **parameters):
+    """ Hashes the input geometry and parameters of a meshing function.
+
+    Parameters
+    ----------
+    name : str
+        Name of the meshing function.
+    vertices : list
+        [[x, y, z], ..] co-ordinates of the input vertices.
+    faces : list
+        Vertex indices of the input faces (or cells).
+    parameters : dict
+        Meshing parameters, e.g. volume, target, min_angle or factor.
+
+    Returns
+    -------
+    str
+        SHA-1 hex digest.
+
+    Notes
+    -----
+    - Co-ordinates are hashed at their full float precision.
+
+    """
+
+    data = {
+        'name':       name,
+        'vertices':   [[float(i) for i in vertex] for vertex in vertices],
+        'faces':      [_integers(face) for face in faces],
+        'parameters': parameters,
+    }
+
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _integers(face):
+
+    try:
+        return [int(i) for i in face]
+    except TypeError:
+        return [_integers(i) for i in face]
@@ -2,23 +2,34 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from compas.geometry import add_vectors
-from compas.geometry import centroid_points
-from compas.geometry import cross_vectors
+import compas
+
 from compas.geometry import length_vector
-from compas.geometry import normalize_vector
-from compas.geometry import scale_vector
 from compas.geometry import subtract_vectors
 
+from compas_fea.fea.workers import map_workers
+from compas_fea.utilities.functions import _face_corners
+from compas_fea.utilities.meshcache import mesh_cache
+from compas_fea.utilities.meshcache import mesh_cache_key
+
 try:
+    from numpy import add
+    from numpy import arange
     from numpy import array
-    from numpy import arctan2
-    from numpy import cos
-    from numpy import dot
+    from numpy import concatenate
+    from numpy import cross
+    from numpy import cumsum
+    from numpy import einsum
+    from numpy import maximum
     from numpy import newaxis
-    from numpy import pi
-    from numpy import sin
-    from numpy.linalg import inv
+    from numpy import repeat
+    from numpy import roll
+    from numpy import split
+    from numpy import stack
+    from numpy import tile
+    from numpy import vstack
+    from numpy import zeros
+    from numpy.linalg import norm
 except ImportError:
     pass
 
@@ -37,7 +48,9 @@ except ImportError:
 __all__ = [
     'discretise_faces',
     'extrude_mesh',
+    'extrude_layers',
     'tets_from_vertices_faces',
+    'tributary_areas',
 ]
 
 
@@ -68,77 +81,195 @@ def extrude_mesh(structure, mesh, layers, thickness, mesh_name, links_name, bloc
     Notes
     -----
     - Extrusion is along the Mesh vertex normals.
+    - The layer geometry is built by extrude_layers, and nodes and elements are added in bulk.
+    - The Mesh faces must be triangles or quads.
 
     """
-    ki = {}
-    faces = []
-    links = []
+    vkeys = list(mesh.vertices())
+    index = {key: i for i, key in enumerate(vkeys)}
+    vertices = [mesh.vertex_coordinates(key) for key in vkeys]
+    faces = [[index[i] for i in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+
+    if compas.IPY:
+        from compas.rpc import Proxy
+        extruded = Proxy('compas_fea.utilities.meshing').extrude_layers(vertices, faces, layers, thickness)
+    else:
+        extruded = extrude_layers(vertices, faces, layers, thickness)
+
+    nodes = structure.add_nodes_from_xyz(extruded['xyz'])
     blocks = []
+    shells = []
     slices = {i: [] for i in range(layers)}
 
-    for key in mesh.vertices():
+    for m, etype in [(3, 'PentahedronElement'), (4, 'HexahedronElement')]:
 
-        normal = normalize_vector(mesh.vertex_normal(key))
-        xyz = mesh.vertex_coordinates(key)
-        ki['{0}_0'.format(key)] = structure.add_node(xyz)
+        group = extruded['blocks'][str(m)]
 
-        for i in range(layers):
+        if blocks_name and group['elements']:
+            ekeys = _add_elements(structure, nodes, group['elements'], etype, group['centroids'])
+            blocks.extend(i for i in ekeys if i is not None)
+            for i in range(layers):
+                slices[i].extend(j for j in ekeys[i::layers] if j is not None)
 
-            xyzi = add_vectors(xyz, scale_vector(normal, (i + 1) * thickness))
-            ki['{0}_{1}'.format(key, i + 1)] = structure.add_node(xyzi)
+        if mesh_name and group['shells']:
+            ekeys = _add_elements(structure, nodes, group['shells'], 'ShellElement', group['top'])
+            shells.extend(i for i in ekeys if i is not None)
 
-            if links_name:
+    if blocks_name:
+        structure.add_set(name=blocks_name, type='element', selection=blocks)
+        for i in range(layers):
+            structure.add_set(name='{0}_layer_{1}'.format(blocks_name, i), type='element', selection=slices[i])
+
+    if mesh_name:
+        structure.add_set(name=mesh_name, type='element', selection=shells)
 
-                node1 = ki['{0}_{1}'.format(key, i + 0)]
-                node2 = ki['{0}_{1}'.format(key, i + 1)]
-                L = subtract_vectors(xyzi, xyz)
-                ez = normalize_vector(L)
-                try:
-                    ey = cross_vectors(ez, [1, 0, 0])
-                except Exception:
-                    pass
-                axes = {'ez': ez, 'ey': ey}
+    if links_name:
 
-                ekey = structure.add_element(nodes=[node1, node2], type='SpringElement', thermal=False, axes=axes)
-                structure.elements[ekey].A = mesh.vertex_area(key)
+        links = extruded['links']
+        axes = [{'ez': ez, 'ey': ey} for ez, ey in zip(links['ez'], links['ey'])]
+        ekeys = _add_elements(structure, nodes, links['elements'], 'SpringElement', links['centroids'], axes=axes)
+        for ekey, A, L in zip(ekeys, links['A'], links['L']):
+            if ekey is not None:
+                structure.elements[ekey].A = A
                 structure.elements[ekey].L = L
-                links.append(ekey)
+        ekeys = [i for i in ekeys if i is not None]
 
-    for face in mesh.faces():
+        if ekeys:
+            structure.add_set(name=links_name, type='element', selection=ekeys)
 
-        vs = mesh.face_vertices(face)
 
-        for i in range(layers):
+def extrude_layers(vertices, faces, layers, thickness):
+    """Builds the nodes and the connectivity of the layers extruded from a mesh along its vertex normals.
 
-            bot = ['{0}_{1}'.format(j, i + 0) for j in vs]
-            top = ['{0}_{1}'.format(j, i + 1) for j in vs]
+    Parameters
+    ----------
+    vertices : list
+        [[x, y, z], ..] co-ordinates of the mesh vertices.
+    faces : list
+        Vertex indices of each face, triangles or quads.
+    layers : int
+        Number of layers.
+    thickness : float
+        Layer thickness.
 
-            if blocks_name:
+    Returns
+    -------
+    dict
+        'xyz' layer node co-ordinates, 'blocks' {'3': .., '4': ..} pentahedra and hexahedra per face type
+        with 'elements', 'centroids', 'shells' and 'top' (shell centroids), and 'links' between layers with
+        'elements', 'centroids', 'A' (vertex tributary area), 'L', 'ez' and 'ey'.
 
-                etype = 'PentahedronElement' if len(vs) == 3 else 'HexahedronElement'
-                nodes = [ki[j] for j in bot + top]
-                ekey = structure.add_element(nodes=nodes, type=etype, thermal=False)
-                blocks.append(ekey)
-                slices[i].append(ekey)
+    Notes
+    -----
+    - Node j * (layers + 1) + i is vertex j on layer i, elements of a face are ordered by layer.
+    - Vertex normals are the normalised sums of the area weighted normals of the adjacent faces.
+    - Raises a ValueError for faces with more than 4 vertices, which have no solid element.
+    - Returns plain lists, so that it can be called through compas.rpc.
 
-            if (i == layers - 1) and mesh_name:
-                nodes = [ki[j] for j in top]
-                ekey = structure.add_element(nodes=nodes, type='ShellElement', acoustic=False, thermal=False)
-                faces.append(ekey)
+    """
+    polygons = sorted(set(len(face) for face in faces) - set([3, 4]))
 
-    if blocks_name:
-        structure.add_set(name=blocks_name, type='element', selection=blocks)
-        for i in range(layers):
-            structure.add_set(name='{0}_layer_{1}'.format(blocks_name, i), type='element', selection=slices[i])
+    if polygons:
+        raise ValueError('***** Only triangle and quad faces can be extruded, got faces with {0} vertices *****'.format(
+            ', '.join(str(i) for i in polygons)))
 
-    if mesh_name:
-        structure.add_set(name=mesh_name, type='element', selection=faces)
+    V = array(vertices, dtype=float)
+    n = layers + 1
+
+    # Vertex normals and tributary areas
+
+    normals, areas = _normals_areas(V, faces)
+    normals /= maximum(norm(normals, axis=1), 1e-12)[:, newaxis]
+
+    # Layer nodes
+
+    t = thickness * arange(n)
+    xyz = (V[:, newaxis, :] + t[newaxis, :, newaxis] * normals[:, newaxis, :]).reshape(-1, 3)
+
+    # Blocks and shells
+
+    blocks = {}
+    step = arange(layers)[newaxis, :, newaxis]
+
+    for m in [3, 4]:
+        F = array([face for face in faces if len(face) == m], dtype=int).reshape(-1, m) * n
+        bot = F[:, newaxis, :] + step
+        elements = concatenate([bot, bot + 1], axis=2).reshape(-1, 2 * m)
+        shells = F + layers
+        blocks[str(m)] = {
+            'elements':  elements.tolist(),
+            'centroids': xyz[elements].mean(axis=1).tolist(),
+            'shells':    shells.tolist(),
+            'top':       xyz[shells].mean(axis=1).tolist(),
+        }
+
+    # Links
+
+    bot = (arange(len(V)) * n)[:, newaxis] + arange(layers)[newaxis, :]
+    elements = stack([bot, bot + 1], axis=2).reshape(-1, 2)
+    ez = repeat(normals, layers, axis=0)
+    links = {
+        'elements':  elements.tolist(),
+        'centroids': xyz[elements].mean(axis=1).tolist(),
+        'A':         repeat(areas, layers).tolist(),
+        'L':         (ez * tile(t[1:], len(V))[:, newaxis]).tolist(),
+        'ez':        ez.tolist(),
+        'ey':        cross(ez, [1, 0, 0]).tolist(),
+    }
+
+    return {'xyz': xyz.tolist(), 'blocks': blocks, 'links': links}
+
+
+def tributary_areas(vertices, faces):
+    """Tributary areas of all the vertices of a polygon mesh.
+
+    Parameters
+    ----------
+    vertices : list
+        [[x, y, z], ..] co-ordinates of the mesh vertices.
+    faces : list
+        Vertex indices of each face.
+
+    Returns
+    -------
+    list
+        Tributary area of each vertex.
+
+    Notes
+    -----
+    - Each face corner contributes the area between the vertex, its two edge midpoints and the face centroid,
+      as Mesh.vertex_area.
+    - Returns a plain list, so that it can be called through compas.rpc.
+
+    """
+
+    return _normals_areas(array(vertices, dtype=float), faces)[1].tolist()
+
+
+def _normals_areas(V, faces):
+
+    normals = zeros(V.shape)
+    areas = zeros(len(V))
+
+    for m in sorted(set(len(face) for face in faces)):
+        F = array([face for face in faces if len(face) == m], dtype=int)
+        fn, corner = _face_corners(V[F])
+        for i in range(m):
+            add.at(normals, F[:, i], fn)
+            add.at(areas, F[:, i], corner[:, i])
+
+    return normals, areas
+
+
+def _add_elements(structure, nodes, elements, type, centroids, axes={}):
 
-    if links:
-        structure.add_set(name=links_name, type='element', selection=links)
+    # Elements given by positions in the list of added node keys
 
+    return structure.add_elements_bulk([[nodes[i] for i in element] for element in elements], type=type, axes=axes,
+                                       centroids=centroids)
 
-def discretise_faces(vertices, faces, target, min_angle=15, factor=3):
+
+def discretise_faces(vertices, faces, target, min_angle=15, factor=3, workers=1, weld=False, cache=None):
     """Make discretised triangles from input coarse triangles data.
 
     Parameters
@@ -153,94 +284,139 @@ def discretise_faces(vertices, faces, target, min_angle=15, factor=3):
         Minimum internal angle of triangles.
     factor : float
         Factor on the maximum area of each triangle.
+    workers : int
+        Number of processes triangulating faces in parallel.
+    weld : bool
+        Return one welded mesh instead of the separate triangulation of each face.
+    cache : bool, str, obj
+        True, a folder or a MeshCache to reuse the result of identical input, see utilities.meshcache.
 
     Returns
     -------
     list
-        Vertices of the discretised trianlges.
+        Vertices of the discretised triangles, per face or welded.
     list
-        Vertex numbers of the discretised trianlges.
+        Vertex numbers of the discretised triangles, per face or welded.
 
     Notes
     -----
     - An experimental script.
+    - Each shared coarse edge is seeded once, so that adjacent faces are conforming.
+    - Faces that fail to triangulate are reported and left out.
 
     """
-    points_all = []
-    faces_all = []
+    cache = mesh_cache(cache)
 
+    if cache:
+        cache_key = mesh_cache_key('discretise_faces', vertices, faces, target=target, min_angle=min_angle, factor=factor,
+                                   weld=weld)
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+
+    V = array(vertices, dtype=float)
     Amax = factor * 0.5 * target**2
 
-    for count, face in enumerate(faces):
+    # Seed the unique edges
 
-        # Seed
+    seeds = [V]
+    edges = {}
+    m = len(V)
 
-        face.append(face[0])
+    for face in faces:
+        for u, v in zip(face, list(face[1:]) + [face[0]]):
+            key = (min(u, v), max(u, v))
+            if key not in edges:
+                n = max([1, int(length_vector(subtract_vectors(vertices[v], vertices[u])) / target)])
+                t = arange(1, n)[:, newaxis] / n
+                seeds.append(V[key[0]] + t * (V[key[1]] - V[key[0]]))
+                edges[key] = list(range(m, m + n - 1))
+                m += n - 1
 
-        points = []
-        facets = []
+    seeds = vstack(seeds)
+    loops = []
 
-        for u, v in zip(face[:-1], face[1:]):
-            sp = vertices[u]
-            ep = vertices[v]
-            vec = subtract_vectors(ep, sp)
-            length = length_vector(vec)
-            div = length / target
-            n = max([1, int(div)])
-            for j in range(n):
-                points.append(add_vectors(sp, scale_vector(vec, j / n)))
-        facets = [[i, i + 1] for i in range(len(points) - 1)]
-        facets.append([len(points) - 1, 0])
+    for face in faces:
+        loop = []
+        for u, v in zip(face, list(face[1:]) + [face[0]]):
+            loop.append(u)
+            loop.extend(edges[(u, v)] if u < v else edges[(v, u)][::-1])
+        loops.append(loop)
 
-        # Starting orientation
+    # Plane of each face from its Newell normal
 
-        cent = centroid_points(points)
-        vec1 = subtract_vectors(points[1], points[0])
-        vec2 = subtract_vectors(cent, points[0])
-        vecn = cross_vectors(vec1, vec2)
+    sizes = array([len(face) for face in faces])
+    padded = array([list(face) + [face[-1]] * (sizes.max() - len(face)) for face in faces])
+    P = V[padded]
+    normal = cross(P, roll(P, -1, axis=1)).sum(axis=1)
+    normal /= norm(normal, axis=1)[:, newaxis]
+    e1 = P[:, 1] - P[:, 0]
+    e1 -= einsum('ij,ij->i', e1, normal)[:, newaxis] * normal
+    e1 /= norm(e1, axis=1)[:, newaxis]
+    basis = stack([e1, cross(normal, e1)], axis=1)
+    origin = P[:, 0]
 
-        # Rotate about x
+    # Project all seeds onto their face planes
 
-        points = array(points).transpose()
-        phi = -arctan2(vecn[2], vecn[1]) + 0.5 * pi
-        Rx = array([[1, 0, 0], [0, cos(phi), -sin(phi)], [0, sin(phi), cos(phi)]])
-        vecn_x = dot(Rx, array(vecn)[:, newaxis])
-        points_x = dot(Rx, points)
-        Rx_inv = inv(Rx)
+    counts = array([len(loop) for loop in loops])
+    owner = repeat(arange(len(loops)), counts)
+    uv = einsum('nij,nj->ni', basis[owner], seeds[concatenate(loops)] - origin[owner])
+    items = [(i, min_angle, Amax) for i in split(uv, cumsum(counts)[:-1])]
 
-        # Rotate about y
+    results = map_workers(_triangulate_face, items, workers=workers, processes=True)
 
-        psi = +arctan2(vecn_x[2, 0], vecn_x[0, 0]) - 0.5 * pi
-        Ry = array([[cos(psi), 0, sin(psi)], [0, 1, 0], [-sin(psi), 0, cos(psi)]])
-        points_y = dot(Ry, points_x)
-        Ry_inv = inv(Ry)
+    # Back projection and welding
 
-        V = points_y.transpose()
+    points_all = []
+    faces_all = []
+    welded = [seeds]
 
-        try:
+    for count, (loop, result) in enumerate(zip(loops, results)):
 
-            new_points = [list(i) for i in list(V[:, :2])]
+        if result is None:
+            print('***** ERROR discretising face {0} *****'.format(count))
+            continue
 
-            info = MeshInfo_tri()
-            info.set_points(new_points)
-            info.set_facets(facets)
+        uvs, tris = result
+        xyz = origin[count] + uvs.dot(basis[count])
 
-            tris = build_tri(info, allow_boundary_steiner=False, min_angle=min_angle, max_volume=Amax)
-            new_points = [list(j) + [V[0, 2]] for j in tris.points]
-            new_tris = [list(j) for j in tris.elements]
+        if weld:
+            ids = array(loop + list(range(m, m + len(uvs) - len(loop))))
+            welded.append(xyz[len(loop):])
+            faces_all.extend(ids[tris].tolist())
+            m += len(uvs) - len(loop)
+        else:
+            points_all.append(xyz.tolist())
+            faces_all.append(tris.tolist())
 
-            V = array(new_points)
-            points = dot(Ry_inv, V.transpose())
-            points_all.append([list(i) for i in list(dot(Rx_inv, points).transpose())])
-            faces_all.append(new_tris)
+    if weld:
+        points_all = vstack(welded).tolist()
 
-        except Exception:
-            print('***** ERROR discretising face {0} *****'.format(count))
+    if cache:
+        cache.set(cache_key, [points_all, faces_all])
 
     return points_all, faces_all
 
 
-def tets_from_vertices_faces(vertices, faces, volume=None):
+def _triangulate_face(item):
+
+    uv, min_angle, Amax = item
+    facets = [[i, (i + 1) % len(uv)] for i in range(len(uv))]
+
+    try:
+        info = MeshInfo_tri()
+        info.set_points(uv.tolist())
+        info.set_facets(facets)
+
+        tris = build_tri(info, allow_boundary_steiner=False, min_angle=min_angle, max_volume=Amax)
+
+        return array(tris.points, dtype=float), array(tris.elements, dtype=int)
+
+    except Exception:
+        return None
+
+
+def tets_from_vertices_faces(vertices, faces, volume=None, cache=None):
     """Generate tetrahedron points and elements with MeshPy (TetGen).
 
     Parameters
@@ -251,6 +427,8 @@ def tets_from_vertices_faces(vertices, faces, volume=None):
         List of lists of face indices for the input surface mesh.
     volume : float
         Volume constraint for each tetrahedron element.
+    cache : bool, str, obj
+        True, a folder or a MeshCache to reuse the result of identical input, see utilities.meshcache.
 
     Returns
     -------
@@ -260,6 +438,14 @@ def tets_from_vertices_faces(vertices, faces, volume=None):
         Indices of points for each tetrahedron element.
 
     """
+    cache = mesh_cache(cache)
+
+    if cache:
+        cache_key = mesh_cache_key('tets_from_vertices_faces', vertices, faces, volume=volume)
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+
     try:
         info = MeshInfo()
         info.set_points(vertices)
@@ -269,6 +455,9 @@ def tets_from_vertices_faces(vertices, faces, volume=None):
         points = [list(i) for i in list(tets.points)]
         elements = [list(i) for i in list(tets.elements)]
 
+        if cache:
+            cache.set(cache_key, [points, elements])
+
         return points, elements
 
     except Exception:
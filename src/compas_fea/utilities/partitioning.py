@@ -0,0 +1,166 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas_fea.utilities.functions import incidence_matrix
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+try:
+    from scipy.sparse import diags
+    from scipy.sparse.linalg import lobpcg
+except ImportError:
+    pass
+
+
+__all__ = [
+    'element_adjacency',
+    'partition_elements',
+]
+
+
+def element_adjacency(elements, n, ncommon=1, incidence=None):
+    """Builds the element adjacency (dual) graph of a mesh.
+
+    Parameters
+    ----------
+    elements : list
+        Node numbers for each element.
+    n : int
+        Number of nodes.
+    ncommon : int
+        Number of shared nodes for two elements to be adjacent, e.g. 1 for any shared node, 3 for shared faces of tets.
+    incidence : tuple
+        Cached (A, degree) element-node incidence, None to build it.
+
+    Returns
+    -------
+    obj
+        Sparse (m x m) csr_matrix with a 1 for each pair of adjacent elements.
+
+    """
+
+    A = (incidence or incidence_matrix(elements, n))[0]
+    G = (A.dot(A.T)).tocsr()
+    G.setdiag(0)
+    G.data = (G.data >= ncommon).astype(float)
+    G.eliminate_zeros()
+
+    return G
+
+
+def partition_elements(nodes, elements, parts, method='rcb', ncommon=1, weights=None, incidence=None):
+    """Partitions the elements into balanced parts by recursive bisection.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Node numbers for each element.
+    parts : int
+        Number of parts.
+    method : str
+        'rcb' recursive coordinate bisection of the element centroids, or 'spectral' bisection by the Fiedler
+        vector of the element adjacency graph.
+    ncommon : int
+        Number of shared nodes for two elements to be adjacent.
+    weights : list
+        Work weight of each element, None for equal weights.
+    incidence : tuple
+        Cached (A, degree) element-node incidence, None to build it.
+
+    Returns
+    -------
+    dict
+        'elements' (m,) part of each element, 'nodes' (n,) owning part of each node (lowest adjacent part, -1 for
+        unused nodes), 'interface' nodes shared by several parts, 'sizes' part weights, 'edge_cut' number of
+        adjacent element pairs in different parts and 'imbalance' largest over mean part weight.
+
+    Notes
+    -----
+    - A part count that is not a power of two is split in proportion, e.g. 3 into 1 and 2.
+    - RCB cuts across the longest extent of each subdomain, spectral bisection follows the mesh connectivity.
+
+    """
+
+    xyz = np.asarray(nodes, dtype=float)
+    m, n = len(elements), len(xyz)
+    A = (incidence or incidence_matrix(elements, n))[0]
+    G = element_adjacency(elements, n, ncommon=ncommon, incidence=(A, None))
+    w = np.ones(m) if weights is None else np.asarray(weights, dtype=float)
+    centroids = A.dot(xyz) / np.maximum(np.asarray(A.sum(axis=1)), 1)
+
+    labels = np.zeros(m, dtype=int)
+    stack = [(np.arange(m), int(parts), 0)]
+
+    while stack:
+
+        ids, k, offset = stack.pop()
+
+        if k == 1 or len(ids) < 2:
+            labels[ids] = offset
+            continue
+
+        if method == 'spectral':
+            order = np.argsort(_fiedler(G[ids][:, ids], centroids[ids]), kind='stable')
+        else:
+            extent = centroids[ids].max(axis=0) - centroids[ids].min(axis=0)
+            order = np.argsort(centroids[ids, np.argmax(extent)], kind='stable')
+
+        k1 = k // 2
+        cumulative = np.cumsum(w[ids[order]])
+        split = int(np.searchsorted(cumulative, cumulative[-1] * k1 / k, side='right'))
+        split = min(max(split, 1), len(ids) - 1)
+
+        stack.append((ids[order[:split]], k1, offset))
+        stack.append((ids[order[split:]], k - k1, offset + k1))
+
+    # Nodes and interfaces
+
+    coo = A.tocoo()
+    lowest = np.full(n, parts, dtype=int)
+    highest = np.full(n, -1, dtype=int)
+    np.minimum.at(lowest, coo.col, labels[coo.row])
+    np.maximum.at(highest, coo.col, labels[coo.row])
+    owner = np.where(highest >= 0, lowest, -1)
+    interface = np.nonzero((highest >= 0) & (highest != lowest))[0]
+
+    G = G.tocoo()
+    sizes = np.bincount(labels, weights=w, minlength=parts)
+
+    return {
+        'elements':  labels,
+        'nodes':     owner,
+        'interface': interface,
+        'sizes':     sizes,
+        'edge_cut':  int(np.sum(labels[G.row] != labels[G.col]) // 2),
+        'imbalance': float(sizes.max() / sizes.mean()),
+    }
+
+
+def _fiedler(G, centroids):
+
+    m = G.shape[0]
+    degree = np.asarray(G.sum(axis=1)).ravel()
+
+    if m < 3 or not degree.any():
+        return centroids[:, np.argmax(centroids.max(axis=0) - centroids.min(axis=0))]
+
+    L = diags(degree) - G
+
+    if m <= 500:
+        return np.linalg.eigh(L.toarray())[1][:, 1]
+
+    # Start from the coordinate ordering, orthogonal to the constant null vector
+
+    X = centroids[:, [np.argmax(centroids.max(axis=0) - centroids.min(axis=0))]].copy()
+    X -= X.mean()
+    Y = np.ones((m, 1)) / np.sqrt(m)
+    M = diags(1. / np.maximum(degree, 1))
+    _, vectors = lobpcg(L, X, Y=Y, M=M, largest=False, tol=1e-4, maxiter=200)
+
+    return vectors[:, 0]
@@ -0,0 +1,229 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from time import time
+
+from compas_fea.utilities.functions import colormap
+from compas_fea.utilities.functions import normalise_data
+from compas_fea.utilities.functions import process_data
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'plot_inputs',
+    'plot_geometry',
+]
+
+
+shell_types = ['ShellElement', 'MembraneElement']
+
+solid_faces = {
+    4: [[0, 2, 1, 1], [1, 2, 3, 3], [1, 3, 0, 0], [0, 3, 2, 2]],
+    6: [[0, 2, 1, 1], [3, 4, 5, 5], [0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]],
+    8: [[0, 1, 2, 3], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]],
+}
+
+
+def plot_inputs(structure, step, field, mode=''):
+    """Collects the plain node, element and results data of a Step and field for plot_geometry.
+
+    Parameters
+    ----------
+    structure : obj
+        Structure object.
+    step : str
+        Name of the Step.
+    field : str
+        Field to plot, e.g. 'um', 'sxx', 'sm1'.
+    mode : int
+        Mode or frequency number, for modal, harmonic or buckling analysis.
+
+    Returns
+    -------
+    dict
+        Keyword arguments nodes, elements, etypes, ux, uy, uz, data and dtype.
+
+    Notes
+    -----
+    - Pure Python, so that the result can be sent to plot_geometry through compas.rpc from Rhino.
+
+    """
+
+    if structure.results.is_derived(field):
+        structure.results.field(step, '{0}{1}'.format(field, mode))
+
+    ekeys = sorted(structure.elements, key=int)
+    nkeys = sorted(structure.nodes, key=int)
+    nodal_data = structure.results[step]['nodal']
+
+    inputs = {
+        'nodes':    structure.nodes_xyz(),
+        'elements': [structure.elements[i].nodes for i in ekeys],
+        'etypes':   [structure.elements[i].__name__ for i in ekeys],
+    }
+
+    for i in 'xyz':
+        inputs['u' + i] = [nodal_data['u{0}{1}'.format(i, mode)][key] for key in nkeys]
+
+    try:
+        inputs['data'] = [nodal_data['{0}{1}'.format(field, mode)][key] for key in nkeys]
+        inputs['dtype'] = 'nodal'
+
+    except Exception:
+        inputs['data'] = structure.results[step]['element'][field]
+        inputs['dtype'] = 'element'
+
+    return inputs
+
+
+def plot_geometry(nodes, elements, etypes, ux, uy, uz, data, dtype, scale=1.0, cbar=[None, None], ctype=255,
+                  iptype='mean', nodal='mean', radius=0.05, sides=4, hull=True, incidence=None, cmap='default', lut=256):
+    """Builds the coloured plot mesh of a field on the deformed shape, independent of the CAD software.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Node numbers that each element connects.
+    etypes : list
+        Element class names, e.g. 'ShellElement', used to tell shells from solids.
+    ux : list
+        List of nodal x displacements.
+    uy : list
+        List of nodal y displacements.
+    uz : list
+        List of nodal z displacements.
+    data : list, dict
+        Unprocessed nodal list or element dictionary data.
+    dtype : str
+        'nodal' or 'element'.
+    scale : float
+        Scale displacements for the deformed plot.
+    cbar : list
+        Minimum and maximum limits on the colorbar.
+    ctype : int
+        RGB color type, 1 (float) or 255 (uint8).
+    iptype : str
+        'mean', 'max' or 'min' of an element's integration point data.
+    nodal : str
+        'mean', 'max' or 'min' for nodal values.
+    radius : float
+        Radius of the pipes swept along line elements.
+    sides : int
+        Number of sides of the pipes.
+    hull : bool
+        Keep only the outer faces of solid elements.
+    incidence : tuple
+        Cached (A, degree) element-node incidence, None to build it.
+    cmap : str
+        Name of the colormap in functions.colormaps.
+    lut : int
+        Number of colormap lookup table entries.
+
+    Returns
+    -------
+    dict
+        'vertices' (v x 3), 'faces' (f x 4, triangles repeat their last vertex), 'colors' (v x 3) arrays,
+        'fabs' and 'eabs' absolute maximum nodal and element values, and 'toc' processing time.
+
+    Notes
+    -----
+    - The first len(nodes) vertices are the deformed nodes, followed by the pipe vertices of the line elements.
+    - Pipes take the element colour for element data and the end node colours for nodal data.
+
+    """
+
+    tic = time()
+
+    n = len(nodes)
+    U = np.asarray(nodes, dtype=float) + scale * np.column_stack([ux, uy, uz]).astype(float)
+
+    vn, ve = process_data(data=data, dtype=dtype, iptype=iptype, nodal=nodal, elements=elements, n=n,
+                          incidence=incidence)
+
+    fscaled, fabs = normalise_data(data=vn.reshape(-1), cmin=cbar[0], cmax=cbar[1])
+    cnodes = colormap(fscaled, cmap=cmap, n=lut, type=ctype)
+
+    if dtype == 'element':
+        escaled, eabs = normalise_data(data=ve.reshape(-1), cmin=cbar[0], cmax=cbar[1])
+        celements = colormap(escaled, cmap=cmap, n=lut, type=ctype)
+    else:
+        eabs = 0
+
+    # Group elements by kind and node count
+
+    lines, shells, solids = [], [], {}
+
+    for ekey, (enodes, etype) in enumerate(zip(elements, etypes)):
+        m = len(enodes)
+        if m == 2:
+            lines.append([ekey] + list(enodes))
+        elif etype in shell_types or m == 3:
+            shells.append(list(enodes) + [enodes[-1]] * (4 - m))
+        elif m in solid_faces:
+            solids.setdefault(m, []).append(enodes)
+
+    faces = [np.array(shells, dtype=int).reshape(-1, 4)]
+
+    # Solid faces
+
+    solid = [np.array(solids[m], dtype=int)[:, solid_faces[m]].reshape(-1, 4) for m in sorted(solids)]
+
+    if solid:
+        solid = np.vstack(solid)
+        if hull:
+            keys = np.sort(solid, axis=1)
+            _, index, counts = np.unique(keys, axis=0, return_index=True, return_counts=True)
+            solid = solid[np.sort(index[counts == 1])]
+        faces.append(solid)
+
+    vertices = [U]
+    colors = [cnodes]
+
+    # Pipes
+
+    if lines:
+
+        lines = np.array(lines, dtype=int)
+        sp, ep = U[lines[:, 1]], U[lines[:, 2]]
+        d = ep - sp
+        d /= np.maximum(np.linalg.norm(d, axis=1), 1e-12)[:, None]
+
+        helper = np.zeros_like(d)
+        helper[:, 0] = 1
+        helper[np.abs(d[:, 0]) > 0.9] = [0, 1, 0]
+        xa = np.cross(d, helper)
+        xa /= np.linalg.norm(xa, axis=1)[:, None]
+        ya = np.cross(d, xa)
+
+        angles = 2 * np.pi * np.arange(sides) / sides
+        ring = radius * (np.cos(angles)[None, :, None] * xa[:, None, :] + np.sin(angles)[None, :, None] * ya[:, None, :])
+        pts = np.concatenate([sp[:, None, :] + ring, ep[:, None, :] + ring], axis=1)
+        vertices.append(pts.reshape(-1, 3))
+
+        if dtype == 'element':
+            c1 = c2 = celements[lines[:, 0]]
+        else:
+            c1, c2 = cnodes[lines[:, 1]], cnodes[lines[:, 2]]
+        pcolors = np.concatenate([np.repeat(c1[:, None, :], sides, axis=1), np.repeat(c2[:, None, :], sides, axis=1)], axis=1)
+        colors.append(pcolors.reshape(-1, 3))
+
+        k = np.arange(sides)
+        template = np.column_stack([k, k + sides, (k + 1) % sides + sides, (k + 1) % sides])
+        offsets = n + 2 * sides * np.arange(len(lines))
+        faces.append((offsets[:, None, None] + template[None, :, :]).reshape(-1, 4))
+
+    return {
+        'vertices': np.vstack(vertices),
+        'faces':    np.vstack(faces),
+        'colors':   np.vstack(colors),
+        'fabs':     float(fabs),
+        'eabs':     float(eabs),
+        'toc':      time() - tic,
+    }
@@ -0,0 +1,443 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    pass
+
+
+__all__ = [
+    'element_kinds',
+    'shape_functions',
+    'locate_points',
+    'interpolate_nodal',
+    'polyline_points',
+    'transfer_results',
+]
+
+
+shell_types = ['ShellElement', 'MembraneElement', 'FaceElement']
+
+# Parametric dimension and starting point of each element kind
+
+kinds = {
+    'line':  (1, [0.5]),
+    'tri':   (2, [1 / 3., 1 / 3.]),
+    'quad':  (2, [0., 0.]),
+    'tet':   (3, [0.25, 0.25, 0.25]),
+    'wedge': (3, [1 / 3., 1 / 3., 0.]),
+    'hex':   (3, [0., 0., 0.]),
+}
+
+quad_corners = [[-1, -1], [1, -1], [1, 1], [-1, 1]]
+hex_corners = [[-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1], [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]]
+
+
+def element_kinds(elements, etypes):
+    """Returns the interpolation kind of each element.
+
+    Parameters
+    ----------
+    elements : list
+        Node numbers of each element.
+    etypes : list
+        Element class names, used to tell 4 node shells from tetrahedra.
+
+    Returns
+    -------
+    list
+        'line', 'tri', 'quad', 'tet', 'wedge', 'hex' or None for each element.
+
+    """
+
+    result = []
+
+    for nodes, etype in zip(elements, etypes):
+        n = len(nodes)
+        if n == 2:
+            result.append('line')
+        elif n == 3:
+            result.append('tri')
+        elif n == 4:
+            result.append('quad' if etype in shell_types else 'tet')
+        elif n == 6:
+            result.append('wedge')
+        elif n == 8:
+            result.append('hex')
+        else:
+            result.append(None)
+
+    return result
+
+
+def shape_functions(kind, xi):
+    """Evaluates the linear shape functions of an element kind and their derivatives.
+
+    Parameters
+    ----------
+    kind : str
+        'line', 'tri', 'quad', 'tet', 'wedge' or 'hex'.
+    xi : array
+        (c x d) parametric co-ordinates.
+
+    Returns
+    -------
+    array
+        (c x k) shape function values.
+    array
+        (c x k x d) derivatives with respect to the parametric co-ordinates.
+
+    """
+
+    xi = np.asarray(xi, dtype=float)
+    c = xi.shape[0]
+
+    if kind in ['line', 'tri', 'tet']:
+        d = xi.shape[1]
+        N = np.column_stack([1 - xi.sum(axis=1), xi])
+        dN = np.broadcast_to(np.vstack([-np.ones(d), np.eye(d)]), (c, d + 1, d)).copy()
+
+    elif kind in ['quad', 'hex']:
+        corners = np.array(quad_corners if kind == 'quad' else hex_corners, dtype=float)
+        d = corners.shape[1]
+        terms = 1 + corners[None, :, :] * xi[:, None, :]
+        N = np.prod(terms, axis=2) / 2**d
+        dN = np.empty((c, len(corners), d))
+        for j in range(d):
+            others = np.prod(np.delete(terms, j, axis=2), axis=2)
+            dN[:, :, j] = corners[None, :, j] * others / 2**d
+
+    elif kind == 'wedge':
+        Nt = np.column_stack([1 - xi[:, 0] - xi[:, 1], xi[:, 0], xi[:, 1]])
+        dNt = np.array([[-1, -1], [1, 0], [0, 1]], dtype=float)
+        lower, upper = (1 - xi[:, 2]) / 2, (1 + xi[:, 2]) / 2
+        N = np.column_stack([Nt * lower[:, None], Nt * upper[:, None]])
+        dN = np.empty((c, 6, 3))
+        dN[:, :3, :2] = dNt[None] * lower[:, None, None]
+        dN[:, 3:, :2] = dNt[None] * upper[:, None, None]
+        dN[:, :3, 2] = -Nt / 2
+        dN[:, 3:, 2] = Nt / 2
+
+    return N, dN
+
+
+def _inside(kind, xi, eps=1e-6):
+
+    if kind in ['line', 'tri', 'tet']:
+        return np.all(xi >= -eps, axis=1) & (xi.sum(axis=1) <= 1 + eps)
+
+    if kind == 'wedge':
+        return (np.all(xi[:, :2] >= -eps, axis=1) & (xi[:, :2].sum(axis=1) <= 1 + eps) & (np.abs(xi[:, 2]) <= 1 + eps))
+
+    return np.all(np.abs(xi) <= 1 + eps, axis=1)
+
+
+def _invert(kind, X, p, iterations=10):
+
+    d, start = kinds[kind]
+    xi = np.tile(start, (len(p), 1))
+
+    for _ in range(iterations):
+        N, dN = shape_functions(kind, xi)
+        r = np.einsum('ck,ckx->cx', N, X) - p
+        J = np.einsum('ckx,ckd->cxd', X, dN)
+        JTJ = np.einsum('cxd,cxe->cde', J, J) + 1e-14 * np.eye(d)
+        step = np.linalg.solve(JTJ, -np.einsum('cxd,cx->cd', J, r)[..., None])[..., 0]
+        xi = xi + step
+        if np.max(np.abs(step)) < 1e-10:
+            break
+
+    N, _ = shape_functions(kind, xi)
+    residual = np.linalg.norm(np.einsum('ck,ckx->cx', N, X) - p, axis=1)
+
+    return xi, N, residual
+
+
+def locate_points(nodes, elements, etypes, points, tol=None, k=8):
+    """Finds the element containing each point and the shape function weights of its nodes.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Node numbers of each element.
+    etypes : list
+        Element class names, e.g. 'ShellElement'.
+    points : list
+        [[x, y, z], ..] co-ordinates of the points.
+    tol : float
+        Largest distance of a point from a line or shell element, None for 1e-3 of the model size.
+    k : int
+        Number of nearest element centroids tested for each point.
+
+    Returns
+    -------
+    array
+        (p,) row of the containing element in elements, -1 if not found.
+    array
+        (p x 8) node numbers of the containing element, padded with 0.
+    array
+        (p x 8) shape function weights of these nodes, padded with 0.
+
+    Notes
+    -----
+    - Candidates are the k nearest element centroids (k-d tree), retried with 4k for points not found.
+    - Parametric co-ordinates are found by Gauss-Newton iterations, vectorised over all candidates of a kind.
+    - Of several containing elements, the one nearest to the point is kept.
+
+    """
+
+    xyz = np.asarray(nodes, dtype=float)
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    p = len(points)
+
+    element_kind = element_kinds(elements, etypes)
+    rows = np.array([i for i, kind in enumerate(element_kind) if kind], dtype=int)
+
+    owner = np.full(p, -1, dtype=int)
+    owner_nodes = np.zeros((p, 8), dtype=int)
+    weights = np.zeros((p, 8))
+
+    if not len(rows) or not p:
+        return owner, owner_nodes, weights
+
+    if tol is None:
+        tol = 1e-3 * float(np.linalg.norm(xyz.max(axis=0) - xyz.min(axis=0)) or 1)
+
+    centroids = np.array([xyz[elements[i]].mean(axis=0) for i in rows])
+    tree = cKDTree(centroids)
+    pending = np.arange(p)
+
+    for kk in [k, 4 * k]:
+
+        kk = min(kk, len(rows))
+        _, candidates = tree.query(points[pending], k=kk)
+        candidates = rows[np.asarray(candidates).reshape(len(pending), kk)]
+
+        pairs_point = np.repeat(pending, kk)
+        pairs_element = candidates.reshape(-1)
+        pair_kind = np.array([element_kind[i] for i in pairs_element])
+        found = []
+
+        for kind in kinds:
+
+            mask = pair_kind == kind
+            if not mask.any():
+                continue
+
+            ip, ie = pairs_point[mask], pairs_element[mask]
+            enodes = np.array([elements[i] for i in ie], dtype=int)
+            xi, N, residual = _invert(kind, xyz[enodes], points[ip])
+            ok = _inside(kind, xi) & (residual <= tol)
+
+            padded_nodes = np.zeros((ok.sum(), 8), dtype=int)
+            padded_weights = np.zeros((ok.sum(), 8))
+            padded_nodes[:, :enodes.shape[1]] = enodes[ok]
+            padded_weights[:, :enodes.shape[1]] = N[ok]
+            found.append((ip[ok], ie[ok], residual[ok], padded_nodes, padded_weights))
+
+        if found:
+            ip, ie, residual, padded_nodes, padded_weights = [np.concatenate(i) for i in zip(*found)]
+            order = np.lexsort((residual, ip))
+            _, first = np.unique(ip[order], return_index=True)
+            keep = order[first]
+            owner[ip[keep]] = ie[keep]
+            owner_nodes[ip[keep]] = padded_nodes[keep]
+            weights[ip[keep]] = padded_weights[keep]
+
+        pending = np.nonzero(owner < 0)[0]
+
+        if not len(pending) or kk == len(rows):
+            break
+
+    return owner, owner_nodes, weights
+
+
+def interpolate_nodal(values, owner, owner_nodes, weights):
+    """Interpolates nodal values at located points.
+
+    Parameters
+    ----------
+    values : array
+        (n,) nodal values.
+    owner : array
+        (p,) containing element of each point, from locate_points.
+    owner_nodes : array
+        (p x 8) node numbers, from locate_points.
+    weights : array
+        (p x 8) shape function weights, from locate_points.
+
+    Returns
+    -------
+    array
+        (p,) interpolated values, NaN for points outside the elements.
+
+    """
+
+    values = np.asarray(values, dtype=float)
+    result = np.sum(np.where(weights != 0, values[owner_nodes], 0) * weights, axis=1)
+    result[owner < 0] = np.nan
+
+    return result
+
+
+def polyline_points(polyline, number):
+    """Returns points spaced equally along a polyline, e.g. to probe results along a path.
+
+    Parameters
+    ----------
+    polyline : list
+        [[x, y, z], ..] co-ordinates of the polyline vertices.
+    number : int
+        Number of points.
+
+    Returns
+    -------
+    array
+        (number x 3) co-ordinates of the points.
+    array
+        (number,) arc length of each point.
+
+    """
+
+    polyline = np.asarray(polyline, dtype=float)
+    lengths = np.concatenate([[0], np.cumsum(np.linalg.norm(np.diff(polyline, axis=0), axis=1))])
+    s = np.linspace(0, lengths[-1], int(number))
+    points = np.column_stack([np.interp(s, lengths, polyline[:, i]) for i in range(3)])
+
+    return points, s
+
+
+def transfer_results(source, target, step, fields=None, smooth=False, tol=None, chunk=100000):
+    """Transfers nodal and element results of a Step between non-matching meshes.
+
+    Parameters
+    ----------
+    source : obj
+        Structure object with the results.
+    target : obj
+        Structure object to receive the results in target.results[step].
+    step : str
+        Name of the Step.
+    fields : list
+        Nodal and element components to transfer, None for all.
+    smooth : bool
+        Interpolate element data at target element centroids from source nodal averages, instead of copying
+        the integration point data of the containing source element.
+    tol : float
+        Largest distance of a point from a line or shell element of the source.
+    chunk : int
+        Number of target points located at once.
+
+    Returns
+    -------
+    dict
+        The transferred {'nodal': {...}, 'element': {...}} results, also stored in target.results[step].
+
+    Notes
+    -----
+    - Target nodes are located in the source elements and interpolated with the source shape functions.
+    - Target points outside the source mesh take the value of the nearest source node or element centroid, the
+      mean of the element's integration points when smoothing.
+
+    """
+
+    from compas_fea.utilities.functions import process_data
+
+    results = source.results[step]
+    nodal = results.get('nodal', {})
+    element = results.get('element', {})
+
+    if fields:
+        for field in fields:
+            if source.results.is_derived(field) and field not in nodal and field not in element:
+                source.results.field(step, field)
+
+    nodal = {i: j for i, j in nodal.items() if (fields is None or i in fields) and _numeric(j)}
+    element = {i: j for i, j in element.items() if (fields is None or i in fields) and _numeric_element(j)}
+
+    xyz = np.asarray(source.nodes_xyz(), dtype=float)
+    skeys = sorted(source.elements, key=int)
+    selements = [source.elements[i].nodes for i in skeys]
+    setypes = [source.elements[i].__name__ for i in skeys]
+
+    tkeys = sorted(target.elements, key=int)
+    txyz = np.asarray(target.nodes_xyz(), dtype=float).reshape(-1, 3)
+    centroids = np.array([txyz[target.elements[i].nodes].mean(axis=0) for i in tkeys]).reshape(-1, 3)
+
+    def locate(points):
+        located = [locate_points(xyz, selements, setypes, points[i:i + chunk], tol=tol) for i in range(0, len(points), chunk)]
+        if not located:
+            return np.zeros(0, dtype=int), np.zeros((0, 8), dtype=int), np.zeros((0, 8))
+        return [np.concatenate(i) for i in zip(*located)]
+
+    transferred = {'nodal': {}, 'element': {}}
+
+    # Nodal fields
+
+    if nodal:
+
+        owner, owner_nodes, weights = locate(txyz)
+        outside = np.nonzero(owner < 0)[0]
+        nearest = cKDTree(xyz).query(txyz[outside])[1] if len(outside) else []
+
+        for name, data in nodal.items():
+            values = np.full(len(xyz), np.nan)
+            values[[int(i) for i in data]] = [np.nan if i is None else i for i in data.values()]
+            result = interpolate_nodal(values, owner, owner_nodes, weights)
+            result[outside] = values[nearest]
+            transferred['nodal'][name] = {i: j for i, j in enumerate(result.tolist()) if j == j}
+
+    # Element fields
+
+    if element:
+
+        owner, owner_nodes, weights = locate(centroids)
+        outside = np.nonzero(owner < 0)[0]
+
+        if len(outside):
+            scentroids = np.array([xyz[i].mean(axis=0) for i in selements])
+            owner[outside] = cKDTree(scentroids).query(centroids[outside])[1]
+
+        for name, data in element.items():
+
+            if smooth:
+                vn, ve = process_data(data, 'element', 'mean', 'mean', selements, len(xyz))
+                result = interpolate_nodal(vn.ravel(), owner, owner_nodes, weights)
+                result[outside] = ve.ravel()[owner[outside]]
+                transferred['element'][name] = {int(tkeys[i]): {'ip': j} for i, j in enumerate(result.tolist()) if j == j}
+
+            else:
+                data = {int(i): j for i, j in data.items()}
+                sources = [skeys[i] for i in owner]
+                transferred['element'][name] = {int(t): dict(data[int(s)]) for t, s in zip(tkeys, sources) if int(s) in data}
+
+    target.results.setdefault(step, {}).setdefault('nodal', {}).update(transferred['nodal'])
+    target.results[step].setdefault('element', {}).update(transferred['element'])
+
+    print('***** Results of Step {0} transferred : {1} nodal and {2} element fields *****'.format(
+        step, len(transferred['nodal']), len(transferred['element'])))
+
+    return transferred
+
+
+def _numeric(data):
+
+    value = next(iter(data.values()), None)
+
+    return isinstance(value, (int, float))
+
+
+def _numeric_element(data):
+
+    value = next(iter(data.values()), None)
+
+    return isinstance(value, dict) and isinstance(next(iter(value.values()), None), (int, float))
@@ -0,0 +1,239 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'selection_union',
+    'selection_intersection',
+    'selection_difference',
+    'selection_complement',
+    'combine_selections',
+]
+
+
+def selection_union(selections, n=None):
+    """Union of node or element selections.
+
+    Parameters
+    ----------
+    selections : list
+        Lists of integer keys.
+    n : int
+        Number of nodes or elements, to work on bitmaps for dense selections, None for sorted arrays only.
+
+    Returns
+    -------
+    list
+        Sorted unique keys.
+
+    """
+
+    arrays = [_keys(i, n) for i in selections]
+
+    if not arrays:
+        return []
+
+    if _dense(arrays, n):
+        return np.flatnonzero(_bitmap(arrays, n)).tolist()
+
+    return _compact(np.concatenate(arrays)).tolist()
+
+
+def selection_intersection(selections, n=None):
+    """Intersection of node or element selections.
+
+    Parameters
+    ----------
+    selections : list
+        Lists of integer keys.
+    n : int
+        Number of nodes or elements, to work on bitmaps for dense selections, None for sorted arrays only.
+
+    Returns
+    -------
+    list
+        Sorted unique keys.
+
+    """
+
+    arrays = sorted((_keys(i, n) for i in selections), key=len)
+
+    if not arrays:
+        return []
+
+    if _dense(arrays, n):
+        mask = _bitmap(arrays[:1], n)
+        for keys in arrays[1:]:
+            mask &= _bitmap([keys], n)
+        return np.flatnonzero(mask).tolist()
+
+    keys = _compact(arrays[0])
+    for other in arrays[1:]:
+        keys = keys[_members(keys, _compact(other))]
+
+    return keys.tolist()
+
+
+def selection_difference(selections, n=None):
+    """Keys of the first selection that are not in any of the others.
+
+    Parameters
+    ----------
+    selections : list
+        Lists of integer keys.
+    n : int
+        Number of nodes or elements, to work on bitmaps for dense selections, None for sorted arrays only.
+
+    Returns
+    -------
+    list
+        Sorted unique keys.
+
+    """
+
+    arrays = [_keys(i, n) for i in selections]
+
+    if not arrays:
+        return []
+
+    if _dense(arrays, n):
+        return np.flatnonzero(_bitmap(arrays[:1], n) & ~_bitmap(arrays[1:], n)).tolist()
+
+    keys = _compact(arrays[0])
+    for other in arrays[1:]:
+        keys = keys[~_members(keys, _compact(other))]
+
+    return keys.tolist()
+
+
+def selection_complement(selections, n):
+    """Keys from 0 to n - 1 that are not in any of the selections.
+
+    Parameters
+    ----------
+    selections : list
+        Lists of integer keys.
+    n : int
+        Number of nodes or elements.
+
+    Returns
+    -------
+    list
+        Sorted unique keys.
+
+    """
+
+    return np.flatnonzero(~_bitmap([_keys(i, n) for i in selections], n)).tolist()
+
+
+def combine_selections(selections_a, selections_b):
+    """Intersections of every selection of a first group with every selection of a second group.
+
+    Parameters
+    ----------
+    selections_a : list
+        Lists of integer keys.
+    selections_b : list
+        Lists of integer keys.
+
+    Returns
+    -------
+    list
+        [[i, j, keys], ..] for the non-empty intersections of selections_a[i] and selections_b[j], by i then j, with
+        the keys in the order (and repeats) of selections_a[i].
+
+    Notes
+    -----
+    - All memberships are joined at once on the sorted keys of the second group, linear in the number of keys
+      rather than in the product of the selection counts.
+
+    """
+
+    keys_a, labels_a = _memberships(selections_a)
+    keys_b, labels_b = _memberships(selections_b)
+
+    # Unique (key, j) memberships of the second group, sorted by key then j
+
+    order = np.lexsort((labels_b, keys_b))
+    keys_b, labels_b = keys_b[order], labels_b[order]
+    unique = np.ones(len(keys_b), dtype=bool)
+    unique[1:] = (np.diff(keys_b) != 0) | (np.diff(labels_b) != 0)
+    keys_b, labels_b = keys_b[unique], labels_b[unique]
+
+    # Every (key of i, j) match, grouped by i then j in the order of the keys of i
+
+    lo = np.searchsorted(keys_b, keys_a, side='left')
+    counts = np.searchsorted(keys_b, keys_a, side='right') - lo
+    rows = np.repeat(np.arange(len(keys_a)), counts)
+    starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+    js = labels_b[starts + np.arange(len(rows))]
+    code = labels_a[rows] * max(len(selections_b), 1) + js
+    order = np.argsort(code, kind='stable')
+    code, keys = code[order], keys_a[rows[order]]
+
+    splits = np.flatnonzero(np.diff(code)) + 1
+    firsts = code[np.concatenate([[0], splits])] if len(code) else code
+    nb = max(len(selections_b), 1)
+
+    return [[int(c // nb), int(c % nb), group.tolist()] for c, group in zip(firsts, np.split(keys, splits))]
+
+
+def _keys(keys, n=None):
+
+    keys = np.asarray(keys, dtype=np.int64).ravel()
+
+    if len(keys) and (keys.min() < 0 or (n is not None and keys.max() >= n)):
+        raise ValueError('Selection keys must be from 0 to {0}, got {1} to {2}'.format(
+            'n - 1' if n is None else n - 1, keys.min(), keys.max()))
+
+    return keys
+
+
+def _compact(keys):
+
+    # Sorted unique keys, skipping the sort for already compact selections
+
+    if len(keys) > 1 and not np.all(keys[1:] > keys[:-1]):
+        keys = np.sort(keys)
+        keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+
+    return keys
+
+
+def _bitmap(arrays, n):
+
+    mask = np.zeros(n, dtype=bool)
+
+    for keys in arrays:
+        mask[keys] = True
+
+    return mask
+
+
+def _dense(arrays, n):
+
+    # Bitmaps of n bits beat sorted-array merges once the selections hold a sixteenth of the keys
+
+    return n is not None and sum(len(i) for i in arrays) * 16 >= n
+
+
+def _members(keys, other):
+
+    index = np.minimum(np.searchsorted(other, keys), max(len(other) - 1, 0))
+
+    return other[index] == keys if len(other) else np.zeros(len(keys), dtype=bool)
+
+
+def _memberships(selections):
+
+    sizes = [len(i) for i in selections]
+    keys = np.fromiter((key for selection in selections for key in selection), dtype=np.int64, count=sum(sizes))
+    labels = np.repeat(np.arange(len(selections)), sizes)
+
+    return keys, labels
@@ -0,0 +1,139 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas_fea.utilities.functions import _face_corners
+from compas_fea.utilities.functions import incidence_matrix
+from compas_fea.utilities.masses import _volumes
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+try:
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    pass
+
+
+__all__ = [
+    'validate_mesh',
+]
+
+
+def validate_mesh(nodes, elements, kinds, restraints=None, tol=3):
+    """Checks the nodes and elements of a mesh for errors, in array operations.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Nodes of each element.
+    kinds : list
+        Kind of each element, 'line', 'shell', 'solid', 'spring' or 'point'.
+    restraints : list
+        (n x 6) True for the restrained degrees-of-freedom of each node, None for no restraints.
+    tol : int
+        Number of decimals of the geometric tolerance.
+
+    Returns
+    -------
+    dict
+        'unused' nodes without elements, 'duplicates' groups of coincident nodes, 'degenerate' elements with
+        repeated nodes or a zero length, area or volume, 'inverted' solids with a negative volume, 'components'
+        connected component of each node (-1 for unused nodes), and 'mechanisms' components free to translate,
+        with their 'component', 'size' and 'free' directions.
+
+    Notes
+    -----
+    - An element is degenerate if its length, area / longest edge or volume / longest edge^2 is below 10^-tol.
+    - Solids are inverted if their nodes are not in the right-handed (Abaqus) order.
+    - Returns plain lists, so that it can be called through compas.rpc.
+
+    """
+
+    X = np.asarray(nodes, dtype=float).reshape(-1, 3)
+    n = len(X)
+    eps = 10.**-int(tol)
+
+    # Unused and duplicate nodes
+
+    A = incidence_matrix(elements, n)[0]
+    used = np.asarray(A.sum(axis=0)).ravel() > 0
+
+    _, inverse, counts = np.unique(np.round(X, int(tol)) + 0., axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    shared = np.nonzero(counts[inverse] > 1)[0]
+    shared = shared[np.argsort(inverse[shared], kind='stable')]
+    duplicates = np.split(shared, np.nonzero(np.diff(inverse[shared]))[0] + 1) if len(shared) else []
+
+    # Degenerate and inverted elements
+
+    degenerate = np.zeros(len(elements), dtype=bool)
+    inverted = np.zeros(len(elements), dtype=bool)
+    groups = {}
+
+    for i, (element, kind) in enumerate(zip(elements, kinds)):
+        groups.setdefault((kind, len(element)), []).append(i)
+
+    for (kind, m), ids in groups.items():
+
+        ids = np.array(ids, dtype=int)
+        E = np.array([elements[i] for i in ids], dtype=int).reshape(len(ids), m)
+        S = np.sort(E, axis=1)
+        repeated = (np.diff(S, axis=1) == 0).any(axis=1)
+
+        if kind in ['line', 'shell', 'solid'] and m > 1:
+
+            P = X[E]
+            edges = np.zeros(len(ids))
+            for a in range(m):
+                for b in range(a + 1, m):
+                    edges = np.maximum(edges, np.linalg.norm(P[:, a] - P[:, b], axis=1))
+            edge = np.maximum(edges, 1e-300)
+
+            if kind == 'line':
+                measure = edges
+            elif kind == 'shell':
+                measure = np.linalg.norm(_face_corners(P)[0], axis=1) / edge
+            else:
+                volume = _volumes(P, signed=True)
+                measure = np.abs(volume) / edge**2
+
+            repeated |= measure < eps
+
+            if kind == 'solid':
+                inverted[ids] = (volume < 0) & ~repeated
+
+        degenerate[ids] = repeated
+
+    # Components and mechanisms
+
+    G = A.T.dot(A).tocsr()
+    labels = connected_components(G, directed=False)[1]
+    labels = np.where(used, labels, -1)
+    _, labels[used] = np.unique(labels[used], return_inverse=True)
+    c = int(labels.max()) + 1 if used.any() else 0
+
+    R = np.zeros((n, 6)) if restraints is None else np.asarray(restraints, dtype=float).reshape(n, 6)
+    fixed = np.zeros((c, 6))
+    sizes = np.bincount(labels[used], minlength=c)
+    np.add.at(fixed, labels[used], R[used])
+
+    mechanisms = []
+
+    for component in range(c):
+        free = [i for i, j in zip('xyz', fixed[component, :3]) if not j]
+        if free:
+            mechanisms.append({'component': component, 'size': int(sizes[component]), 'free': free})
+
+    return {
+        'unused':     np.nonzero(~used)[0].tolist(),
+        'duplicates': [i.tolist() for i in duplicates],
+        'degenerate': np.nonzero(degenerate)[0].tolist(),
+        'inverted':   np.nonzero(inverted)[0].tolist(),
+        'components': labels.tolist(),
+        'mechanisms': mechanisms,
+    }
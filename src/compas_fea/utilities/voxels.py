@@ -0,0 +1,265 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from time import time
+
+from compas_fea.fea.workers import map_workers
+from compas_fea.utilities.functions import process_data
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    pass
+
+
+__all__ = [
+    'voxel_grid',
+    'voxelise',
+    'write_voxels',
+]
+
+
+# Tetrahedra of the solid elements, by node count
+
+solid_tets = {
+    4: [[0, 1, 2, 3]],
+    6: [[0, 1, 2, 3], [1, 2, 3, 4], [2, 3, 4, 5]],
+    8: [[0, 1, 2, 6], [0, 2, 3, 6], [0, 3, 7, 6], [0, 7, 4, 6], [0, 4, 5, 6], [0, 5, 1, 6]],
+}
+
+
+def voxel_grid(nodes, vdx, bounds=None):
+    """Returns the regular grid of voxel centres covering the nodes.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    vdx : float
+        Voxel spacing.
+    bounds : list
+        [[xmin, ymin, zmin], [xmax, ymax, zmax]] to use instead of the node bounds.
+
+    Returns
+    -------
+    array
+        Origin (x, y, z) of the first voxel.
+    tuple
+        Number of voxels (nx, ny, nz).
+
+    """
+
+    xyz = np.asarray(nodes, dtype=float)
+    lower, upper = (xyz.min(axis=0), xyz.max(axis=0)) if bounds is None else np.asarray(bounds, dtype=float)
+    shape = tuple(int(i) for i in np.floor((upper - lower) / vdx + 1e-9) + 1)
+
+    return lower, shape
+
+
+def voxelise(nodes, values, vdx, elements=None, method='idw', k=8, power=2, cutoff=None, fill=None, bounds=None,
+             chunk=2**18, workers=1):
+    """Resamples nodal values onto a regular voxel grid.
+
+    Parameters
+    ----------
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    values : list
+        Value at each node.
+    vdx : float
+        Voxel spacing.
+    elements : list
+        Node numbers of each element, needed for method 'elements'.
+    method : str
+        'nearest' node, 'idw' inverse distance weighting of the k nearest nodes, or 'elements' for linear
+        interpolation inside the solid elements.
+    k : int
+        Number of nodes for 'idw'.
+    power : float
+        Power of the inverse distance weights for 'idw'.
+    cutoff : float
+        Voxels further than this from the nearest node take the fill value ('nearest' and 'idw').
+    fill : float
+        Value of empty voxels, None for NaN.
+    bounds : list
+        [[xmin, ymin, zmin], [xmax, ymax, zmax]] of the grid, None for the node bounds.
+    chunk : int
+        Number of voxels ('nearest', 'idw') or voxel candidates ('elements') processed at once.
+    workers : int
+        Number of chunks processed in parallel.
+
+    Returns
+    -------
+    array
+        (nx x ny x nz) volume of values.
+    array
+        Origin (x, y, z) of the first voxel.
+    float
+        Voxel spacing.
+
+    Notes
+    -----
+    - For 'elements', hexahedra and pentahedra are split into tetrahedra, on which the shape functions are linear.
+    - Only solid elements are rasterised, shells and lines are ignored.
+
+    """
+
+    tic = time()
+
+    fill = np.nan if fill is None else fill
+    xyz = np.asarray(nodes, dtype=float)
+    f = np.asarray(values, dtype=float).ravel()
+    origin, shape = voxel_grid(xyz, vdx, bounds)
+    volume = np.full(shape, fill, dtype=float)
+
+    if method == 'elements':
+        _rasterise(volume.reshape(-1), xyz, f, elements, origin, vdx, shape, chunk, workers)
+
+    else:
+        tree = cKDTree(xyz)
+        m = int(np.prod(shape))
+        flat = volume.reshape(-1)
+
+        def query(start):
+            ids = np.arange(start, min(start + chunk, m))
+            points = origin + vdx * np.column_stack(np.unravel_index(ids, shape))
+            distances, neighbours = tree.query(points, k=1 if method == 'nearest' else min(k, len(xyz)))
+
+            if distances.ndim == 1:
+                result = f[neighbours]
+                nearest = distances
+            else:
+                weights = 1. / np.maximum(distances, 1e-12 * vdx)**power
+                result = np.sum(weights * f[neighbours], axis=1) / np.sum(weights, axis=1)
+                nearest = distances[:, 0]
+
+            if cutoff is not None:
+                result[nearest > cutoff] = fill
+
+            flat[ids] = result
+
+        map_workers(query, range(0, m, chunk), workers=workers)
+
+    print('***** Voxels {0} processed : {1:.3f} s *****'.format(shape, time() - tic))
+
+    return volume, origin, vdx
+
+
+def _rasterise(flat, xyz, f, elements, origin, vdx, shape, chunk, workers):
+
+    tets = [np.array([i for i in elements if len(i) == n], dtype=int).reshape(-1, n)[:, solid_tets[n]].reshape(-1, 4)
+            for n in solid_tets]
+    tets = np.vstack(tets)
+
+    if not len(tets):
+        print('***** No solid elements to rasterise *****')
+        return
+
+    P = xyz[tets]
+    T = np.transpose(P[:, :3] - P[:, 3:4], (0, 2, 1))
+    valid = np.abs(np.linalg.det(T)) > 1e-12 * vdx**3
+    tets, P, T = tets[valid], P[valid], T[valid]
+    Tinv = np.linalg.inv(T)
+
+    shape = np.array(shape)
+    lower = np.clip(np.ceil((P.min(axis=1) - origin) / vdx - 1e-9).astype(int), 0, shape - 1)
+    upper = np.clip(np.floor((P.max(axis=1) - origin) / vdx + 1e-9).astype(int), -1, shape - 1)
+    dims = np.maximum(upper - lower + 1, 0)
+    counts = np.prod(dims, axis=1)
+
+    # Split the tetrahedra into groups of at most chunk voxel candidates
+
+    gid = (np.cumsum(counts) - counts) // chunk
+    groups = np.split(np.arange(len(tets)), np.nonzero(np.diff(gid))[0] + 1)
+
+    def rasterise(group):
+
+        if not len(group) or not counts[group].sum():
+            return
+
+        c = counts[group]
+        owner = np.repeat(group, c)
+        local = np.arange(c.sum()) - np.repeat(np.cumsum(c) - c, c)
+        d = dims[owner]
+        ijk = lower[owner] + np.column_stack([local // (d[:, 1] * d[:, 2]), (local // d[:, 2]) % d[:, 1], local % d[:, 2]])
+
+        points = origin + vdx * ijk
+        lam = np.einsum('nij,nj->ni', Tinv[owner], points - P[owner, 3])
+        lam = np.column_stack([lam, 1 - lam.sum(axis=1)])
+        inside = np.all(lam >= -1e-9, axis=1)
+
+        ids = np.ravel_multi_index(ijk[inside].T, tuple(shape))
+        flat[ids] = np.sum(lam[inside] * f[tets[owner[inside]]], axis=1)
+
+    map_workers(rasterise, groups, workers=workers)
+
+
+def write_voxels(filename, nodes, elements, ux, uy, uz, data, dtype, vdx, field='values', cbar=[None, None],
+                 iptype='mean', nodal='mean', method='idw', workers=1, **kwargs):
+    """Processes a results field, resamples it onto voxels and writes a .vti file for volume rendering.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the .vti file.
+    nodes : list
+        [[x, y, z], ..] co-ordinates of each node.
+    elements : list
+        Node numbers that each element connects.
+    ux : list
+        List of nodal x displacements.
+    uy : list
+        List of nodal y displacements.
+    uz : list
+        List of nodal z displacements.
+    data : list, dict
+        Unprocessed nodal list or element dictionary data.
+    dtype : str
+        'nodal' or 'element'.
+    vdx : float
+        Voxel spacing, None for 1/50 of the largest dimension.
+    field : str
+        Name of the field in the .vti file.
+    cbar : list
+        Minimum and maximum limits to clip the values to.
+    iptype : str
+        'mean', 'max' or 'min' of an element's integration point data.
+    nodal : str
+        'mean', 'max' or 'min' for nodal values.
+    method : str
+        'nearest', 'idw' or 'elements', see voxelise.
+    workers : int
+        Number of chunks processed in parallel.
+
+    Returns
+    -------
+    list
+        Number of voxels [nx, ny, nz].
+
+    Notes
+    -----
+    - Voxels are placed on the deformed shape, and further keyword arguments are passed to voxelise.
+
+    """
+
+    xyz = np.asarray(nodes, dtype=float) + np.column_stack([ux, uy, uz]).astype(float)
+
+    vn, _ = process_data(data=data, dtype=dtype, iptype=iptype, nodal=nodal, elements=elements, n=len(xyz))
+    values = np.clip(vn.ravel(), *[-np.inf if cbar[0] is None else cbar[0], np.inf if cbar[1] is None else cbar[1]])
+
+    if not vdx:
+        vdx = float(np.max(xyz.max(axis=0) - xyz.min(axis=0))) / 50.
+
+    volume, origin, vdx = voxelise(xyz, values, vdx, elements=elements, method=method, workers=workers, **kwargs)
+
+    from compas_fea.fea.vtu import write_vti
+
+    write_vti(filename, volume, origin, vdx, name=field)
+
+    return list(volume.shape)
@@ -0,0 +1,22 @@
+from compas_fea.structure import Structure
+
+
+def test_bulk_keys_follow_add_node_and_add_element(tmp_path):
+
+    mdl = Structure(path=str(tmp_path) + '/')
+    a = mdl.add_node([0, 0, 0])
+    b = mdl.add_node([1, 0, 0])
+    mdl.add_virtual_element(nodes=[a, b], type='SpringElement')
+    mdl.virtual_nodes[a] = mdl.node_count()  # a virtual node takes the next node key
+
+    keys = mdl.add_nodes_from_xyz([[1, 0, 0], [2, 0, 0], [2, 0, 0], [3, 0, 0.0001]])
+
+    assert keys == [b, 3, 3, 4]
+    assert mdl.node_count() == 5
+
+    ekeys = mdl.add_elements_bulk([[a, b], [b, 3], [3, 3], [a, b]], type='TrussElement', mass=2.)
+
+    assert ekeys == [1, 2, None, 1]
+    assert [mdl.elements[i].mass for i in [1, 2]] == [2., 2.]
+    assert mdl.check_element_exists([b, 3]) == 2
+    assert mdl.add_element([3, 4], type='TrussElement') == 3
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from compas.datastructures import Mesh
+
+from compas_fea.structure import Structure
+from compas_fea.utilities import extrude_layers
+from compas_fea.utilities import extrude_mesh
+from compas_fea.utilities import validate_mesh
+
+
+vertices = [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0]]
+faces = [[0, 1, 4, 3], [1, 2, 5], [1, 5, 4]]
+
+
+def test_extrude_layers():
+
+    extruded = extrude_layers(vertices, faces, 2, 0.5)
+    xyz = np.array(extruded['xyz'])
+
+    assert len(xyz) == 6 * 3
+    assert np.allclose(xyz[3 * 4 + 2], [1, 1, 1])  # vertex 4 on layer 2
+
+    hexes = extruded['blocks']['4']['elements']
+    assert hexes == [[0, 3, 12, 9, 1, 4, 13, 10], [1, 4, 13, 10, 2, 5, 14, 11]]
+    assert extruded['blocks']['4']['shells'] == [[2, 5, 14, 11]]
+    assert len(extruded['blocks']['3']['elements']) == 4
+
+    links = extruded['links']
+    assert links['elements'][:2] == [[0, 1], [1, 2]]
+    assert np.allclose(links['L'][:2], [[0, 0, 0.5], [0, 0, 1]])
+
+    with pytest.raises(ValueError):
+        extrude_layers(vertices + [[3, 0, 0], [3, 1, 0]], [[2, 6, 7, 5, 4]], 1, 0.5)
+
+
+def test_extrude_mesh():
+
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+
+    mdl = Structure(path='', name='extrude')
+    extrude_mesh(mdl, mesh, layers=2, thickness=0.5, mesh_name='top', links_name='links', blocks_name='blocks')
+
+    assert mdl.node_count() == 18
+
+    blocks = mdl.sets['blocks'].selection
+    assert len(blocks) == 6
+    assert sorted(mdl.sets['blocks_layer_0'].selection + mdl.sets['blocks_layer_1'].selection) == sorted(blocks)
+    assert len(mdl.sets['top'].selection) == 3 and len(mdl.sets['links'].selection) == 12
+
+    for ekey in mdl.sets['top'].selection:
+        assert all(mdl.nodes[i].z == 1 for i in mdl.elements[ekey].nodes)
+
+    # Hexahedra are bottom face then top face, in the right-handed order
+
+    hexes = [mdl.elements[i] for i in blocks if mdl.elements[i].__name__ == 'HexahedronElement']
+    assert [mdl.nodes_xyz(i.nodes[:4]) for i in hexes[:1]] == [[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]]
+    assert [mdl.nodes_xyz(i.nodes[4:]) for i in hexes[:1]] == [[[0, 0, 0.5], [1, 0, 0.5], [1, 1, 0.5], [0, 1, 0.5]]]
+
+    elements = [mdl.elements[i].nodes for i in blocks]
+    report = validate_mesh(mdl.nodes_xyz(), elements, ['solid'] * len(elements))
+    assert report['inverted'] == [] and report['degenerate'] == []
+
+    for ekey in mdl.sets['links'].selection:
+        element = mdl.elements[ekey]
+        a, b = mdl.nodes_xyz(element.nodes)
+        vertex = [i for i, xyz in enumerate(vertices) if xyz[:2] == a[:2]][0]
+        assert np.isclose(element.A, mesh.vertex_area(vertex))
+        assert np.allclose(element.L, [0, 0, b[2]])
@@ -0,0 +1,48 @@
+from compas_fea.utilities import derive_field
+from compas_fea.utilities import derived_fields
+from compas_fea.utilities import register_field
+
+
+def test_nodal_magnitude_with_missing_components():
+
+    data = {'ux': {0: 3., 1: 0., 2: None}, 'uy': {0: 4., 1: 1.}}
+
+    um = derive_field('um', data)
+
+    assert um[0] == 5. and um[1] == 1.
+    assert um[2] != um[2]  # no component at node 2
+
+    modal = derive_field('um2', {'ux2': {0: 6.}, 'uy2': {0: 8.}, 'uz2': {0: 0.}})
+    assert modal == {0: 10.}
+
+
+def test_element_stress_fields():
+
+    sxx = {0: {'ip1_sp1': 100., 'ip1_sp5': 60.}, 1: {'ip1_sp1': 10.}}
+    syy = {0: {'ip1_sp1': 40., 'ip1_sp5': 0.}, 1: {'ip1_sp1': 10.}}
+    sxy = {0: {'ip1_sp1': 30., 'ip1_sp5': 0.}, 1: {'ip1_sp1': 0.}}
+    data = {'sxx': sxx, 'syy': syy, 'sxy': sxy}
+
+    smises = derive_field('smises', data)
+    assert abs(smises[0]['ip1_sp1'] - (100.**2 + 40.**2 - 100. * 40. + 3 * 30.**2)**0.5) < 1e-9
+    assert abs(smises[1]['ip1_sp1'] - 10.) < 1e-9
+
+    tresca = derive_field('tresca', data)
+    assert abs(tresca[0]['ip1_sp5'] - 60.) < 1e-9  # plane stress, third principal is zero
+
+    smaxp = derive_field('smaxp', data)
+    assert abs(smaxp[0]['ip1_sp1'] - (70. + (30.**2 + 30.**2)**0.5)) < 1e-9
+
+    membrane = derive_field('smxx', {'sxx': sxx})
+    bending = derive_field('sbxx', {'sxx': sxx})
+    assert membrane[0] == {'ip1': 80.} and bending[0] == {'ip1': -20.}
+
+
+def test_register_field():
+
+    register_field('test_sum', 'nodal', ['ux', 'uy'], lambda arrays: arrays['ux'] + arrays['uy'])
+
+    try:
+        assert derive_field('test_sum', {'ux': {0: 1., 1: 2.}, 'uy': {0: 10., 1: 20.}}) == {0: 11., 1: 22.}
+    finally:
+        del derived_fields['test_sum']
@@ -0,0 +1,70 @@
+from compas_fea.fea.abaq.fil_read import iter_fil_records
+from compas_fea.fea.abaq.fil_read import read_fil
+from compas_fea.structure import GeneralStep
+from compas_fea.structure import Structure
+
+
+def _item(value):
+
+    if isinstance(value, int):
+        return 'I{0:02d}{1}'.format(len(str(value)), value)
+
+    return 'D' + '{0:22.15E}'.format(value).replace('E', 'D')
+
+
+def _write_fil(filename, records):
+
+    # ASCII .fil stream: '*' + record length + key + attributes, wrapped at 80 characters
+
+    stream = ''.join('*' + ''.join(_item(i) for i in [len(values) + 2, key] + values) for key, values in records)
+
+    with open(filename, 'w') as f:
+        for i in range(0, len(stream), 80):
+            f.write(stream[i:i + 80] + '\n')
+
+
+def test_read_fil_nodal_and_element_records(tmp_path):
+
+    mdl = Structure(path=str(tmp_path) + '/')
+    mdl.add([GeneralStep(name='step_bc'), GeneralStep(name='step_load')])
+    mdl.steps_order = ['step_bc', 'step_load']
+
+    filename = str(tmp_path) + '/model.fil'
+    shell_sf = [1., 2., 3., 4., 5., 6., 7., 8.]
+    beam_sf = [10., 20., 30., 40., 50., 60.]
+
+    _write_fil(filename, [
+        (2000, [1., 1., 0., 0., 0, 1, 1, 0, 1., 0.]),
+        (101, [1, 0.3, 0.4, 0., 0.01, 0.02, 0.03]),
+        (104, [2, -1.5, 0., 2., 0., 0., 0.]),
+        (1, [1, 1, 1, 0, 0, 2, 1, 0, 4]),
+        (11, [100., 40., 30.]),
+        (21, [0.001, -0.002, 0.0005]),
+        (13, shell_sf),
+        (1, [2, 1, 1, 0, 0, 1, 0, 0, 2]),
+        (13, beam_sf),
+        (2001, []),
+    ])
+
+    records = list(iter_fil_records(filename))
+    assert [key for key, _ in records] == [2000, 101, 104, 1, 11, 21, 13, 1, 13, 2001]
+    assert records[1][1] == [1, 0.3, 0.4, 0., 0.01, 0.02, 0.03]
+
+    results = read_fil(filename, mdl)['step_load']
+    nodal = results['nodal']
+    element = results['element']
+
+    assert nodal['ux'][0] == 0.3 and nodal['uy'][0] == 0.4
+    assert abs(nodal['um'][0] - 0.5) < 1e-12
+    assert nodal['urz'][0] == 0.03
+    assert nodal['rfx'][1] == -1.5 and nodal['rfz'][1] == 2.
+    assert abs(nodal['rfm'][1] - 2.5) < 1e-12
+
+    assert element['sxx'][0]['ip1_sp1'] == 100. and element['sxy'][0]['ip1_sp1'] == 30.
+    assert abs(element['smises'][0]['ip1_sp1'] - (100.**2 + 40.**2 - 100. * 40. + 3 * 30.**2)**0.5) < 1e-9
+    assert element['eyy'][0]['ip1_sp1'] == -0.002
+
+    shell = [element[i][0]['ip1_sp1'] for i in ['sf1', 'sf2', 'sf3', 'sf4', 'sf5', 'sm1', 'sm2', 'sm3']]
+    beam = [element[i][1]['ip1_sp1'] for i in ['sf1', 'sf2', 'sf3', 'sm1', 'sm2', 'sm3']]
+    assert shell == shell_sf
+    assert beam == beam_sf
@@ -0,0 +1,34 @@
+from compas_fea.structure import ElasticIsotropic
+from compas_fea.structure import ElementProperties
+from compas_fea.structure import LineLoad
+from compas_fea.structure import PointLoad
+from compas_fea.structure import Structure
+from compas_fea.structure import TrussSection
+
+
+def _truss():
+
+    mdl = Structure(path='', name='truss')
+    mdl.add_nodes([[0, 0, 0], [1, 0, 0]])
+    mdl.add_element(nodes=[0, 1], type='TrussElement')
+    mdl.add_set(name='elset_truss', type='element', selection=[0])
+    mdl.add(ElasticIsotropic(name='mat', E=10**9, v=0.3, p=1000))
+    mdl.add(TrussSection(name='sec', A=0.01))
+    mdl.add(ElementProperties(name='ep', material='mat', section='sec', elset='elset_truss'))
+    mdl.add(LineLoad(name='line', elements='elset_truss', z=-1, axes='global'))
+    mdl.add(PointLoad(name='point', nodes=[1], x=2))
+
+    return mdl
+
+
+def test_load_vector_follows_node_moves():
+
+    mdl = _truss()
+
+    assert mdl.load_vector('line')['forces'] == [[0, 0, -0.5, 0, 0, 0], [0, 0, -0.5, 0, 0, 0]]
+    assert mdl.load_vector('point')['forces'] == [[2, 0, 0, 0, 0, 0]]
+
+    mdl.nodes[1].x = 3
+
+    assert mdl.load_vector('line')['forces'] == [[0, 0, -1.5, 0, 0, 0], [0, 0, -1.5, 0, 0, 0]]
+    assert mdl.load_vector('point')['forces'] == [[2, 0, 0, 0, 0, 0]]
@@ -0,0 +1,47 @@
+import numpy as np
+
+from compas_fea.utilities import area_load_vector
+from compas_fea.utilities import line_load_vector
+
+
+def test_line_load_vector():
+
+    nodes = [[0, 0, 0], [2, 0, 0], [4, 0, 0]]
+    w = [0, 0, -3]
+
+    loads = line_load_vector(nodes, [[0, 1], [1, 2]], w)
+    forces = np.array(loads['forces'])
+
+    assert loads['nodes'] == [0, 1, 2]
+    assert np.allclose(forces[:, 2], [-3, -6, -3])
+    assert np.allclose(forces[:, 2].sum(), -3 * 4)
+    assert np.allclose(forces[:, 3:], 0)
+
+    # Fixed-end moments +- L / 12 (d x w) = +- 1 about y, cancelling at a node shared by two beams
+
+    forces = np.array(line_load_vector(nodes, [[0, 1], [1, 2]], w, moments=[True, True])['forces'])
+    assert np.allclose(forces[:, 4], [1, 0, -1])
+
+    forces = np.array(line_load_vector(nodes, [[0, 1], [1, 2]], w, moments=[True, False])['forces'])
+    assert np.allclose(forces[:, 4], [1, -1, 0])
+
+
+def test_area_load_vector():
+
+    nodes = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+    elements = [[0, 1, 2, 3], [1, 4, 2]]
+
+    loads = area_load_vector(nodes, elements, [1, 0, -2])
+    forces = np.array(loads['forces'])
+
+    assert loads['nodes'] == [0, 1, 2, 3, 4]
+    assert np.allclose(forces[:, :3].sum(axis=0), [1.5, 0, -3])
+    assert np.allclose(forces[[0, 3], 2], -0.5)
+    assert np.allclose(forces[4, 2], -2 * 0.5 / 3)
+
+    # A positive local pressure acts against the element normal, here +z for both elements
+
+    forces = np.array(area_load_vector(nodes, elements, [7, 7, 5], axes='local')['forces'])
+    assert np.allclose(forces[:, :2], 0)
+    assert np.allclose(forces[:, 2].sum(), -5 * 1.5)
+    assert area_load_vector(nodes, [], [0, 0, 1]) == {'nodes': [], 'forces': []}
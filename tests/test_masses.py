@@ -0,0 +1,70 @@
+import numpy as np
+
+from compas_fea.structure import ElasticIsotropic
+from compas_fea.structure import ElementProperties
+from compas_fea.structure import GravityLoad
+from compas_fea.structure import Structure
+from compas_fea.structure import TrussSection
+from compas_fea.utilities import lumped_masses
+from compas_fea.utilities import mass_properties
+
+
+def test_lumped_masses():
+
+    nodes = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1], [3, 0, 0]]
+    elements = [
+        [0, 1, 2, 3, 4, 5, 6, 7],  # unit hex
+        [0, 1, 3, 4],              # tet of volume 1 / 6
+        [1, 8],                    # line of length 2
+        [0, 1, 2, 3],              # unit square shell
+        [8],                       # point
+    ]
+    kinds = ['solid', 'solid', 'line', 'shell', 'point']
+    factors = [6., 6., 0.5, 2., 7.]
+
+    result = lumped_masses(nodes, elements, kinds, factors)
+
+    assert np.allclose(result['elements'], [6., 1., 1., 2., 7.])
+    assert np.allclose(sum(result['nodes']), 17.)
+    assert np.allclose(result['nodes'][8], 0.5 + 7.)
+    assert np.allclose(result['nodes'][6], 6. / 8)
+    assert np.allclose(result['nodes'][0], 6. / 8 + 1. / 4 + 2. / 4)
+
+
+def test_mass_properties():
+
+    result = mass_properties([[-1, 0, 0], [1, 0, 0], [1, 2, 0]], [1., 1., 2.])
+
+    assert result['total'] == 4.
+    assert np.allclose(result['centre'], [0.5, 1., 0.])
+
+    # Inertia of point masses about the centre of gravity
+
+    r = np.array([[-1.5, -1., 0.], [0.5, -1., 0.], [0.5, 1., 0.]])
+    m = np.array([1., 1., 2.])
+    inertia = sum(mi * (np.dot(ri, ri) * np.eye(3) - np.outer(ri, ri)) for mi, ri in zip(m, r))
+    assert np.allclose(result['inertia'], inertia)
+
+    assert mass_properties([[0, 0, 0]], [0.])['total'] == 0.
+
+
+def test_structure_mass_properties_follow_node_moves():
+
+    mdl = Structure(path='', name='truss')
+    mdl.add_nodes([[0, 0, 0], [1, 0, 0]])
+    mdl.add_element(nodes=[0, 1], type='TrussElement')
+    mdl.add_set(name='elset_truss', type='element', selection=[0])
+    mdl.add(ElasticIsotropic(name='mat', E=10**9, v=0.3, p=1000))
+    mdl.add(TrussSection(name='sec', A=0.01))
+    mdl.add(ElementProperties(name='ep', material='mat', section='sec', elset='elset_truss'))
+    mdl.add(GravityLoad(name='gravity', elements='elset_truss'))
+
+    assert np.isclose(mdl.mass_properties()['total'], 10.)
+    assert np.allclose(mdl.load_vector('gravity')['forces'], [[0, 0, -49.05, 0, 0, 0]] * 2)
+
+    mdl.nodes[1].x = 3
+
+    properties = mdl.mass_properties()
+    assert np.isclose(properties['total'], 30.)
+    assert np.allclose(properties['centre'], [1.5, 0, 0])
+    assert np.allclose(mdl.load_vector('gravity')['forces'], [[0, 0, -147.15, 0, 0, 0]] * 2)
@@ -0,0 +1,54 @@
+import os
+
+from compas_fea.utilities import MeshCache
+from compas_fea.utilities import mesh_cache
+from compas_fea.utilities import mesh_cache_key
+
+
+def test_mesh_cache_key():
+
+    vertices = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    key = mesh_cache_key('discretise', vertices, [[0, 1, 2]], target=0.1)
+
+    assert key == mesh_cache_key('discretise', [[0., 0., 0.], [1., 0., 0.], [0., 1., 0.]], [[0, 1, 2]], target=0.1)
+    assert key != mesh_cache_key('discretise', vertices, [[0, 1, 2]], target=0.2)
+    assert key != mesh_cache_key('discretise', vertices, [[0, 2, 1]], target=0.1)
+    assert key != mesh_cache_key('tets', vertices, [[0, 1, 2]], target=0.1)
+    assert key != mesh_cache_key('discretise', [[0, 0, 0], [1, 0, 0], [0, 1, 1e-12]], [[0, 1, 2]], target=0.1)
+
+
+def test_get_set_and_eviction(tmp_path):
+
+    cache = MeshCache(path=str(tmp_path / 'cache'), max_bytes=10**6)
+
+    assert cache.get('missing') is None
+
+    data = {'points': [[0., 0., 0.], [1., 0., 0.]], 'elements': [[0, 1]]}
+    cache.set('a', data)
+    assert cache.get('a') == data
+
+    cache.set('b', [0] * 100)
+    cache.set('c', [1] * 100)
+
+    # Make 'b' the least recently used, then shrink the limit to fit two entries
+
+    for age, key in enumerate(['b', 'a', 'c']):
+        os.utime(cache.filename(key), (1000 + age, 1000 + age))
+
+    cache.max_bytes = sum(i[1] for i in cache.entries()[1:])
+    assert cache.evict() == 1
+    assert cache.get('b') is None
+    assert cache.get('a') == data and cache.get('c') == [1] * 100
+
+    cache.clear()
+    assert cache.entries() == []
+
+
+def test_mesh_cache_resolver(tmp_path):
+
+    cache = MeshCache(path=str(tmp_path))
+
+    assert mesh_cache(None) is None and mesh_cache(False) is None
+    assert mesh_cache(cache) is cache
+    assert mesh_cache(str(tmp_path)).path == str(tmp_path)
+    assert isinstance(mesh_cache(True), MeshCache)
@@ -0,0 +1,83 @@
+import json
+
+from compas.datastructures import Mesh
+
+from compas_fea.fea.opensees import opensees
+from compas_fea.structure import ElasticIsotropic
+from compas_fea.structure import ElementProperties
+from compas_fea.structure import GeneralStep
+from compas_fea.structure import PinnedDisplacement
+from compas_fea.structure import PointLoad
+from compas_fea.structure import ShellSection
+from compas_fea.structure import Structure
+
+
+def _shell_model(path):
+
+    vertices = [[i % 5, i // 5, 0] for i in range(25)]
+    faces = [[r * 5 + c, r * 5 + c + 1, r * 5 + c + 6, r * 5 + c + 5] for r in range(4) for c in range(4)]
+
+    mdl = Structure(path=path, name='parts')
+    mdl.add_nodes_elements_from_mesh(Mesh.from_vertices_and_faces(vertices, faces), element_type='ShellElement',
+                                     elset='elset_shells')
+    mdl.add_node([10, 10, 0])  # orphan node 25
+    mdl.add_set(name='nset_pins', type='node', selection=[0, 4, 25])
+    mdl.add(ElasticIsotropic(name='mat', E=10**9, v=0.3, p=1000))
+    mdl.add(ShellSection(name='sec', t=0.1))
+    mdl.add(ElementProperties(name='ep', material='mat', section='sec', elset='elset_shells'))
+    mdl.add(PinnedDisplacement(name='disp', nodes='nset_pins'))
+    mdl.add(PointLoad(name='load', nodes=[24, 25], z=-1))
+    mdl.add([GeneralStep(name='step_bc', displacements=['disp']), GeneralStep(name='step_load', loads=['load'])])
+    mdl.steps_order = ['step_bc', 'step_load']
+
+    return mdl
+
+
+def _fake_processes(temp, manifest):
+
+    # Stand-in for mpiexec OpenSeesMP: each process writes the records of its own nodes
+
+    for recorder in manifest['recorders'].values():
+        for part in recorder['parts']:
+            with open(temp + part['file'], 'w') as f:
+                for t in [0.5, 1.0]:
+                    values = [t * (node + 1) * scale for node in part['nodes'] for scale in [1, 10, 100]]
+                    f.write(' '.join(str(i) for i in [t] + values) + '\n')
+
+
+def test_partitioned_write_and_merge(tmp_path):
+
+    path = str(tmp_path) + '/'
+    mdl = _shell_model(path)
+    sets = sorted(mdl.sets)
+
+    mdl.write_input_file(software='opensees', fields=['u'], parts=2)
+
+    assert sorted(mdl.sets) == sets
+
+    with open(path + 'parts.tcl') as f:
+        lines = f.read().splitlines()
+
+    assert sum(line.startswith('node ') for line in lines) >= 26
+    assert 'node 26 10.000 10.000 0.000' in lines
+    assert 'fix 26 1 1 1 0 0 0' in lines
+    assert sum(line.startswith('load 26 ') for line in lines) == 1
+
+    temp = path + 'parts/'
+
+    with open(temp + 'recorders.json') as f:
+        manifest = json.load(f)
+
+    assert manifest['parts'] == 2
+    recorded = sorted(i for part in manifest['recorders']['step_load_u']['parts'] for i in part['nodes'])
+    assert recorded == list(range(26))
+
+    _fake_processes(temp, manifest)
+    opensees.extract_data(mdl, ['u'])
+
+    nodal = mdl.results['step_load']['nodal']
+
+    for node in range(26):
+        assert nodal['ux'][node] == node + 1
+        assert nodal['uy'][node] == 10 * (node + 1)
+        assert nodal['uz'][node] == 100 * (node + 1)
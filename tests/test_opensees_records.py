@@ -0,0 +1,89 @@
+import glob
+
+import numpy as np
+import pytest
+
+from compas_fea.fea.frames import FrameWriter
+from compas_fea.fea.frames import iter_frames
+from compas_fea.fea.opensees import opensees
+from compas_fea.fea.opensees.opensees import _iter_records
+from compas_fea.fea.opensees.opensees import _read_last_record
+from compas_fea.fea.opensees.opensees import _read_records
+from compas_fea.structure import Structure
+
+
+records = np.array([[0.5, 1., 2., 3.], [1., -4., 5e-3, 6.], [1.5, 7.25, 8., -9.]])
+
+
+def test_text_records(tmp_path):
+
+    filename = str(tmp_path / 'node_u.out')
+
+    with open(filename, 'w') as f:
+        for record in records:
+            f.write(' '.join(repr(float(i)) for i in record) + '\n')
+        f.write('2.0 1.5 2')  # partial record of an aborted analysis
+
+    for blocksize in [4, 65536]:
+        assert _read_last_record(filename, 4, blocksize=blocksize) == records[-1].tolist()
+
+    assert np.array_equal(_read_records(filename, 4), records)
+    assert np.array_equal(np.array(list(_iter_records(filename, 4))), records)
+
+
+def test_binary_records(tmp_path):
+
+    filename = str(tmp_path / 'node_u.out')
+    np.concatenate([records.ravel(), [2., 1.5]]).tofile(filename)  # with a partial final record
+
+    assert np.array_equal(_read_last_record(filename, 4, binary=True), records[-1])
+    assert np.array_equal(_read_records(filename, 4, binary=True), records)
+    assert np.array_equal(np.array(list(_iter_records(filename, 4, binary=True))), records)
+
+
+@pytest.mark.parametrize('binary, content', [(False, b''), (False, b'\n\n'), (False, b'0.5 1.0'), (True, b''),
+                                             (True, np.zeros(3).tobytes())])
+def test_no_complete_record(tmp_path, binary, content):
+
+    filename = str(tmp_path / 'node_u.out')
+
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+    with pytest.raises(ValueError):
+        _read_last_record(filename, 4, binary=binary)
+
+    assert len(_read_records(filename, 4, binary=binary)) == 0
+
+
+def test_frame_store(tmp_path):
+
+    temp = str(tmp_path)
+    labels = {'sf1': ['ip1', 'ip2']}
+
+    with FrameWriter(temp, 'step_load', chunk=2) as writer:
+        for i in range(5):
+            writer.append(0.2 * (i + 1), nodal={'ux': np.arange(3.) * i}, element={'sf1': np.full((2, 2), i)}, labels=labels)
+
+    assert len(glob.glob(temp + '/step_load-frames_ux_*.npy')) == 3
+
+    frames = list(iter_frames(temp, 'step_load'))
+
+    assert [time for time, _ in frames] == [0.2 * (i + 1) for i in range(5)]
+    assert [sorted(data) for _, data in frames] == [['sf1', 'ux']] * 5
+    assert all(np.array_equal(data['ux'], np.arange(3.) * i) for i, (_, data) in enumerate(frames))
+    assert all(np.array_equal(data['sf1'], np.full((2, 2), i)) for i, (_, data) in enumerate(frames))
+
+    frames = list(iter_frames(temp, 'step_load', fields='ux'))
+
+    assert len(frames) == 5 and all(list(data) == ['ux'] for _, data in frames)
+    assert frames[-1][1]['ux'].tolist() == [0., 4., 8.]
+
+
+def test_extract_data_without_manifest(tmp_path):
+
+    mdl = Structure(path=str(tmp_path) + '/', name='old')
+    mdl.steps_order = ['step_bc', 'step_load']
+
+    with pytest.raises(IOError, match='re-run write_input_file'):
+        opensees.extract_data(mdl, ['u'])
@@ -0,0 +1,62 @@
+import numpy as np
+
+from compas.datastructures import Mesh
+
+from compas_fea.structure import Structure
+from compas_fea.utilities import element_adjacency
+from compas_fea.utilities import partition_elements
+
+
+def _strip():
+
+    # 4 x 1 quads along x and an unused node 10
+
+    nodes = [[i % 5, i // 5, 0] for i in range(10)] + [[10, 10, 0]]
+    elements = [[c, c + 1, c + 6, c + 5] for c in range(4)]
+
+    return nodes, elements
+
+
+def test_element_adjacency():
+
+    nodes, elements = _strip()
+
+    G = element_adjacency(elements, len(nodes)).toarray()
+
+    assert np.array_equal(G, [[0, 1, 0, 0], [1, 0, 1, 0], [0, 1, 0, 1], [0, 0, 1, 0]])
+    assert not element_adjacency(elements, len(nodes), ncommon=3).nnz
+
+
+def test_partition_elements():
+
+    nodes, elements = _strip()
+
+    for method in ['rcb', 'spectral']:
+
+        report = partition_elements(nodes, elements, 2, method=method)
+
+        assert sorted(report['elements'].tolist()) == [0, 0, 1, 1]
+        assert report['elements'][0] != report['elements'][3]
+        assert report['interface'].tolist() == [2, 7]
+        assert report['nodes'][10] == -1
+        assert report['edge_cut'] == 1
+        assert report['imbalance'] == 1.
+
+    report = partition_elements(nodes, elements, 3, weights=[1, 1, 2, 2])
+    assert report['sizes'].tolist() == [2., 2., 2.]
+
+
+def test_structure_partition():
+
+    vertices = [[i % 5, i // 5, 0] for i in range(10)]
+    faces = [[c, c + 1, c + 6, c + 5] for c in range(4)]
+
+    mdl = Structure(path='', name='strip')
+    mdl.add_nodes_elements_from_mesh(Mesh.from_vertices_and_faces(vertices, faces), element_type='ShellElement')
+
+    report = mdl.partition(2)
+
+    assert sorted(report['elements'][0] + report['elements'][1]) == [0, 1, 2, 3]
+    assert sorted(report['interface']) == [2, 7]
+    assert sorted(mdl.sets['partition_interface'].selection) == [2, 7]
+    assert sorted(mdl.sets['partition_0'].selection) == sorted(report['elements'][0])
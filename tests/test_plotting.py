@@ -0,0 +1,29 @@
+from compas_fea.utilities import plot_geometry
+
+
+def test_plot_geometry_shells_solids_and_pipes():
+
+    nodes = [[x, y, z] for z in [0, 1] for y in [0, 1] for x in [0, 1, 2]]  # 12 nodes of two hexes
+    hexes = [[0, 1, 4, 3, 6, 7, 10, 9], [1, 2, 5, 4, 7, 8, 11, 10]]
+    elements = hexes + [[0, 1, 2], [0, 6]]
+    etypes = ['HexahedronElement'] * 2 + ['ShellElement', 'BeamElement']
+    n = len(nodes)
+
+    data = [float(i) for i in range(n)]
+    geometry = plot_geometry(nodes, elements, etypes, [0.] * n, [0.] * n, [1.] * n, data, 'nodal', scale=0.5, sides=4)
+
+    vertices = geometry['vertices']
+    faces = geometry['faces']
+
+    assert vertices.shape == (n + 2 * 4, 3)
+    assert abs(vertices[:n, 2] - [z + 0.5 for x, y, z in nodes]).max() < 1e-12
+    assert faces.shape == (1 + 10 + 4, 4)  # triangle, hull without the shared face, pipe sides
+    assert faces[0].tolist() == [0, 1, 2, 2]
+    assert geometry['colors'].shape == (len(vertices), 3)
+    assert geometry['fabs'] == n - 1
+
+    solid = faces[1:11]
+    assert not any(sorted(face) == [1, 4, 7, 10] for face in solid.tolist())
+
+    everything = plot_geometry(nodes, elements, etypes, [0.] * n, [0.] * n, [0.] * n, data, 'nodal', hull=False)
+    assert len(everything['faces']) == 1 + 12 + 4
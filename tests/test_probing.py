@@ -0,0 +1,68 @@
+from compas.datastructures import Mesh
+
+from compas_fea.structure import Structure
+from compas_fea.utilities import interpolate_nodal
+from compas_fea.utilities import locate_points
+from compas_fea.utilities import transfer_results
+
+
+def _grid(path, nx, dx):
+
+    vertices = [[i % (nx + 1) * dx, i // (nx + 1) * dx, 0] for i in range(2 * (nx + 1))]
+    faces = [[c, c + 1, c + nx + 2, c + nx + 1] for c in range(nx)]
+    mdl = Structure(path=path)
+    mdl.add_nodes_elements_from_mesh(Mesh.from_vertices_and_faces(vertices, faces), element_type='ShellElement')
+
+    return mdl
+
+
+def test_locate_and_interpolate_quads():
+
+    nodes = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]]
+    elements = [[0, 1, 2, 3], [1, 4, 5, 2]]
+    points = [[0.25, 0.5, 0], [1.5, 0.25, 0], [5, 5, 0]]
+
+    owner, owner_nodes, weights = locate_points(nodes, elements, ['ShellElement'] * 2, points)
+
+    assert owner.tolist() == [0, 1, -1]
+
+    values = [x + 10 * y for x, y, z in nodes]
+    result = interpolate_nodal(values, owner, owner_nodes, weights)
+
+    assert abs(result[0] - 5.25) < 1e-9
+    assert abs(result[1] - 4.) < 1e-9
+
+
+def test_transfer_results_outside_points(tmp_path):
+
+    source = _grid(str(tmp_path) + '/', nx=2, dx=1.)
+    target = _grid(str(tmp_path) + '/', nx=3, dx=1.)  # extends one element beyond the source
+
+    source.results['step'] = {
+        'nodal': {'ux': {i: node.x for i, node in source.nodes.items()}},
+        'element': {'sxx': {0: {'ip1': 1., 'ip2': 3.}, 1: {'ip1': 5., 'ip2': 5.}}},
+    }
+
+    smooth = transfer_results(source, target, 'step', smooth=True)
+
+    ux = smooth['nodal']['ux']
+    assert all(abs(ux[i] - min(node.x, 2.)) < 1e-9 for i, node in target.nodes.items())
+
+    sxx = smooth['element']['sxx']
+    assert sorted(sxx) == [0, 1, 2]
+    assert sxx[2]['ip'] == 5.
+
+    copied = transfer_results(source, target, 'step', smooth=False)['element']['sxx']
+    assert copied == {0: {'ip1': 1., 'ip2': 3.}, 1: {'ip1': 5., 'ip2': 5.}, 2: {'ip1': 5., 'ip2': 5.}}
+
+
+def test_locate_points_follows_node_moves():
+
+    mdl = _grid('', 2, 1.)
+
+    assert mdl.locate_points([[2.5, 0.5, 0]])[0].tolist() == [-1]
+
+    for node in [2, 5]:
+        mdl.nodes[node].x = 3.
+
+    assert mdl.locate_points([[2.5, 0.5, 0]])[0].tolist() == [1]
@@ -0,0 +1,71 @@
+import pytest
+
+from compas_fea.structure import Structure
+from compas_fea.utilities import combine_all_sets
+from compas_fea.utilities import combine_selections
+from compas_fea.utilities import selection_complement
+from compas_fea.utilities import selection_difference
+from compas_fea.utilities import selection_intersection
+from compas_fea.utilities import selection_union
+
+
+@pytest.mark.parametrize('n', [None, 12])
+def test_set_algebra_sparse_and_dense(n):
+
+    a = [5, 1, 1, 3, 9]
+    b = [3, 4, 5, 6, 7]
+    c = [5, 11]
+
+    assert selection_union([a, b, c], n) == sorted(set(a) | set(b) | set(c))
+    assert selection_intersection([a, b, c], n) == [5]
+    assert selection_difference([a, b, c], n) == [1, 9]
+    assert selection_union([], n) == []
+
+
+def test_complement_and_key_range():
+
+    assert selection_complement([[0, 2], [5]], 6) == [1, 3, 4]
+
+    with pytest.raises(ValueError):
+        selection_union([[0, 12]], 12)
+
+    with pytest.raises(ValueError):
+        selection_difference([[-1, 2]])
+
+
+def test_combine_selections_keeps_order_and_repeats():
+
+    sets_a = {1: [3, 1, 2, 3, 9], 'b': [5, 2]}
+    sets_b = {0: [2, 3, 3], 'x': [3, 5], 7: []}
+    expected = {'1,0': [3, 2, 3], '1,x': [3, 3], 'b,0': [2], 'b,x': [5]}
+
+    assert combine_selections(list(sets_a.values()), list(sets_b.values())) == [
+        [0, 0, [3, 2, 3]], [0, 1, [3, 3]], [1, 0, [2]], [1, 1, [5]]]
+    assert combine_all_sets(sets_a, sets_b) == expected
+    assert list(combine_all_sets(sets_a, sets_b)) == list(expected)
+
+    names = {i: [str(x) for x in keys] for i, keys in sets_a.items()}
+    others = {j: [str(x) for x in keys] for j, keys in sets_b.items()}
+    assert combine_all_sets(names, others) == {i: [str(x) for x in keys] for i, keys in expected.items()}
+
+
+def test_structure_set_operations(tmp_path):
+
+    mdl = Structure(path=str(tmp_path) + '/')
+    for i in range(10):
+        mdl.add_node([i, 0, 0])
+    mdl.virtual_nodes[0] = mdl.node_count()
+
+    mdl.add_set('a', 'node', [5, 1, 1, 3])
+    mdl.add_set('b', 'node', list(range(3, 8)) + [10])
+    mdl.add_set('e', 'element', [0])
+
+    assert mdl.sets['a'].selection == [1, 3, 5]
+    assert mdl.set_union(['a', 'b']) == [1, 3, 4, 5, 6, 7, 10]
+    assert mdl.set_intersection(['a', 'b'], name='ab') == [3, 5]
+    assert mdl.sets['ab'].selection == [3, 5] and mdl.sets['ab'].type == 'node'
+    assert mdl.set_difference(['b', 'a']) == [4, 6, 7, 10]
+    assert mdl.set_complement(['a', 'b']) == [0, 2, 8, 9]
+
+    with pytest.raises(ValueError):
+        mdl.set_union(['a', 'e'])
@@ -0,0 +1,85 @@
+import numpy as np
+
+from compas.datastructures import Mesh
+
+from compas_fea.structure import ElasticIsotropic
+from compas_fea.structure import ElementProperties
+from compas_fea.structure import GeneralStep
+from compas_fea.structure import PinnedDisplacement
+from compas_fea.structure import ShellSection
+from compas_fea.structure import Structure
+from compas_fea.structure import TributaryLoad
+from compas_fea.utilities import tributary_areas
+
+
+def _mesh():
+
+    # A non-planar quad and two triangles, and a separate triangle whose vertex 6 coincides with vertex 2
+
+    vertices = [[0, 0, 0], [1, 0, 0.2], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0.5], [2, 0, 0], [3, 0, 0], [3, 1, 0]]
+    faces = [[0, 1, 4, 3], [1, 2, 5], [1, 5, 4], [6, 7, 8]]
+
+    return Mesh.from_vertices_and_faces(vertices, faces)
+
+
+def test_tributary_areas_match_vertex_area():
+
+    mesh = _mesh()
+    vertices = [mesh.vertex_coordinates(key) for key in mesh.vertices()]
+    faces = [mesh.face_vertices(fkey) for fkey in mesh.faces()]
+
+    areas = tributary_areas(vertices, faces)
+
+    assert np.allclose(areas, [mesh.vertex_area(key) for key in mesh.vertices()])
+    assert np.isclose(sum(areas), sum(mesh.face_area(fkey) for fkey in mesh.faces()))
+
+
+def test_tributary_load():
+
+    mesh = _mesh()
+    areas = [mesh.vertex_area(key) for key in mesh.vertices()]
+
+    mdl = Structure(path='', name='tributary')
+    mdl.add_nodes([mesh.vertex_coordinates(key) for key in [0, 1, 2, 3, 4, 5, 7]])  # no node at vertex 8
+
+    load = TributaryLoad(mdl, name='snow', mesh=mesh, z=-2)
+
+    assert load.nodes == [0, 1, 2, 3, 4, 5, 6]
+    assert np.allclose(load.areas, areas[:2] + [areas[2] + areas[6]] + areas[3:6] + [areas[7]])
+    assert np.allclose(load.forces, [[0, 0, -2 * A] for A in load.areas])
+    assert load.components == {'x': 0, 'y': 0, 'z': -2}
+
+    wind = TributaryLoad(mdl, name='wind', mesh=None, x=3, tributary={'nodes': load.nodes, 'areas': load.areas})
+
+    assert wind.nodes == load.nodes and wind.areas == load.areas
+    assert np.allclose(wind.forces, [[3 * A, 0, 0] for A in load.areas])
+
+    mdl.add([load, wind])
+    vector = mdl.load_vector('wind')
+
+    assert vector['nodes'] == load.nodes
+    assert np.allclose(vector['forces'], [[3 * A, 0, 0, 0, 0, 0] for A in load.areas])
+
+
+def test_tributary_load_abaqus_cload(tmp_path):
+
+    mesh = _mesh()
+
+    mdl = Structure(path=str(tmp_path) + '/', name='tributary')
+    mdl.add_nodes_elements_from_mesh(mesh, element_type='ShellElement', elset='elset_shells')
+    mdl.add(ElasticIsotropic(name='mat', E=10**9, v=0.3, p=1000))
+    mdl.add(ShellSection(name='sec', t=0.1))
+    mdl.add(ElementProperties(name='ep', material='mat', section='sec', elset='elset_shells'))
+    mdl.add(PinnedDisplacement(name='disp', nodes=[0, 3]))
+    mdl.add(TributaryLoad(mdl, name='snow', mesh=mesh, z=-2))
+    mdl.add([GeneralStep(name='step_bc', displacements=['disp']), GeneralStep(name='step_load', loads=['snow'])])
+    mdl.steps_order = ['step_bc', 'step_load']
+    mdl.write_input_file(software='abaqus', fields=['u'], output=False)
+
+    with open(str(tmp_path / 'tributary.inp')) as f:
+        lines = f.read().split('*CLOAD')[1].splitlines()[2:10]
+
+    load = mdl.loads['snow']
+
+    assert len(load.nodes) == 8  # vertices 2 and 6 share a node
+    assert [[float(i) for i in line.split(', ')] for line in lines] == [[node + 1, 3, force[2]] for node, force in zip(load.nodes, load.forces)]
@@ -0,0 +1,69 @@
+import pytest
+
+from compas.datastructures import Mesh
+
+from compas_fea.structure import ElasticIsotropic
+from compas_fea.structure import ElementProperties
+from compas_fea.structure import FixedDisplacement
+from compas_fea.structure import GeneralStep
+from compas_fea.structure import ShellSection
+from compas_fea.structure import Structure
+from compas_fea.utilities import validate_mesh
+
+
+def test_validate_mesh():
+
+    cube = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+    nodes = cube + [[5, 0, 0], [5, 0, 0.0001], [9, 9, 9]]
+    elements = [
+        [0, 1, 2, 3, 4, 5, 6, 7],  # right-handed hex
+        [4, 5, 6, 7, 0, 1, 2, 3],  # inverted hex
+        [0, 1, 2, 2, 4, 5, 6, 6],  # repeated nodes
+        [8, 9],                    # zero length at tol 3
+    ]
+    kinds = ['solid', 'solid', 'solid', 'line']
+    restraints = [[True] * 6] + [[False] * 6] * 10
+
+    report = validate_mesh(nodes, elements, kinds, restraints, tol=3)
+
+    assert report['unused'] == [10]
+    assert report['duplicates'] == [[8, 9]]
+    assert report['degenerate'] == [2, 3]
+    assert report['inverted'] == [1]
+    assert report['components'] == [0] * 8 + [1, 1, -1]
+    assert report['mechanisms'] == [{'component': 1, 'size': 2, 'free': ['x', 'y', 'z']}]
+
+
+def _plate(fixed=True):
+
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+
+    mdl = Structure(path='', name='plate')
+    mdl.add_nodes_elements_from_mesh(Mesh.from_vertices_and_faces(vertices, [[0, 1, 2, 3]]), element_type='ShellElement',
+                                     elset='elset_shells')
+    mdl.add(ElasticIsotropic(name='mat', E=10**9, v=0.3, p=1000))
+    mdl.add(ShellSection(name='sec', t=0.1))
+    mdl.add(ElementProperties(name='ep', material='mat', section='sec', elset='elset_shells'))
+    mdl.add(FixedDisplacement(name='disp', nodes=[0, 1] if fixed else [0, 99]))
+    mdl.add(GeneralStep(name='step_bc', displacements=['disp']))
+    mdl.steps_order = ['step_bc']
+
+    return mdl
+
+
+def test_structure_validate():
+
+    report = _plate().validate(output=False)
+
+    assert report['valid'] and not report['warnings']
+
+    mdl = _plate(fixed=False)
+    mdl.add_node([5, 5, 5])
+    report = mdl.validate(output=False)
+
+    assert not report['valid']
+    assert report['unused_nodes'] == [4]
+    assert report['missing'] == ["Displacement 'disp': unknown node 99"]
+
+    with pytest.raises(ValueError):
+        mdl.analyse(software='opensees', output=False, validate=True)
@@ -0,0 +1,91 @@
+import numpy as np
+
+from compas_fea.utilities import voxel_grid
+from compas_fea.utilities import voxelise
+from compas_fea.utilities import write_voxels
+
+
+def _linear(xyz):
+
+    xyz = np.asarray(xyz, dtype=float)
+
+    return 1. + 2. * xyz[..., 0] - 3. * xyz[..., 1] + 0.5 * xyz[..., 2]
+
+
+def _centres(origin, vdx, shape):
+
+    return origin + vdx * np.stack(np.meshgrid(*[np.arange(i) for i in shape], indexing='ij'), axis=-1)
+
+
+def test_voxel_grid():
+
+    origin, shape = voxel_grid([[0, 0, 0], [1, 2, 0.3]], 0.5)
+
+    assert origin.tolist() == [0, 0, 0]
+    assert shape == (3, 5, 1)
+
+    origin, shape = voxel_grid([[0, 0, 0]], 0.5, bounds=[[-1, -1, -1], [1, 1, 1]])
+
+    assert origin.tolist() == [-1, -1, -1]
+    assert shape == (5, 5, 5)
+
+
+def test_elements_hex_linear_field():
+
+    nodes = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [0, 0, 2], [2, 0, 2], [2, 2, 2], [0, 2, 2]]
+    values = _linear(nodes)
+
+    # 729 voxels over 6 tets, in groups of at most 7 candidates
+
+    for workers in [1, 2]:
+        volume, origin, vdx = voxelise(nodes, values, 0.25, elements=[list(range(8))], method='elements', chunk=7,
+                                       workers=workers)
+
+        assert volume.shape == (9, 9, 9)
+        assert not np.isnan(volume).any()
+        assert np.allclose(volume, _linear(_centres(origin, vdx, volume.shape)))
+
+
+def test_elements_wedge_linear_field():
+
+    nodes = [[0, 0, 0], [2, 0, 0], [0, 2, 0], [0, 0, 2], [2, 0, 2], [0, 2, 2]]
+    values = _linear(nodes)
+
+    volume, origin, vdx = voxelise(nodes, values, 0.25, elements=[list(range(6))], method='elements', chunk=5)
+    xyz = _centres(origin, vdx, volume.shape)
+    s = xyz[..., 0] + xyz[..., 1]
+
+    assert np.allclose(volume[s < 2 - 1e-6], _linear(xyz[s < 2 - 1e-6]))
+    assert np.isnan(volume[s > 2 + 1e-6]).all()
+
+
+def test_cutoff_and_fill():
+
+    nodes = [[0, 0, 0], [4, 0, 0]]
+    values = [1., 3.]
+
+    volume, _, _ = voxelise(nodes, values, 1., method='nearest', cutoff=1., fill=-1., chunk=2)
+    assert volume.ravel().tolist() == [1., 1., -1., 3., 3.]
+
+    volume, _, _ = voxelise(nodes, values, 1., method='idw', k=2, cutoff=1.)
+    assert volume[0, 0, 0] == 1. and volume[4, 0, 0] == 3.
+    assert np.isnan(volume[2, 0, 0])
+    assert 1. < volume[1, 0, 0] < 2.
+
+
+def test_write_voxels(tmp_path):
+
+    nodes = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [0, 0, 2], [2, 0, 2], [2, 2, 2], [0, 2, 2]]
+    filename = str(tmp_path / 'voxels.vti')
+
+    shape = write_voxels(filename, nodes, [list(range(8))], [0.] * 8, [0.] * 8, [1.] * 8, list(range(8)), 'nodal',
+                         0.5, field='test', cbar=[None, 5.], method='elements')
+
+    assert shape == [5, 5, 5]
+
+    with open(filename, 'rb') as f:
+        content = f.read()
+
+    assert b'Origin="0.0 0.0 1.0"' in content and b'Name="test"' in content
+    data = np.frombuffer(content.split(b'encoding="raw">\n_', 1)[1][8:8 + 8 * 125], dtype='<f8')
+    assert data.max() == 5. and data.min() == 0.
@@ -0,0 +1,92 @@
+import re
+import struct
+
+import numpy as np
+
+from compas.datastructures import Mesh
+
+from compas_fea.fea.vtu import structure_to_vtu
+from compas_fea.fea.vtu import write_vtu
+from compas_fea.structure import Structure
+
+
+def _read_vtu(filename):
+
+    # Minimal reader of the appended raw binary arrays: {name: flat array}
+
+    with open(filename, 'rb') as f:
+        content = f.read()
+
+    header, data = content.split(b'<AppendedData encoding="raw">\n_', 1)
+    dtypes = {'Float64': '<f8', 'Int64': '<i8', 'UInt8': '<u1'}
+    arrays = {}
+
+    for type, name, offset in re.findall(r'<DataArray type="(\w+)" Name="(\w+)" NumberOfComponents="\d+" format="appended" offset="(\d+)"/>',
+                                         header.decode('ascii')):
+        offset = int(offset)
+        nbytes = struct.unpack('<Q', data[offset:offset + 8])[0]
+        arrays[name] = np.frombuffer(data[offset + 8:offset + 8 + nbytes], dtype=dtypes[type])
+
+    return header.decode('ascii'), arrays
+
+
+def test_write_vtu_round_trip(tmp_path):
+
+    filename = str(tmp_path / 'grid.vtu')
+    points = np.array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.], [2., 0., 0.]])
+    connectivity = np.array([0, 1, 2, 3, 1, 4])
+    offsets = np.array([4, 6])
+    types = np.array([9, 3], dtype=np.uint8)
+
+    write_vtu(filename, points, connectivity, offsets, types,
+              point_data=[('t', 1, lambda: np.arange(5.))],
+              cell_data=[('s', 1, lambda: np.array([1.5, -2.5]))])
+
+    header, arrays = _read_vtu(filename)
+
+    assert '<Piece NumberOfPoints="5" NumberOfCells="2">' in header
+    assert np.array_equal(arrays['Points'], points.ravel())
+    assert np.array_equal(arrays['connectivity'], connectivity)
+    assert np.array_equal(arrays['offsets'], offsets)
+    assert np.array_equal(arrays['types'], types)
+    assert np.array_equal(arrays['t'], np.arange(5.))
+    assert np.array_equal(arrays['s'], [1.5, -2.5])
+
+
+def test_structure_to_vtu(tmp_path):
+
+    vertices = [[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0]]
+    faces = [[0, 1, 4, 3], [1, 2, 5, 4]]
+
+    mdl = Structure(path=str(tmp_path) + '/', name='grid')
+    mdl.add_nodes_elements_from_mesh(Mesh.from_vertices_and_faces(vertices, faces), element_type='ShellElement')
+    mdl.steps_order = ['step_load', 'step_modal']
+    mdl.results = {
+        'step_load': {
+            'nodal': {'ux': {i: float(i) for i in range(6)}, 'uy': {i: 0. for i in range(6)}, 'uz': {i: -1. for i in range(6)}},
+            'element': {'sxx': {0: {'ip1_sp1': 2., 'ip1_sp5': 4.}, 1: {'ip1_sp1': 6.}}},
+        },
+        'step_modal': {
+            'nodal': {'ux1': {i: 1. for i in range(6)}, 'ux2': {i: 2. for i in range(6)}},
+        },
+    }
+
+    files = structure_to_vtu(mdl, str(tmp_path / 'vtu'))
+
+    assert [i.split('/')[-1] for i in files] == ['grid.pvd', 'grid_step_modal.pvd']
+
+    with open(files[1]) as f:
+        modal = f.read()
+
+    assert 'file="grid_step_modal_1.vtu"' in modal and 'file="grid_step_modal_2.vtu"' in modal
+
+    _, arrays = _read_vtu(str(tmp_path / 'vtu' / 'grid_step_load.vtu'))
+
+    assert np.array_equal(arrays['ux'], np.arange(6.))
+    assert np.array_equal(arrays['u'].reshape(-1, 3)[:, 2], -np.ones(6))
+    assert np.array_equal(arrays['sxx'], [3., 6.])
+    assert np.array_equal(arrays['types'], [9, 9])
+
+    _, arrays = _read_vtu(str(tmp_path / 'vtu' / 'grid_step_modal_2.vtu'))
+
+    assert np.array_equal(arrays['ux'], 2 * np.ones(6))